@@ -0,0 +1,34 @@
+"""Unbuffered file writes shared by the fold and server code.
+
+Output files are written from pre-encoded ``bytes`` with raw
+``os.open`` + ``os.write`` calls, skipping the buffered text-IO layer
+that ``Path.write_text`` adds.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Upper bound on a single os.write() call
+WRITE_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """``os.write`` every byte of ``data`` to ``fd``.
+
+    Large payloads go out in ``WRITE_CHUNK_BYTES`` slices; short writes
+    are retried from where they stopped.
+    """
+    buf = memoryview(data)
+    while buf:
+        buf = buf[os.write(fd, buf[:WRITE_CHUNK_BYTES]):]
+
+
+def write_bytes(path: Path | str, data: bytes) -> None:
+    """Create or truncate ``path`` and write ``data`` to it."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        write_all(fd, data)
+    finally:
+        os.close(fd)
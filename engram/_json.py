@@ -0,0 +1,41 @@
+"""JSON helpers with an optional ``orjson`` fast path.
+
+``orjson`` is an optional dependency (``pip install engram[fast]``).
+When it is missing the stdlib :mod:`json` module is used instead; both
+paths produce standard JSON and accept ``bytes`` or ``str`` input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with a two-space indent.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON from ``bytes`` or ``str``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
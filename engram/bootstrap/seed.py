@@ -143,13 +143,13 @@ def _collect_repo_snapshot(source_root: Path, config: dict[str, Any]) -> str:
     if issues_dir.exists():
         issue_files = sorted(issues_dir.glob("*.json"))[:30]
         if issue_files:
-            from engram.fold.sources import render_issue_markdown
+            from engram.fold.sources import load_issue_snapshot, render_issue_markdown
             import json
 
             issue_parts: list[str] = []
             for f in issue_files:
                 try:
-                    issue = json.loads(f.read_text())
+                    issue = load_issue_snapshot(f)
                     rendered = render_issue_markdown(issue)[:3_000]
                     issue_parts.append(f"### Issue #{issue['number']}: {issue.get('title', '')}\n\n{rendered}\n")
                 except (json.JSONDecodeError, KeyError):
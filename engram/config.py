@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 
+# Merged configs kept per process, keyed by config.yaml stat
+_CONFIG_CACHE_SIZE = 32
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Default config values
 DEFAULTS: dict[str, Any] = {
     "living_docs": {
@@ -28,6 +36,7 @@ DEFAULTS: dict[str, Any] = {
         "issues": "local_data/issues/",
         "refresh_issues": True,
         "github_repo": None,
+        "git_commit_graph": False,
         "docs": ["docs/working/", "docs/archive/", "docs/specs/"],
         "sessions": {
             "format": "claude-code",
@@ -140,15 +149,33 @@ def load_config(project_root: Path | None = None) -> dict:
 
     Falls back to cwd if project_root is None. Merges with DEFAULTS
     so callers always get a full config dict.
+
+    The merged, validated config is memoized per process by the file's
+    ``(path, st_mtime_ns, st_size)``, so edits are always picked up. A
+    deep copy is returned so callers may mutate the result freely.
     """
     root = Path(project_root) if project_root else Path.cwd()
     config_path = root / ".engram" / "config.yaml"
 
-    if not config_path.exists():
-        raise ConfigError(f"Config not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except OSError:
+        raise ConfigError(f"Config not found: {config_path}") from None
+
+    return copy.deepcopy(
+        _load_merged_config(str(config_path), st.st_mtime_ns, st.st_size)
+    )
+
+
+def clear_config_cache() -> None:
+    """Drop every memoized :func:`load_config` result."""
+    _load_merged_config.cache_clear()
+
 
+@lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_merged_config(config_path: str, mtime_ns: int, size: int) -> dict:
     with open(config_path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YAML_LOADER)
 
     if not isinstance(raw, dict):
         raise ConfigError(f"Config must be a YAML mapping, got {type(raw).__name__}")
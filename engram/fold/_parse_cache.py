@@ -0,0 +1,50 @@
+"""JSONL line helpers shared by the session adapters and the dispatcher.
+
+JSONL history is not cached: the session pollers track byte offsets and
+only decode what was appended.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, BinaryIO, Iterator
+
+from engram import _json
+
+
+def decode_jsonl_lines(lines: Iterator[bytes]) -> Iterator[Any]:
+    """Decode raw JSONL lines, silently skipping malformed ones."""
+    for line in lines:
+        try:
+            yield _json.loads(line)
+        except _json.JSONDecodeError:
+            continue
+
+
+def iter_jsonl_lines(
+    fh: BinaryIO,
+    start_offset: int,
+    end_offset: int,
+) -> Iterator[bytes]:
+    """Yield raw JSONL lines from ``fh`` between two byte offsets.
+
+    Newlines are located with ``bytes.find`` (memchr) over a single
+    ``read()`` buffer instead of per-line ``readline`` calls. Files are
+    never memory-mapped: history logs are rewritten by other programs,
+    and touching pages of a file truncated mid-scan raises SIGBUS. A
+    trailing line without a newline is yielded as-is.
+    """
+    end_offset = min(end_offset, os.fstat(fh.fileno()).st_size)
+    if end_offset <= start_offset:
+        return
+
+    fh.seek(start_offset)
+    buf = fh.read(end_offset - start_offset)
+    pos, end = 0, len(buf)
+    find = buf.find
+    while (nl := find(b"\n", pos, end)) != -1:
+        if nl > pos:
+            yield buf[pos:nl]
+        pos = nl + 1
+    if pos < end:
+        yield buf[pos:end]
@@ -403,14 +403,16 @@ def _file_exists_at_commit(
     matching to tolerate historical path casing drift (e.g., ``Docs/`` vs
     ``docs/`` in older commits).
     """
+    lookup = _tracked_paths_lookup_at_commit(str(project_root), ref_commit)
+    return _tracked_path_key(path) in lookup
+
+
+def _tracked_path_key(path: str) -> str:
+    """Normalize a referenced path to a ``_tracked_paths_lookup_at_commit`` key."""
     raw = path.strip().replace("\\", "/")
-    if not raw:
-        return False
     if raw.startswith("./"):
         raw = raw[2:]
-    raw = raw.rstrip("/")
-    lookup = _tracked_paths_lookup_at_commit(str(project_root), ref_commit)
-    return raw.lower() in lookup
+    return raw.rstrip("/").lower()
 
 
 @lru_cache(maxsize=16)
@@ -496,8 +498,9 @@ def _find_orphaned_concepts(
 
     When *ref_commit* is None (steady-state), uses ``os.path.exists()``
     against the current filesystem.  When set (fold-forward), uses
-    ``_file_exists_at_commit()`` so only files missing at the reference
-    commit are flagged.
+    the commit's tracked-path snapshot (see ``_file_exists_at_commit()``),
+    resolved once up front, so only files missing at the reference commit
+    are flagged.
     """
     if not concepts_path.exists():
         return []
@@ -507,6 +510,11 @@ def _find_orphaned_concepts(
         if ref_commit
         else None
     )
+    tracked = (
+        _tracked_paths_lookup_at_commit(str(project_root), ref_commit)
+        if ref_commit
+        else None
+    )
     orphans: list[dict] = []
     for sec in sections:
         # ACTIVE is not in parse.STATUS_RE, so sec["status"] is None for
@@ -523,10 +531,9 @@ def _find_orphaned_concepts(
         if not code_paths:
             continue
 
-        if ref_commit:
+        if tracked is not None:
             all_missing = all(
-                not _file_exists_at_commit(project_root, ref_commit, p)
-                for p in code_paths
+                _tracked_path_key(p) not in tracked for p in code_paths
             )
         else:
             all_missing = all(
@@ -887,8 +894,8 @@ def _read_queue_entry_text(project_root: Path, item: dict[str, Any]) -> str:
 
     try:
         if item_type == "issue":
-            from engram.fold.sources import render_issue_markdown
-            issue_data = json.loads(item_path.read_text())
+            from engram.fold.sources import load_issue_snapshot, render_issue_markdown
+            issue_data = load_issue_snapshot(item_path)
             rendered = render_issue_markdown(issue_data)
             issue_title = issue_data.get("title") or item.get("issue_title")
             if isinstance(issue_title, str) and issue_title.strip():
@@ -1400,8 +1407,8 @@ def _render_item_content(item: dict[str, Any], project_root: Path) -> str:
 
     try:
         if item["type"] == "issue":
-            from engram.fold.sources import render_issue_markdown
-            issue_data = json.loads(item_path.read_text())
+            from engram.fold.sources import load_issue_snapshot, render_issue_markdown
+            issue_data = load_issue_snapshot(item_path)
             content = render_issue_markdown(issue_data)
         else:
             content = item_path.read_text(errors="ignore")
@@ -0,0 +1,113 @@
+"""Git acceleration helpers for doc history queries.
+
+Keeps the repository's commit-graph (with changed-path Bloom filters)
+reasonably fresh so the per-path ``git log -- <path>`` calls issued by
+:mod:`engram.fold.sources` can skip commits that never touched the path.
+Opt-in via ``sources.git_commit_graph``: the write runs synchronously.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Rewrite the commit-graph at most once per day by default
+COMMIT_GRAPH_MAX_AGE_SECONDS = 86_400
+
+# Give up on the write rather than stall a fold on a very large repo
+COMMIT_GRAPH_TIMEOUT_SECONDS = 30
+
+# Commit-graph file signature and the changed-path Bloom data chunk ID
+_GRAPH_SIGNATURE = b"CGPH"
+_BLOOM_DATA_CHUNK = b"BDAT"
+
+
+def ensure_commit_graph(
+    repo_root: Path,
+    max_age: float = COMMIT_GRAPH_MAX_AGE_SECONDS,
+    timeout: float = COMMIT_GRAPH_TIMEOUT_SECONDS,
+) -> bool:
+    """Write a commit-graph with changed-path Bloom filters if stale.
+
+    A graph counts as fresh only if it is younger than *max_age* and
+    every layer carries changed-path Bloom filters. Only plain ``.git``
+    directories are handled; worktrees, submodules and
+    non-git directories are skipped. Failures are swallowed — the graph
+    is purely an accelerator and git falls back to a full walk without it.
+
+    Args:
+        repo_root: Repository root containing ``.git``.
+        max_age: Seconds before an existing commit-graph is rewritten.
+        timeout: Seconds to wait for ``git commit-graph write`` before
+            skipping it for this run.
+
+    Returns:
+        True if ``git commit-graph write`` ran successfully.
+    """
+    git_dir = repo_root / ".git"
+    if not git_dir.is_dir():
+        return False
+
+    info_dir = git_dir / "objects" / "info"
+    single = info_dir / "commit-graph"
+    chain = info_dir / "commit-graphs" / "commit-graph-chain"
+    for marker, layers in ((single, [single]), (chain, _chain_layers(chain))):
+        try:
+            fresh = time.time() - marker.stat().st_mtime < max_age
+        except OSError:
+            continue
+        # gc/maintenance write graphs without Bloom filters; only a graph
+        # that carries them in every layer counts as up to date
+        if fresh and layers and all(_has_bloom_filters(layer) for layer in layers):
+            return False
+
+    try:
+        result = subprocess.run(
+            ["git", "commit-graph", "write", "--reachable", "--changed-paths"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=repo_root,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        logger.info("Skipped commit-graph write: timed out after %ss", timeout)
+        return False
+    except FileNotFoundError:
+        logger.info("Skipped commit-graph write: git not found")
+        return False
+    if result.returncode != 0:
+        logger.info("Skipped commit-graph write: git exited %d", result.returncode)
+        return False
+    return True
+
+
+def _chain_layers(chain: Path) -> list[Path]:
+    """Graph files listed by a split commit-graph chain, oldest first."""
+    try:
+        hashes = chain.read_text().split()
+    except OSError:
+        return []
+    return [chain.parent / f"graph-{h}.graph" for h in hashes]
+
+
+def _has_bloom_filters(graph: Path) -> bool:
+    """Return True if the commit-graph file at *graph* has a Bloom data chunk.
+
+    Only the header and chunk lookup table are read: 8 header bytes
+    (the chunk count is byte 6) followed by 12-byte (ID, offset) entries.
+    """
+    try:
+        with open(graph, "rb") as fh:
+            header = fh.read(8)
+            if len(header) < 8 or header[:4] != _GRAPH_SIGNATURE:
+                return False
+            table = fh.read(12 * (header[6] + 1))
+    except OSError:
+        return False
+    return any(
+        table[i:i + 4] == _BLOOM_DATA_CHUNK for i in range(0, len(table), 12)
+    )
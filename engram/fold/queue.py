@@ -9,28 +9,46 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+from engram import _json
+from engram._io import write_bytes
+from engram.fold.git_cache import ensure_commit_graph
 from engram.fold.sessions import get_adapter
 from engram.fold.sources import (
     extract_issue_number,
+    frontmatter_date_from_text,
     get_doc_git_dates,
+    changed_paths_since,
+    get_doc_git_dates_batch,
+    head_commit,
     infer_github_repo,
     list_tracked_markdown_docs,
+    load_issue_snapshot,
     parse_date,
-    parse_frontmatter_date,
     pull_issues,
     render_issue_markdown,
+    scan_dir_files,
 )
 
 # Dual-pass threshold: if modified > created + this many days, create revisit entry
 REVISIT_THRESHOLD_DAYS = 7
 
+# Accepted shape for the ``start_date`` cutoff
+_START_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Per-doc git dates keyed by HEAD blob OID, persisted between queue builds
+DOC_DATES_CACHE_NAME = "doc_dates.cache.json"
+
 
 def refresh_issue_snapshots(config: dict[str, Any], project_root: Path) -> tuple[bool, str]:
     """Refresh ``sources.issues`` JSON snapshots from GitHub.
@@ -53,7 +71,10 @@ def refresh_issue_snapshots(config: dict[str, Any], project_root: Path) -> tuple
     try:
         issues = pull_issues(repo, issues_dir)
     except subprocess.CalledProcessError as exc:
-        stderr = (exc.stderr or "").strip()
+        stderr = exc.stderr or ""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", "replace")
+        stderr = stderr.strip()
         detail = f": {stderr}" if stderr else ""
         return False, f"gh issue list failed for {repo}{detail}"
     except FileNotFoundError:
@@ -70,6 +91,9 @@ def build_queue(
 ) -> list[dict[str, Any]]:
     """Build the chronological queue of all artifacts.
 
+    Docs, issues and sessions are collected on a small thread pool; set
+    ``ENGRAM_SEQUENTIAL=1`` to run the collectors serially for debugging.
+
     Args:
         config: Loaded engram config dict.
         project_root: Absolute path to the project root.
@@ -77,11 +101,20 @@ def build_queue(
             Defaults to project_root / ".engram".
         start_date: Optional YYYY-MM-DD string. When set, only entries
             with ``date[:10] >= start_date`` are included in the queue
-            and output files. Validated via ``date.fromisoformat()``.
+            and output files. Must be exactly ``YYYY-MM-DD`` and a real
+            calendar date.
 
     Returns:
         List of queue entry dicts, sorted by date.
+
+    Raises:
+        ValueError: If ``start_date`` is not a valid YYYY-MM-DD date.
     """
+    if start_date:
+        if _START_DATE_RE.fullmatch(start_date) is None:
+            raise ValueError(f"start_date must be YYYY-MM-DD, got {start_date!r}")
+        date.fromisoformat(start_date)  # Rejects impossible dates like 2026-02-30
+
     if output_dir is None:
         output_dir = project_root / ".engram"
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -91,56 +124,178 @@ def build_queue(
     doc_dirs = [project_root / d for d in sources.get("docs", [])]
     session_cfg = sources.get("sessions", {})
 
+    # Opt-in: refresh the commit-graph so per-path git log calls hit Bloom filters
+    if sources.get("git_commit_graph", False):
+        ensure_commit_graph(project_root)
+
     # Optional project_start for frontmatter date filtering
     project_start = config.get("project_start")
 
-    # Load issue dates for cross-referencing doc dates
+    # Parse issue snapshots once; docs cross-reference their dates
+    issues = _load_issue_snapshots(issues_dir)
     issue_dates: dict[int, str] = {}
-    if issues_dir.exists():
-        for f in sorted(issues_dir.glob("*.json")):
-            try:
-                issue = json.loads(f.read_text())
-                issue_dates[issue["number"]] = issue["createdAt"]
-            except (json.JSONDecodeError, KeyError) as exc:
-                logger.warning("Skipping issue date from %s: %s", f.name, exc)
+    for f, issue in issues:
+        try:
+            issue_dates[issue["number"]] = issue["createdAt"]
+        except KeyError as exc:
+            logger.warning("Skipping issue date from %s: %s", f.name, exc)
 
+    sessions_dir = output_dir / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+
+    doc_dates_file = output_dir / DOC_DATES_CACHE_NAME
+    doc_dates_cache = _load_doc_dates_cache(doc_dates_file)
+
+    # Docs, issues and sessions are independent; scan them concurrently
+    # (git subprocesses and file reads release the GIL).
+    collectors = [
+        partial(
+            _collect_docs, project_root, doc_dirs, issue_dates, project_start,
+            doc_dates_cache,
+        ),
+        partial(_collect_issues, project_root, issues),
+        partial(
+            _collect_sessions, project_root, session_cfg, sessions_dir,
+            _start_date_to_ms(start_date),
+        ),
+    ]
+    if os.environ.get("ENGRAM_SEQUENTIAL") == "1":
+        results = [collect() for collect in collectors]
+    else:
+        with ThreadPoolExecutor(max_workers=len(collectors)) as pool:
+            futures = [pool.submit(collect) for collect in collectors]
+            results = [future.result() for future in futures]
+
+    # Merge in a fixed order so output is deterministic
+    entries: list[dict[str, Any]] = []
+    sizes: dict[str, int] = {}
+    pending_sessions: list[tuple[dict[str, Any], str, str]] = []
+    for collected_entries, collected_sizes, collected_sessions in results:
+        entries.extend(collected_entries)
+        sizes.update(collected_sizes)
+        pending_sessions.extend(collected_sessions)
+
+    # Sort by date. Every emitter produces ISO-8601 strings that start with
+    # YYYY-MM-DD, so ordering compares the raw strings without parsing.
+    entries.sort(key=itemgetter("date"))
+
+    # Filter by start_date if provided (ISO dates compare lexicographically)
+    if start_date:
+        entries = [e for e in entries if e["date"][:10] >= start_date]
+
+    # Write only surviving session files
+    surviving_paths = {e["path"] for e in entries if e["type"] == "prompts"}
+    _materialize_sessions(
+        [
+            (session_id, rendered)
+            for entry, session_id, rendered in pending_sessions
+            if entry["path"] in surviving_paths
+        ],
+        sessions_dir,
+    )
+
+    # Write queue JSONL
+    queue_file = output_dir / "queue.jsonl"
+    write_bytes(queue_file, b"".join([_json.dumps(entry) + b"\n" for entry in entries]))
+
+    # Write sizes
+    sizes_file = output_dir / "item_sizes.json"
+    write_bytes(sizes_file, _json.dumps(sizes, indent=True))
+
+    _save_doc_dates_cache(doc_dates_file, doc_dates_cache)
+
+    return entries
+
+
+_Collected = tuple[
+    list[dict[str, Any]],
+    dict[str, int],
+    list[tuple[dict[str, Any], str, str]],
+]
+
+
+def _collect_docs(
+    project_root: Path,
+    doc_dirs: list[Path],
+    issue_dates: dict[int, str],
+    project_start: str | None,
+    doc_dates_cache: dict[str, Any],
+) -> _Collected:
+    """Build initial/revisit queue entries for markdown docs.
+
+    ``doc_dates_cache`` is replaced in place with the git dates of every
+    tracked doc at the current HEAD, so the caller can persist it once
+    the build finishes.
+    """
     entries: list[dict[str, Any]] = []
     sizes: dict[str, int] = {}
 
-    # --- Process docs ---
     tracked_doc_paths = list_tracked_markdown_docs(project_root, doc_dirs)
+    head = head_commit(project_root) if tracked_doc_paths else None
+    doc_dates: dict[str, dict[str, Any]] = {}
+    if head is not None:
+        doc_dates = _reusable_doc_dates(doc_dates_cache, head, project_root, doc_dirs)
+    # Untracked fallback keeps the scandir entries so mtimes reuse their stat
+    untracked_entries: dict[Path, os.DirEntry[str]] = {}
     if tracked_doc_paths:
         doc_paths = tracked_doc_paths
     else:
         doc_paths = []
         for doc_dir in doc_dirs:
-            if not doc_dir.exists():
-                continue
-            doc_paths.extend(sorted(doc_dir.glob("*.md")))
+            for dir_entry in scan_dir_files(doc_dir, ".md"):
+                doc_path = Path(dir_entry.path)
+                untracked_entries[doc_path] = dir_entry
+                doc_paths.append(doc_path)
+
+    # Resolve git dates for every tracked doc the cache misses in one
+    # batched history walk, rather than two git processes per doc
+    doc_dates_cache.clear()
+    if head is not None:
+        rel_paths = {str(doc_path.relative_to(project_root)): doc_path for doc_path in doc_paths}
+        stale_docs = [doc_path for rel, doc_path in rel_paths.items() if rel not in doc_dates]
+        if stale_docs:
+            for doc_path, (created, modified) in get_doc_git_dates_batch(
+                stale_docs, project_root,
+            ).items():
+                doc_dates[str(doc_path.relative_to(project_root))] = {
+                    "created": created, "modified": modified,
+                }
+        # Forget docs that are no longer tracked
+        doc_dates = {rel: doc_dates[rel] for rel in rel_paths}
+        doc_dates_cache.update(head=head, docs=doc_dates)
 
     for doc_path in doc_paths:
-        char_count = len(doc_path.read_text(errors="ignore"))
+        # Read once: the same text yields the size and the frontmatter date
+        content = doc_path.read_text(errors="ignore")
+        char_count = len(content)
         rel_path = str(doc_path.relative_to(project_root))
         sizes[rel_path] = char_count
 
         # Resolve created date (priority: frontmatter > issue > git > mtime)
-        created = parse_frontmatter_date(doc_path, project_start)
+        created = frontmatter_date_from_text(content, project_start)
 
         if not created:
             issue_num = extract_issue_number(doc_path)
             if issue_num and issue_num in issue_dates:
                 created = issue_dates[issue_num]
 
+        dates = doc_dates.get(rel_path)
+        if dates is not None:
+            git_created, git_modified = dates.get("created"), dates.get("modified")
+        else:
+            git_created, git_modified = get_doc_git_dates(doc_path, project_root)
         if not created:
-            git_created, _ = get_doc_git_dates(doc_path, project_root)
             created = git_created
 
         if not created:
-            mtime = os.path.getmtime(doc_path)
+            dir_entry = untracked_entries.get(doc_path)
+            if dir_entry is not None:
+                mtime = dir_entry.stat().st_mtime
+            else:
+                mtime = os.path.getmtime(doc_path)
             created = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
 
         # Resolve modified date
-        _, git_modified = get_doc_git_dates(doc_path, project_root)
         modified = git_modified or created
 
         created_dt = parse_date(created)
@@ -167,29 +322,109 @@ def build_queue(
                 "first_seen_date": created,
             })
 
-    # --- Process issues ---
-    if issues_dir.exists():
-        for f in sorted(issues_dir.glob("*.json")):
-            try:
-                issue = json.loads(f.read_text())
-                rendered = render_issue_markdown(issue)
-                char_count = len(rendered)
-                rel_path = str(f.relative_to(project_root))
-                sizes[rel_path] = char_count
-
-                entries.append({
-                    "date": issue["createdAt"],
-                    "type": "issue",
-                    "path": rel_path,
-                    "chars": char_count,
-                    "pass": "initial",
-                    "issue_number": issue["number"],
-                    "issue_title": issue.get("title", ""),
-                })
-            except (json.JSONDecodeError, KeyError) as exc:
-                logger.warning("Skipping issue %s: %s", f.name, exc)
-
-    # --- Process session prompts ---
+    return entries, sizes, []
+
+
+def _reusable_doc_dates(
+    cache: dict[str, Any],
+    head: str,
+    project_root: Path,
+    doc_dirs: list[Path],
+) -> dict[str, dict[str, Any]]:
+    """Return the cached doc dates still valid at ``head``.
+
+    The cache records the HEAD it was built at. When HEAD has moved, only
+    docs touched by a commit in between are dropped; if that range can't
+    be listed (history rewritten), nothing is reused.
+    """
+    docs = cache.get("docs")
+    since = cache.get("head")
+    if not isinstance(docs, dict) or not isinstance(since, str):
+        return {}
+    if since == head:
+        return dict(docs)
+    changed = changed_paths_since(project_root, since, head, doc_dirs)
+    if changed is None:
+        return {}
+    return {rel: dates for rel, dates in docs.items() if rel not in changed}
+
+
+def _load_doc_dates_cache(path: Path) -> dict[str, Any]:
+    """Load the doc-dates cache, returning an empty dict if missing or corrupt."""
+    try:
+        cache = _json.loads(path.read_bytes())
+    except (OSError, _json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_doc_dates_cache(path: Path, cache: dict[str, Any]) -> None:
+    """Atomically replace the doc-dates cache file."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        write_bytes(tmp, _json.dumps(cache))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not write %s: %s", path.name, exc)
+
+
+def _load_issue_snapshots(issues_dir: Path) -> list[tuple[Path, dict[str, Any]]]:
+    """Parse every ``*.json`` issue snapshot, skipping unreadable ones."""
+    issues: list[tuple[Path, dict[str, Any]]] = []
+    for dir_entry in scan_dir_files(issues_dir, ".json"):
+        f = Path(dir_entry.path)
+        try:
+            issues.append((f, load_issue_snapshot(f)))
+        except json.JSONDecodeError as exc:
+            logger.warning("Skipping issue %s: %s", f.name, exc)
+    return issues
+
+
+def _collect_issues(
+    project_root: Path,
+    issues: list[tuple[Path, dict[str, Any]]],
+) -> _Collected:
+    """Build queue entries for parsed issue snapshots."""
+    entries: list[dict[str, Any]] = []
+    sizes: dict[str, int] = {}
+
+    for f, issue in issues:
+        try:
+            rendered = render_issue_markdown(issue)
+            char_count = len(rendered)
+            rel_path = str(f.relative_to(project_root))
+            sizes[rel_path] = char_count
+
+            entries.append({
+                "date": issue["createdAt"],
+                "type": "issue",
+                "path": rel_path,
+                "chars": char_count,
+                "pass": "initial",
+                "issue_number": issue["number"],
+                "issue_title": issue.get("title", ""),
+            })
+        except KeyError as exc:
+            logger.warning("Skipping issue %s: %s", f.name, exc)
+
+    return entries, sizes, []
+
+
+def _collect_sessions(
+    project_root: Path,
+    session_cfg: dict[str, Any],
+    sessions_dir: Path,
+    since_ms: int | None = None,
+) -> _Collected:
+    """Build queue entries for session prompts without writing files yet.
+
+    Sizes are recorded for every parsed session. ``since_ms`` (the
+    ``start_date`` cutoff in epoch milliseconds) only decides which
+    sessions are queued and later written to disk.
+    """
+    entries: list[dict[str, Any]] = []
+    sizes: dict[str, int] = {}
+
     fmt = session_cfg.get("format", "claude-code")
     session_path = Path(session_cfg.get("path", "~/.claude/history.jsonl")).expanduser()
     project_match = session_cfg.get("project_match", [])
@@ -197,14 +432,12 @@ def build_queue(
     adapter = get_adapter(fmt)
     session_entries = adapter.parse(session_path, project_match)
 
-    sessions_dir = output_dir / "sessions"
-    sessions_dir.mkdir(parents=True, exist_ok=True)
-
-    # Collect sessions without writing files yet
     pending_sessions: list[tuple[dict[str, Any], str, str]] = []
     for se in session_entries:
         rel_path = str((sessions_dir / f"{se.session_id}.md").relative_to(project_root))
         sizes[rel_path] = se.chars
+        if since_ms is not None and se.start_ms < since_ms:
+            continue
 
         entry: dict[str, Any] = {
             "date": se.date,
@@ -218,29 +451,29 @@ def build_queue(
         pending_sessions.append((entry, se.session_id, se.rendered))
         entries.append(entry)
 
-    # Sort by date
-    entries.sort(key=lambda e: e["date"])
+    return entries, sizes, pending_sessions
 
-    # Filter by start_date if provided
-    if start_date:
-        date.fromisoformat(start_date)  # Validates YYYY-MM-DD; raises ValueError
-        entries = [e for e in entries if e["date"][:10] >= start_date]
 
-    # Write only surviving session files
-    surviving_paths = {e["path"] for e in entries if e["type"] == "prompts"}
-    for entry, session_id, rendered in pending_sessions:
-        if entry["path"] in surviving_paths:
-            (sessions_dir / f"{session_id}.md").write_text(rendered)
+def _start_date_to_ms(start_date: str | None) -> int | None:
+    """Convert a validated ``YYYY-MM-DD`` cutoff to UTC epoch milliseconds."""
+    if not start_date:
+        return None
+    cutoff = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc)
+    return int(cutoff.timestamp()) * 1000
 
-    # Write queue JSONL
-    queue_file = output_dir / "queue.jsonl"
-    with open(queue_file, "w") as fh:
-        for entry in entries:
-            fh.write(json.dumps(entry) + "\n")
 
-    # Write sizes
-    sizes_file = output_dir / "item_sizes.json"
-    with open(sizes_file, "w") as fh:
-        json.dump(sizes, fh, indent=2)
+def _materialize_sessions(
+    sessions: list[tuple[str, str]],
+    sessions_dir: Path,
+) -> None:
+    """Write rendered session markdown as ``<session_id>.md`` files.
+
+    Each file is written with raw ``os.open`` + ``os.write`` calls,
+    skipping the buffered text-IO layer that ``Path.write_text`` adds.
+    """
+    if not sessions:
+        return
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    for session_id, rendered in sessions:
+        write_bytes(sessions_dir / f"{session_id}.md", rendered.encode("utf-8"))
 
-    return entries
@@ -7,24 +7,29 @@ Pluggable interface with built-in adapters:
 
 from __future__ import annotations
 
-import json
+import os
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from engram import _json
+from engram.fold._parse_cache import decode_jsonl_lines, iter_jsonl_lines
 
 # Minimum prompt length to include (filters slash commands and trivial inputs)
 MIN_PROMPT_CHARS = 25
-_SM_TELEMETRY_RE = re.compile(r"^\[sm[^\]]*\]", re.IGNORECASE)
-_RELAY_RE = re.compile(r"^\[input from:[^\]]+\]", re.IGNORECASE)
+# Leading "[sm ...]" telemetry tag (group 1 set) or "[Input from: ...]"
+# relay header, recognised in a single match
+_PROMPT_TAG_RE = re.compile(r"\[(?:(sm)[^\]]*|input from:[^\]]+)\]", re.IGNORECASE)
 _RELAY_MAX_CHARS = 320
 
 
 class SessionEntry:
     """A single parsed session with rendered markdown content."""
 
-    __slots__ = ("session_id", "date", "chars", "prompt_count", "rendered")
+    __slots__ = ("session_id", "date", "chars", "prompt_count", "rendered", "start_ms")
 
     def __init__(
         self,
@@ -33,12 +38,14 @@ class SessionEntry:
         chars: int,
         prompt_count: int,
         rendered: str,
+        start_ms: int = 0,
     ) -> None:
         self.session_id = session_id
         self.date = date
         self.chars = chars
         self.prompt_count = prompt_count
         self.rendered = rendered
+        self.start_ms = start_ms
 
 
 class SessionAdapter(ABC):
@@ -112,32 +119,25 @@ class ClaudeCodeAdapter(SessionAdapter):
         if start_offset < 0 or start_offset > size:
             start_offset = 0
 
-        with open(path) as fh:
-            fh.seek(start_offset)
-            for line in fh:
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                # Filter to matching projects
-                project = entry.get("project", "").lower()
-                if project_match and not any(
-                    p.lower() in project for p in project_match
-                ):
-                    continue
+        matches_project = _project_matcher(project_match)
+        records, new_offset = _read_jsonl_records(path, start_offset, size)
+        for entry in records:
+            # Filter to matching projects
+            if matches_project and not matches_project(
+                entry.get("project", "").lower()
+            ):
+                continue
 
-                prompt = entry.get("display", "")
+            prompt = entry.get("display", "")
 
-                # Skip slash commands and trivial inputs
-                if prompt.startswith("/") or len(prompt) < MIN_PROMPT_CHARS:
-                    continue
+            # Skip slash commands and trivial inputs
+            if prompt.startswith("/") or len(prompt) < MIN_PROMPT_CHARS:
+                continue
 
-                session_id = entry.get("sessionId", "unknown")
-                if session_id not in sessions:
-                    sessions[session_id] = []
-                sessions[session_id].append(entry)
-            new_offset = fh.tell()
+            session_id = entry.get("sessionId", "unknown")
+            if session_id not in sessions:
+                sessions[session_id] = []
+            sessions[session_id].append(entry)
 
         return _build_session_entries(sessions), new_offset
 
@@ -171,38 +171,31 @@ class CodexAdapter(SessionAdapter):
             start_offset = 0
 
         sessions: dict[str, list[dict[str, Any]]] = {}
-        with open(path) as fh:
-            fh.seek(start_offset)
-            for line in fh:
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                session_id = entry.get("session_id")
-                if not isinstance(session_id, str) or not session_id:
-                    continue
+        records, new_offset = _read_jsonl_records(path, start_offset, size)
+        for entry in records:
+            session_id = entry.get("session_id")
+            if not isinstance(session_id, str) or not session_id:
+                continue
 
-                text = entry.get("text", "")
-                if not isinstance(text, str):
-                    continue
-                text = text.strip()
-                if not text:
-                    continue
-                if text.startswith("/") or len(text) < MIN_PROMPT_CHARS:
-                    continue
+            text = entry.get("text", "")
+            if not isinstance(text, str):
+                continue
+            text = text.strip()
+            if not text:
+                continue
+            if text.startswith("/") or len(text) < MIN_PROMPT_CHARS:
+                continue
 
-                timestamp_ms = _codex_ts_to_ms(entry.get("ts"))
-                if timestamp_ms is None:
-                    continue
+            timestamp_ms = _codex_ts_to_ms(entry.get("ts"))
+            if timestamp_ms is None:
+                continue
 
-                if session_id not in sessions:
-                    sessions[session_id] = []
-                sessions[session_id].append({
-                    "display": text,
-                    "timestamp": timestamp_ms,
-                })
-            new_offset = fh.tell()
+            if session_id not in sessions:
+                sessions[session_id] = []
+            sessions[session_id].append({
+                "display": text,
+                "timestamp": timestamp_ms,
+            })
 
         if project_match and sessions:
             codex_home = path.parent
@@ -211,14 +204,13 @@ class CodexAdapter(SessionAdapter):
                 session_ids=set(sessions.keys()),
             )
             filtered: dict[str, list[dict[str, Any]]] = {}
-            patterns = [p.lower() for p in project_match]
+            matches_project = _project_matcher(project_match)
             for session_id, prompts in sessions.items():
                 cwds = cwd_by_session.get(session_id, set())
                 if not cwds:
                     continue
-                if any(
-                    any(pattern in cwd for pattern in patterns)
-                    for cwd in cwds
+                if matches_project is None or any(
+                    matches_project(cwd) for cwd in cwds
                 ):
                     filtered[session_id] = prompts
             sessions = filtered
@@ -248,6 +240,84 @@ def get_adapter(format_name: str) -> SessionAdapter:
     return cls()
 
 
+def _project_matcher(project_match: list[str]) -> Callable[[str], bool] | None:
+    """Build a case-insensitive substring test for ``project_match``.
+
+    Patterns are lowercased once; callers pass already-lowercased
+    haystacks. A single pattern uses a plain ``in`` check, several are
+    folded into one escaped regex alternation so each haystack is
+    scanned once. Returns None when there is nothing to filter on.
+
+    Matchers are memoized per pattern list, so a poller re-parsing the
+    same history every interval compiles its matcher only once.
+    """
+    return _compile_project_matcher(tuple(project_match))
+
+
+@lru_cache(maxsize=32)
+def _compile_project_matcher(
+    project_match: tuple[str, ...],
+) -> Callable[[str], bool] | None:
+    """Memoized body of :func:`_project_matcher`."""
+    patterns = [p.lower() for p in project_match]
+    if not patterns or "" in patterns:
+        return None  # An empty pattern matches everything
+    if len(patterns) == 1:
+        needle = patterns[0]
+        return lambda haystack: needle in haystack
+    search = re.compile("|".join(map(re.escape, patterns))).search
+    return lambda haystack: search(haystack) is not None
+
+
+def _read_jsonl_records(
+    path: Path,
+    start_offset: int,
+    size: int,
+) -> tuple[list[Any], int]:
+    """Return decoded JSONL records from ``start_offset`` and the new offset.
+
+    Only ``[start_offset, end)`` is read, with a single ``os.pread``; the
+    caller's offset already avoids re-decoding consumed lines, so nothing
+    is memoized. A torn final line (a writer caught mid-append) is not
+    consumed: the returned offset stops at its start so the next poll
+    reads it whole.
+    """
+    with open(path, "rb") as fh:
+        fd = fh.fileno()
+        size = min(size, os.fstat(fd).st_size)
+        end = _consumable_end(fd, start_offset, size)
+        data = os.pread(fd, end - start_offset, start_offset)
+    return list(decode_jsonl_lines(iter(data.split(b"\n")))), end
+
+
+def _consumable_end(fd: int, start: int, size: int) -> int:
+    """Offset up to which ``[start, size)`` holds only complete JSONL lines.
+
+    A trailing line without a newline still counts as complete when it
+    decodes on its own; otherwise the offset of its first byte is
+    returned.
+    """
+    window = 4096
+    while True:
+        lo = max(start, size - window)
+        tail = os.pread(fd, size - lo, lo)
+        if not tail or tail.endswith(b"\n"):
+            return size
+        nl = tail.rfind(b"\n")
+        if nl != -1:
+            fragment_start, fragment = lo + nl + 1, tail[nl + 1:]
+            break
+        if lo == start:
+            fragment_start, fragment = start, tail
+            break
+        window *= 4
+    try:
+        _json.loads(fragment)
+    except _json.JSONDecodeError:
+        return fragment_start
+    return size
+
+
 def _render_session_markdown(prompts: list[dict[str, Any]]) -> str:
     """Render a list of prompts from one session as markdown."""
     lines = []
@@ -262,7 +332,11 @@ def _render_session_markdown(prompts: list[dict[str, Any]]) -> str:
 def _build_session_entries(
     sessions: dict[str, list[dict[str, Any]]],
 ) -> list[SessionEntry]:
-    """Build ``SessionEntry`` objects from grouped prompt dicts."""
+    """Build ``SessionEntry`` objects from grouped prompt dicts.
+
+    Each entry records its first prompt's epoch-ms timestamp as
+    ``start_ms`` so callers can apply a date cutoff as an integer compare.
+    """
     entries: list[SessionEntry] = []
     for session_id, prompts in sessions.items():
         if not prompts:
@@ -296,6 +370,7 @@ def _build_session_entries(
             chars=len(rendered),
             prompt_count=len(filtered_prompts),
             rendered=rendered,
+            start_ms=first_ts,
         ))
     return entries
 
@@ -310,9 +385,13 @@ def _normalize_prompt_text(text: str) -> str:
     normalized = " ".join(line.strip() for line in text.splitlines() if line.strip())
     if not normalized:
         return ""
-    if _SM_TELEMETRY_RE.match(normalized):
+    # Most prompts carry no tag; only bracketed ones reach the regex
+    tag = _PROMPT_TAG_RE.match(normalized) if normalized[0] == "[" else None
+    if tag is None:
+        return normalized
+    if tag.group(1):
         return ""
-    if _RELAY_RE.match(normalized) and len(normalized) > _RELAY_MAX_CHARS:
+    if len(normalized) > _RELAY_MAX_CHARS:
         clipped = normalized[: _RELAY_MAX_CHARS - 3]
         clipped = clipped.rsplit(" ", 1)[0]
         return clipped + "..."
@@ -350,13 +429,9 @@ def _load_codex_session_cwds(
 
         current_sid = sid_from_name
         try:
-            with open(session_file) as fh:
-                for line in fh:
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
+            with open(session_file, "rb") as fh:
+                file_size = os.fstat(fh.fileno()).st_size
+                for event in decode_jsonl_lines(iter_jsonl_lines(fh, 0, file_size)):
                     event_type = event.get("type")
                     payload = event.get("payload", {})
                     if not isinstance(payload, dict):
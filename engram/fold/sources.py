@@ -6,48 +6,94 @@ with all paths parameterized by config.
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
+
+from engram import _json
+from engram._io import write_bytes
+
+# Frontmatter dates are only honoured near the top of a doc
+FRONTMATTER_SCAN_CHARS = 2000
+
+_FRONTMATTER_DATE_MARKER = "**Date:**"
+_FRONTMATTER_DATE_RE = re.compile(r"\*\*Date:\*\*\s*(\d{4}-\d{2}-\d{2})")
+_ISSUE_NUM_RE = re.compile(r"^(\d+)_")
+
+# Upper bound on threads writing pulled issue snapshots
+_ISSUE_WRITE_WORKERS = 8
+
+# Paths per batched ``git log`` pathspec, to stay well under argv limits
+_GIT_PATHSPEC_CHUNK = 256
 
 
 def pull_issues(repo: str, issues_dir: Path) -> list[dict]:
-    """Pull all GitHub issues with comments into local JSON files.
+    """Pull GitHub issues with comments into local JSON files.
+
+    When snapshots already exist, only issues updated since the newest
+    snapshot's ``updatedAt`` are fetched and merged over the old files;
+    otherwise every issue is pulled.
 
     Args:
         repo: GitHub repo in "owner/repo" format.
         issues_dir: Directory to write issue JSON files.
 
     Returns:
-        List of issue dicts.
+        List of issue dicts fetched by this call.
     """
     issues_dir.mkdir(parents=True, exist_ok=True)
 
-    result = subprocess.run(
-        [
-            "gh", "issue", "list",
-            "--repo", repo,
-            "--state", "all",
-            "--json", "number,title,body,createdAt,updatedAt,state,labels,comments",
-            "--limit", "5000",
-        ],
-        capture_output=True, text=True, check=True,
-    )
+    cmd = [
+        "gh", "issue", "list",
+        "--repo", repo,
+        "--state", "all",
+        "--json", "number,title,body,createdAt,updatedAt,state,labels,comments",
+        "--limit", "5000",
+    ]
+    last_sync = _last_issue_sync(issues_dir)
+    if last_sync:
+        cmd += ["--search", f"updated:>={last_sync}"]
+
+    result = subprocess.run(cmd, capture_output=True, check=True)
 
-    issues = json.loads(result.stdout)
+    # Parse gh's raw bytes directly; no intermediate str decode
+    issues = _json.loads(result.stdout)
 
-    for issue in issues:
-        num = issue["number"]
-        path = issues_dir / f"{num}.json"
-        path.write_text(json.dumps(issue, indent=2))
+    # Snapshots are independent files and os.write releases the GIL
+    if len(issues) > 1:
+        workers = min(_ISSUE_WRITE_WORKERS, len(issues))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(partial(_write_issue_snapshot, issues_dir), issues))
+    else:
+        for issue in issues:
+            _write_issue_snapshot(issues_dir, issue)
 
     return issues
 
 
+def _write_issue_snapshot(issues_dir: Path, issue: dict) -> None:
+    """Replace ``<number>.json`` with the issue's pretty-printed JSON."""
+    write_bytes(issues_dir / f"{issue['number']}.json", _json.dumps(issue, indent=True))
+
+
+def _last_issue_sync(issues_dir: Path) -> str | None:
+    """Return the newest ``updatedAt`` across issue snapshots, if any."""
+    last_sync: str | None = None
+    for dir_entry in scan_dir_files(issues_dir, ".json"):
+        try:
+            updated = _json.loads(Path(dir_entry.path).read_bytes()).get("updatedAt")
+        except (OSError, _json.JSONDecodeError, AttributeError):
+            continue
+        if isinstance(updated, str) and (last_sync is None or updated > last_sync):
+            last_sync = updated
+    return last_sync
+
+
 def infer_github_repo(project_root: Path) -> str | None:
     """Infer ``owner/repo`` from git remote.origin.url, if possible."""
     result = subprocess.run(
@@ -74,35 +120,149 @@ def list_tracked_markdown_docs(
 
     Returns an empty list when git metadata is unavailable.
     """
+    rel_dirs = _relative_doc_dirs(project_root, doc_dirs)
+    if not rel_dirs:
+        return []
+
+    # ls-files only reads the index, so its stat is a sound cache key
+    try:
+        index_st = (project_root / ".git" / "index").stat()
+    except OSError:
+        stdout = _git_ls_files(project_root, rel_dirs)
+    else:
+        stdout = _git_ls_files_cached(
+            project_root, rel_dirs, (index_st.st_mtime_ns, index_st.st_size),
+        )
+    if stdout is None:
+        return []
+
+    tracked: list[Path] = []
+    for raw_path in stdout.split(b"\0"):
+        rel_path = raw_path.strip()
+        if not rel_path.endswith(b".md"):
+            continue
+        abs_path = project_root / os.fsdecode(rel_path)
+        if abs_path.exists():
+            tracked.append(abs_path)
+
+    return sorted(set(tracked))
+
+
+def head_commit(project_root: Path) -> str | None:
+    """Return the HEAD commit SHA, or None when git or HEAD is unavailable."""
+    result = subprocess.run(
+        ["git", "rev-parse", "-q", "--verify", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=project_root,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().decode("ascii", "replace") or None
+
+
+def changed_paths_since(
+    project_root: Path,
+    since: str,
+    head: str,
+    doc_dirs: Iterable[Path],
+) -> set[str] | None:
+    """Return paths under ``doc_dirs`` touched by any commit in ``since..head``.
+
+    Every commit in the range is listed, so a doc edited and then
+    reverted (A→B→A) still counts as changed. Paths are relative to
+    ``project_root``. Returns None when ``since`` is not an ancestor of
+    ``head`` (history rewritten, or ``since`` gone), since commits may then
+    have left history rather than joined it.
+    """
+    result = subprocess.run(
+        ["git", "merge-base", "--is-ancestor", since, head],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=project_root,
+    )
+    if result.returncode != 0:
+        return None
+
+    changed: set[str] = set()
+    rel_dirs = list(_relative_doc_dirs(project_root, doc_dirs)) or ["."]
+    for _date, fields in _git_log_z(project_root, ["--name-only", f"{since}..{head}"], rel_dirs):
+        changed.update(fields)
+    return changed
+
+
+def _relative_doc_dirs(project_root: Path, doc_dirs: Iterable[Path]) -> tuple[str, ...]:
+    """Doc dirs as project-relative strings, dropping any outside the root."""
     rel_dirs: list[str] = []
     for doc_dir in doc_dirs:
         try:
             rel_dirs.append(str(doc_dir.relative_to(project_root)))
         except ValueError:
             continue
+    return tuple(rel_dirs)
 
-    if not rel_dirs:
-        return []
 
+def _git_ls_files(project_root: Path, rel_dirs: tuple[str, ...]) -> bytes | None:
+    """Run ``git ls-files -z`` and return raw stdout, or None on failure."""
+    # -z keeps paths unquoted and NUL-separated; parse the bytes directly
     result = subprocess.run(
-        ["git", "ls-files", "--", *rel_dirs],
-        capture_output=True,
-        text=True,
+        ["git", "ls-files", "-z", "--", *rel_dirs],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         cwd=project_root,
     )
     if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+@lru_cache(maxsize=64)
+def _git_ls_files_cached(
+    project_root: Path,
+    rel_dirs: tuple[str, ...],
+    index_key: tuple[int, int],
+) -> bytes | None:
+    """Memoized :func:`_git_ls_files`.
+
+    ``index_key`` is the git index's (mtime_ns, size); any staging or
+    commit rewrites the index and so invalidates the entry.
+    """
+    return _git_ls_files(project_root, rel_dirs)
+
+
+def scan_dir_files(directory: Path, suffix: str) -> list[os.DirEntry[str]]:
+    """List regular files directly under ``directory`` ending in ``suffix``.
+
+    Uses ``os.scandir`` so the file-type check comes from the directory
+    entry itself, and ``DirEntry.stat()`` results are cached for callers
+    that need mtimes. Returns an empty list if the directory is missing.
+
+    Returns:
+        Directory entries sorted by name.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(suffix) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
+    entries.sort(key=lambda entry: entry.name)
+    return entries
 
-    tracked: list[Path] = []
-    for line in result.stdout.splitlines():
-        rel_path = line.strip()
-        if not rel_path.endswith(".md"):
-            continue
-        abs_path = project_root / rel_path
-        if abs_path.exists():
-            tracked.append(abs_path)
 
-    return sorted(set(tracked))
+def load_issue_snapshot(path: Path) -> dict:
+    """Parse an issue snapshot straight from its bytes.
+
+    Skips the ``str`` decode that ``read_text`` would add; orjson (when
+    installed) parses the UTF-8 buffer directly.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the snapshot is not valid JSON.
+    """
+    return _json.loads(path.read_bytes())
 
 
 def render_issue_markdown(issue: dict) -> str:
@@ -159,24 +319,129 @@ def get_doc_git_dates(
             "--diff-filter=A", "--reverse", "--format=%aI",
             "--", str(rel_path),
         ],
-        capture_output=True, text=True, cwd=project_root,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=project_root,
+    )
+    created = next(
+        (
+            line.decode("ascii", "replace")
+            for line in result.stdout.split(b"\n")
+            if line[:1].isdigit()
+        ),
+        None,
     )
-    dates = [
-        line for line in result.stdout.strip().split("\n")
-        if line and line[0].isdigit()
-    ]
-    created = dates[0] if dates else None
 
     # Last commit on current path
     result = subprocess.run(
         ["git", "log", "-1", "--format=%aI", "--", str(rel_path)],
-        capture_output=True, text=True, cwd=project_root,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=project_root,
     )
-    modified = result.stdout.strip() if result.stdout.strip() else None
+    last = result.stdout.strip()
+    modified = last.decode("ascii", "replace") if last else None
 
     return created, modified
 
 
+def get_doc_git_dates_batch(
+    doc_paths: Iterable[Path], project_root: Path,
+) -> dict[Path, tuple[str | None, str | None]]:
+    """Get first-commit and last-commit dates for many docs at once.
+
+    Same contract as :func:`get_doc_git_dates`, but history is walked by
+    one whole-tree ``git log`` for adds and renames plus one per
+    ``_GIT_PATHSPEC_CHUNK`` paths for last commits, rather than two
+    processes per doc. ``--follow`` only works on a
+    single path, so docs that arrived by rename fall back to the per-doc
+    query.
+
+    Returns:
+        Mapping of each doc path to (created_date, modified_date).
+    """
+    by_rel: dict[str, Path] = {}
+    for doc_path in doc_paths:
+        by_rel[doc_path.relative_to(project_root).as_posix()] = doc_path
+    if not by_rel:
+        return {}
+
+    # Adds and renames across the whole project tree, in one walk. A
+    # subset of directories would miss the source side of a cross-directory
+    # move (reporting the move as an add), so the answer would depend on
+    # which other docs happen to share the batch.
+    created: dict[str, str] = {}
+    renamed: set[str] = set()
+    for date, fields in _git_log_z(
+        project_root,
+        ["--all", "--find-renames", "--diff-filter=AR", "--name-status"],
+        ["."],
+    ):
+        # fields: "A", path, ... or "R<score>", old, new, ...
+        idx = 0
+        while idx < len(fields):
+            status = fields[idx]
+            if status.startswith("R"):
+                if fields[idx + 2] in by_rel:
+                    renamed.add(fields[idx + 2])
+                idx += 3
+            else:
+                # Newest first, so the oldest add is written last
+                if fields[idx + 1] in by_rel:
+                    created[fields[idx + 1]] = date
+                idx += 2
+
+    # Last commit on each current path; the newest is seen first
+    modified: dict[str, str] = {}
+    rel_paths = list(by_rel)
+    for start in range(0, len(rel_paths), _GIT_PATHSPEC_CHUNK):
+        for date, fields in _git_log_z(
+            project_root, ["--name-only"], rel_paths[start:start + _GIT_PATHSPEC_CHUNK],
+        ):
+            for rel in fields:
+                modified.setdefault(rel, date)
+
+    dates: dict[Path, tuple[str | None, str | None]] = {}
+    for rel, doc_path in by_rel.items():
+        if rel in renamed:
+            dates[doc_path] = get_doc_git_dates(doc_path, project_root)
+        else:
+            dates[doc_path] = (created.get(rel), modified.get(rel))
+    return dates
+
+
+def _git_log_z(
+    project_root: Path, extra_args: list[str], pathspecs: list[str],
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield ``(author_date, fields)`` per commit from a ``-z`` ``git log``.
+
+    ``fields`` are the NUL-separated ``--name-only``/``--name-status``
+    tokens of the commit, paths relative to ``project_root``. Commits come
+    newest first; nothing is yielded if git fails.
+    """
+    result = subprocess.run(
+        [
+            "git", "log", *extra_args, "--relative", "-z",
+            "--format=%x01%aI", "--", *pathspecs,
+        ],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=project_root,
+    )
+    if result.returncode != 0:
+        return
+    # "\x01<date>\0\n<field>\0<field>\0\x01<date>\0..."
+    date: str | None = None
+    fields: list[str] = []
+    for token in result.stdout.split(b"\0"):
+        if token.startswith(b"\x01"):
+            if date is not None:
+                yield date, fields
+            date = token[1:].decode("ascii", "replace")
+            fields = []
+            continue
+        if token.startswith(b"\n"):
+            token = token[1:]
+        if token:
+            fields.append(os.fsdecode(token))
+    if date is not None:
+        yield date, fields
+
+
 def parse_frontmatter_date(
     doc_path: Path, project_start: str | None = None
 ) -> str | None:
@@ -191,26 +456,73 @@ def parse_frontmatter_date(
         ISO datetime string with timezone offset, or None.
     """
     try:
-        content = doc_path.read_text(errors="ignore")[:2000]
-        match = re.search(r'\*\*Date:\*\*\s*(\d{4}-\d{2}-\d{2})', content)
-        if match:
-            date_str = match.group(1)
-            if project_start and date_str < project_start:
+        with open(doc_path, errors="ignore") as fh:
+            content = fh.read(FRONTMATTER_SCAN_CHARS)
+    except Exception:
+        return None
+    return frontmatter_date_from_text(content, project_start)
+
+
+def frontmatter_date_from_text(
+    content: str, project_start: str | None = None
+) -> str | None:
+    """Extract a **Date:** frontmatter date from already-read doc text.
+
+    Only the first ``FRONTMATTER_SCAN_CHARS`` characters are searched.
+    Same contract as :func:`parse_frontmatter_date`, for callers that
+    already hold the document contents.
+    """
+    try:
+        # Common case: a plain substring find and a fixed-width slice check;
+        # the regex only runs when the first marker isn't followed by a date
+        start = content.find(_FRONTMATTER_DATE_MARKER, 0, FRONTMATTER_SCAN_CHARS)
+        if start < 0:
+            return None
+        date_str = _date_after_marker(content, start + len(_FRONTMATTER_DATE_MARKER))
+        if date_str is None:
+            match = _FRONTMATTER_DATE_RE.search(content, start, FRONTMATTER_SCAN_CHARS)
+            if not match:
                 return None
-            return date_str + "T00:00:00+00:00"
+            date_str = match.group(1)
+        if project_start and date_str < project_start:
+            return None
+        return date_str + "T00:00:00+00:00"
     except Exception:
         pass
     return None
 
 
+def _date_after_marker(content: str, pos: int) -> str | None:
+    """Return the ``YYYY-MM-DD`` after blanks at *pos*, inside the scan window."""
+    end = min(len(content), FRONTMATTER_SCAN_CHARS)
+    while pos < end and content[pos] in " \t":
+        pos += 1
+    if pos + 10 > end:
+        return None
+    date_str = content[pos:pos + 10]
+    if (
+        date_str[4] == "-" and date_str[7] == "-"
+        and date_str[:4].isdecimal()
+        and date_str[5:7].isdecimal()
+        and date_str[8:].isdecimal()
+    ):
+        return date_str
+    return None
+
+
 def extract_issue_number(doc_path: Path) -> int | None:
     """Extract issue number from filename like 1343_backtest_analysis.md."""
-    match = re.match(r'^(\d+)_', doc_path.name)
+    match = _ISSUE_NUM_RE.match(doc_path.name)
     return int(match.group(1)) if match else None
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> datetime:
-    """Parse ISO date string to datetime."""
+    """Parse ISO date string to datetime.
+
+    Memoized: the same git and frontmatter dates recur across many docs,
+    and the returned datetimes are immutable.
+    """
     date_str = date_str.replace("Z", "+00:00")
     try:
         return datetime.fromisoformat(date_str)
@@ -245,25 +557,27 @@ def git_diff_summary(
         "--format=", "--",
     ] + source_dirs
 
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, cwd=project_root,
-    )
+    # Raw bytes: only the paths that make it into the summary get decoded
+    result = subprocess.run(cmd, capture_output=True, cwd=project_root)
 
     if not result.stdout.strip():
         return ""
 
     added, deleted, renamed = [], [], []
-    for line in result.stdout.strip().split("\n"):
-        if not line or line[0] not in "ADRT":
+    for line in result.stdout.splitlines():
+        status = line[:1]
+        if status not in (b"A", b"D", b"R"):
             continue
-        parts = line.split("\t")
-        status = parts[0][0]
-        if status == "A":
-            added.append(parts[1])
-        elif status == "D":
-            deleted.append(parts[1])
-        elif status == "R" and len(parts) >= 3:
-            renamed.append(f"{parts[1]} → {parts[2]}")
+        parts = line.split(b"\t")
+        if status == b"A":
+            added.append(parts[1].decode("utf-8", "replace"))
+        elif status == b"D":
+            deleted.append(parts[1].decode("utf-8", "replace"))
+        elif len(parts) >= 3:
+            renamed.append(
+                f"{parts[1].decode('utf-8', 'replace')} → "
+                f"{parts[2].decode('utf-8', 'replace')}"
+            )
 
     if not added and not deleted and not renamed:
         return ""
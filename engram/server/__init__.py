@@ -72,19 +72,33 @@ def run_server(config: dict[str, Any], project_root: Path) -> None:
     ) -> None:
         buffer.add_item(path, item_type, chars, date, metadata)
 
+    def on_changes(
+        items: list[tuple[str, str, int, str | None, str | None]],
+    ) -> None:
+        buffer.add_items(items)
+
     # --- Start watchers ---
-    file_watcher = FileWatcher(config, project_root, on_change)
+    file_watcher = FileWatcher(
+        config, project_root, on_change, batch_callback=on_changes,
+        on_drain_exit=db.close_thread,
+    )
     file_watcher.start()
 
     source_dirs = config.get("sources", {}).get("docs", [])
-    git_poller = GitPoller(project_root, on_change, source_dirs)
-    session_poller = SessionPoller(config, on_change, project_root=project_root)
+    git_poller = GitPoller(
+        project_root, on_change, source_dirs, batch_callback=on_changes,
+    )
+    session_poller = SessionPoller(
+        config, on_change, project_root=project_root, batch_callback=on_changes,
+    )
 
     # Restore polling bookmarks from DB
     state = db.get_server_state()
     if state.get("last_poll_commit"):
         git_poller.set_last_commit(state["last_poll_commit"])
-    if state.get("last_session_mtime"):
+    if state.get("last_session_mtime_ns"):
+        session_poller.set_last_mtime(state["last_session_mtime_ns"])
+    elif state.get("last_session_mtime"):
         session_poller.set_last_mtime(state["last_session_mtime"])
     if state.get("last_session_offset") is not None:
         session_poller.set_last_offset(state["last_session_offset"])
@@ -125,7 +139,7 @@ def run_server(config: dict[str, Any], project_root: Path) -> None:
             mtime = session_poller.get_last_mtime()
             if mtime is not None:
                 db.update_server_state(
-                    last_session_mtime=mtime,
+                    last_session_mtime_ns=mtime,
                     last_session_offset=session_poller.get_last_offset(),
                     last_session_tree_mtime=session_poller.get_last_tree_mtime(),
                 )
@@ -164,6 +178,8 @@ def run_server(config: dict[str, Any], project_root: Path) -> None:
 
     # --- Cleanup ---
     file_watcher.stop()
+    git_poller.close()
+    db.close()
     log.info("Engram server stopped")
 
 
@@ -180,18 +196,18 @@ def get_status(config: dict[str, Any], project_root: Path) -> dict[str, Any]:
             "error": "No database found. Run 'engram init' first.",
         }
 
-    db = ServerDB(db_path)
-    buffer = ContextBuffer(config, project_root, db)
+    with ServerDB(db_path) as db:
+        buffer = ContextBuffer(config, project_root, db)
 
-    server_state = db.get_server_state()
-    fill_info = buffer.get_fill_info()
-    last_dispatch = db.get_last_dispatch()
-    recent_dispatches = db.get_recent_dispatches(limit=5)
-    pending_items = db.get_buffer_items()
+        server_state = db.get_server_state()
+        fill_info = buffer.get_fill_info()
+        last_dispatch = db.get_last_dispatch()
+        recent_dispatches = [dict(d) for d in db.get_recent_dispatches(limit=5)]
+        pending_items = db.count_buffer_items()
 
     return {
         "buffer": fill_info,
-        "pending_items": len(pending_items),
+        "pending_items": pending_items,
         "last_dispatch": last_dispatch,
         "recent_dispatches": recent_dispatches,
         "server_state": server_state,
@@ -8,6 +8,7 @@ drift threshold exceeded).
 from __future__ import annotations
 
 import logging
+import sqlite3
 from pathlib import Path
 from typing import Any
 
@@ -69,6 +70,34 @@ class ContextBuffer:
         log.info("Buffer += %s (%s, %d chars)", path, item_type, chars)
         return True
 
+    def add_items(
+        self,
+        items: list[tuple[str, str, int, str | None, str | None]],
+    ) -> int:
+        """Add a burst of ``(path, item_type, chars, date, metadata)`` items.
+
+        Duplicates (already buffered, or repeated within the batch) are
+        skipped; the rest are written in a single transaction.
+
+        Returns the number of items added.
+        """
+        fresh: list[tuple[str, str, int, str | None, str | None]] = []
+        seen = self._db.buffered_paths([item[0] for item in items])
+        for item in items:
+            path = item[0]
+            if path in seen:
+                log.debug("Skipping duplicate buffer item: %s", path)
+                continue
+            seen.add(path)
+            fresh.append(item)
+
+        if not fresh:
+            return 0
+        self._db.add_buffer_items(fresh)
+        for path, item_type, chars, _date, _metadata in fresh:
+            log.info("Buffer += %s (%s, %d chars)", path, item_type, chars)
+        return len(fresh)
+
     def should_dispatch(self) -> str | None:
         """Check whether the buffer should trigger a dispatch.
 
@@ -93,7 +122,7 @@ class ContextBuffer:
 
         return None
 
-    def get_items(self) -> list[dict[str, Any]]:
+    def get_items(self) -> list[sqlite3.Row]:
         """Return all buffer items."""
         return self._db.get_buffer_items()
 
@@ -102,19 +131,19 @@ class ContextBuffer:
         doc_paths = resolve_doc_paths(self._config, self._project_root)
         budget, living_chars = compute_budget(self._config, doc_paths)
         buffer_chars = self._db.get_buffer_chars()
-        items = self._db.get_buffer_items()
+        item_count = self._db.count_buffer_items()
 
         fill_pct = (buffer_chars / budget * 100) if budget > 0 else 0.0
 
         return {
-            "item_count": len(items),
+            "item_count": item_count,
             "buffer_chars": buffer_chars,
             "budget": budget,
             "living_docs_chars": living_chars,
             "fill_pct": min(fill_pct, 100.0),
         }
 
-    def consume_all(self) -> list[dict[str, Any]]:
+    def consume_all(self) -> list[sqlite3.Row]:
         """Consume all buffer items for dispatch. Returns consumed items."""
         items = self._db.get_buffer_items()
         if not items:
@@ -13,14 +13,120 @@ managed here. Both modules share the same database file.
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 # Dispatch lifecycle states
 DISPATCH_STATES = ("building", "dispatched", "validated", "committed")
 TERMINAL_STATES = ("committed",)
+_VALID_DISPATCH_STATES = frozenset(DISPATCH_STATES)
+
+# Columns update_server_state may write. Keys are interpolated into the
+# UPDATE statement, so anything outside this set must be rejected.
+_VALID_SERVER_STATE_KEYS = frozenset({
+    "last_poll_commit", "last_poll_time", "last_dispatch_time",
+    "buffer_chars_total", "last_session_mtime", "last_session_mtime_ns",
+    "last_session_offset", "last_session_tree_mtime",
+})
+
+# Per-connection tuning. WAL (set once per file in _init_tables) lets
+# readers run alongside the writer, and with synchronous=NORMAL a commit
+# only fsyncs at checkpoint time. cache_size is negative KiB (64 MiB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",
+)
+
+# Prepared statements kept per connection. Every SQL literal in this
+# module fits comfortably, so hot calls never re-parse or re-plan.
+_STATEMENT_CACHE_SIZE = 256
+
+# Rows pulled per fetchmany() when streaming result sets
+_FETCH_CHUNK = 512
+
+# Max bound parameters per IN list (SQLite's historical default is 999)
+_IN_CHUNK = 512
+
+# Statements shared by several methods; keeping the text identical lets
+# sqlite3's per-connection statement cache reuse the prepared handle.
+_INSERT_BUFFER_ITEM = """INSERT INTO buffer_items
+    (path, item_type, chars, date, drift_type, added_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+_ADD_BUFFER_CHARS = (
+    "UPDATE server_state SET buffer_chars_total = buffer_chars_total + ? WHERE id = 1"
+)
+_UPDATE_DISPATCH_STATE = """UPDATE dispatches
+    SET state = ?, updated_at = ?, error = ?
+    WHERE id = ?"""
+_HAS_BUFFER_ITEM = "SELECT 1 FROM buffer_items WHERE path = ? LIMIT 1"
+_INCREMENT_RETRY = (
+    "UPDATE dispatches SET retry_count = retry_count + 1, updated_at = ? WHERE id = ?"
+)
+
+# Literal SQL list of the active (non-terminal) states. The partial index
+# and get_non_terminal_dispatches must spell the predicate identically
+# (not as bound parameters) for the planner to match them.
+_ACTIVE_STATES_SQL = ", ".join(
+    f"'{state}'" for state in DISPATCH_STATES if state not in TERMINAL_STATES
+)
+
+# Schema setup, run statement by statement inside one transaction
+# (executescript would commit any open transaction first)
+_CREATE_TABLES = (
+    """CREATE TABLE IF NOT EXISTS buffer_items (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        path        TEXT NOT NULL,
+        item_type   TEXT NOT NULL,
+        chars       INTEGER NOT NULL DEFAULT 0,
+        date        TEXT,
+        drift_type  TEXT,
+        added_at    TEXT NOT NULL,
+        metadata    TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS dispatches (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        chunk_id    INTEGER NOT NULL,
+        state       TEXT NOT NULL DEFAULT 'building',
+        retry_count INTEGER NOT NULL DEFAULT 0,
+        input_path  TEXT,
+        prompt_path TEXT,
+        created_at  TEXT NOT NULL,
+        updated_at  TEXT NOT NULL,
+        error       TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS server_state (
+        id                  INTEGER PRIMARY KEY CHECK (id = 1),
+        last_poll_commit    TEXT,
+        last_poll_time      TEXT,
+        last_dispatch_time  TEXT,
+        buffer_chars_total  INTEGER NOT NULL DEFAULT 0,
+        last_session_mtime  REAL,
+        last_session_offset INTEGER NOT NULL DEFAULT 0,
+        last_session_tree_mtime REAL,
+        last_session_mtime_ns INTEGER
+    )""",
+)
+
+# Indexes for the hot query shapes: has_buffer_item's point lookup,
+# get_buffer_items' ORDER BY date, id, and the crash-recovery scan
+# (a partial index, tiny because most dispatches end up committed).
+# ORDER BY id DESC needs none: it walks the rowid B-tree backwards.
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_buffer_items_path ON buffer_items(path)",
+    "CREATE INDEX IF NOT EXISTS idx_buffer_items_date ON buffer_items(date, id)",
+    "CREATE INDEX IF NOT EXISTS idx_dispatches_active ON dispatches(id)"
+    f" WHERE state IN ({_ACTIVE_STATES_SQL})",
+)
+
+# DELETE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 class ServerDB:
@@ -39,6 +145,12 @@ class ServerDB:
     def __init__(self, db_path: Path) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Every connection opened by any thread, so close() can reach them
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        # Bumped by close(); a thread holding an older connection reopens
+        self._generation = 0
         self._init_tables()
 
     # ------------------------------------------------------------------
@@ -46,52 +158,93 @@ class ServerDB:
     # ------------------------------------------------------------------
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
+        """Return this thread's connection, opening it on first use.
+
+        Connections are kept for the life of the instance (one per thread,
+        since watchdog callbacks arrive off the main thread) so their
+        prepared-statement cache stays warm. They run in autocommit mode;
+        multi-statement writes go through :meth:`_transaction`.
+        Each is registered so :meth:`close` can close it from any thread.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            # check_same_thread is off only so close() may close it from
+            # another thread; each connection is otherwise used by one thread
+            conn = sqlite3.connect(
+                str(self._db_path),
+                isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn.row_factory = sqlite3.Row
+            with self._conns_lock:
+                self._conns.append(conn)
+            self._local.conn = conn
+            self._local.generation = self._generation
         return conn
 
-    def _init_tables(self) -> None:
+    @contextmanager
+    def _transaction(self, mode: str = "IMMEDIATE") -> Iterator[sqlite3.Connection]:
+        """Run a block under ``BEGIN <mode>``, committing on success.
+
+        A failed ``COMMIT`` (e.g. SQLITE_BUSY) is rolled back too, so the
+        thread's persistent connection never stays inside a transaction.
+        """
         conn = self._connect()
+        conn.execute(f"BEGIN {mode}")
         try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Close every thread's connection.
+
+        Call once the other threads are done with the instance (e.g. at
+        shutdown). The instance stays usable: each thread's next call
+        opens a fresh connection.
+        """
+        self._local.conn = None
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._generation += 1
+        for conn in conns:
+            conn.close()
+
+    def close_thread(self) -> None:
+        """Close the calling thread's connection, if open.
+
+        For worker threads that are about to exit; other threads keep
+        their connections.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            return  # Never opened, or already closed by close()
+        self._local.conn = None
+        with self._conns_lock:
+            if conn in self._conns:
+                self._conns.remove(conn)
+        conn.close()
+
+    def _init_tables(self) -> None:
+        conn = self._connect()
+        # journal_mode is persistent in the file; only switch it once
+        if conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            conn.execute("PRAGMA journal_mode=WAL")
+
+        # One transaction for the whole migration: a single commit, and a
+        # legacy server_state is never left dropped but not rebuilt
+        with self._transaction() as conn:
             # Detect and rebuild legacy key-value server_state from migrate.py
             legacy_fold_from = self._migrate_legacy_server_state(conn)
 
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS buffer_items (
-                    id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path        TEXT NOT NULL,
-                    item_type   TEXT NOT NULL,
-                    chars       INTEGER NOT NULL DEFAULT 0,
-                    date        TEXT,
-                    drift_type  TEXT,
-                    added_at    TEXT NOT NULL,
-                    metadata    TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS dispatches (
-                    id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                    chunk_id    INTEGER NOT NULL,
-                    state       TEXT NOT NULL DEFAULT 'building',
-                    retry_count INTEGER NOT NULL DEFAULT 0,
-                    input_path  TEXT,
-                    prompt_path TEXT,
-                    created_at  TEXT NOT NULL,
-                    updated_at  TEXT NOT NULL,
-                    error       TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS server_state (
-                    id                  INTEGER PRIMARY KEY CHECK (id = 1),
-                    last_poll_commit    TEXT,
-                    last_poll_time      TEXT,
-                    last_dispatch_time  TEXT,
-                    buffer_chars_total  INTEGER NOT NULL DEFAULT 0,
-                    last_session_mtime  REAL,
-                    last_session_offset INTEGER NOT NULL DEFAULT 0,
-                    last_session_tree_mtime REAL
-                );
-            """)
+            for statement in _CREATE_TABLES:
+                conn.execute(statement)
 
             # Add fold_from column (idempotent)
             try:
@@ -116,22 +269,25 @@ class ServerDB:
                 )
             except sqlite3.OperationalError:
                 pass  # Column already exists
-
-            # Ensure singleton row exists
-            conn.execute(
-                "INSERT OR IGNORE INTO server_state (id, buffer_chars_total) VALUES (1, 0)"
-            )
-
-            # Restore fold_from from legacy migration if present
-            if legacy_fold_from:
+            # Session mtime bookmark in integer ns; the REAL
+            # last_session_mtime column is kept for legacy float seconds
+            try:
                 conn.execute(
-                    "UPDATE server_state SET fold_from = ? WHERE id = 1",
-                    (legacy_fold_from,),
+                    "ALTER TABLE server_state ADD COLUMN last_session_mtime_ns INTEGER",
                 )
+            except sqlite3.OperationalError:
+                pass  # Column already exists
 
-            conn.commit()
-        finally:
-            conn.close()
+            for statement in _CREATE_INDEXES:
+                conn.execute(statement)
+
+            # Ensure singleton row exists. A legacy migration just dropped
+            # the table, so the row is always new then and seeds fold_from.
+            conn.execute(
+                "INSERT OR IGNORE INTO server_state (id, buffer_chars_total, fold_from)"
+                " VALUES (1, 0, ?)",
+                (legacy_fold_from,),
+            )
 
     def _migrate_legacy_server_state(
         self, conn: sqlite3.Connection,
@@ -156,7 +312,6 @@ class ServerDB:
         ).fetchone()
         legacy_fold_from = row[0] if row else None
         conn.execute("DROP TABLE server_state")
-        conn.commit()
         return legacy_fold_from
 
     # ------------------------------------------------------------------
@@ -167,7 +322,7 @@ class ServerDB:
         return self
 
     def __exit__(self, *exc: object) -> None:
-        pass
+        self.close()
 
     # ------------------------------------------------------------------
     # Buffer items
@@ -184,112 +339,150 @@ class ServerDB:
     ) -> int:
         """Insert a new buffer item. Returns the row id."""
         now = _now_iso()
-        conn = self._connect()
-        try:
-            conn.execute("BEGIN IMMEDIATE")
+        with self._transaction() as conn:
             cur = conn.execute(
-                """INSERT INTO buffer_items
-                   (path, item_type, chars, date, drift_type, added_at, metadata)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                _INSERT_BUFFER_ITEM,
                 (path, item_type, chars, date, drift_type, now, metadata),
             )
             # Update buffer_chars_total
-            conn.execute(
-                "UPDATE server_state SET buffer_chars_total = buffer_chars_total + ? WHERE id = 1",
-                (chars,),
-            )
-            conn.commit()
+            conn.execute(_ADD_BUFFER_CHARS, (chars,))
             return cur.lastrowid  # type: ignore[return-value]
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
-    def get_buffer_items(self) -> list[dict[str, Any]]:
-        """Return all pending buffer items ordered by date."""
-        conn = self._connect()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM buffer_items ORDER BY date, id"
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+    def add_buffer_items(
+        self,
+        items: list[tuple[str, str, int, str | None, str | None]],
+    ) -> int:
+        """Insert several buffer items in one transaction.
+
+        Each item is ``(path, item_type, chars, date, metadata)``. The rows
+        go in with a single ``executemany`` and one commit, and
+        buffer_chars_total is bumped once for the whole batch.
+
+        Returns the number of rows inserted.
+        """
+        if not items:
+            return 0
+        now = _now_iso()
+        rows = [
+            (path, item_type, chars, date, None, now, metadata)
+            for path, item_type, chars, date, metadata in items
+        ]
+        with self._transaction() as conn:
+            conn.executemany(_INSERT_BUFFER_ITEM, rows)
+            conn.execute(_ADD_BUFFER_CHARS, (sum(row[2] for row in rows),))
+            return len(rows)
+
+    def get_buffer_items(self) -> list[sqlite3.Row]:
+        """Return all pending buffer items ordered by date.
+
+        Rows are returned as :class:`sqlite3.Row` (index or column-name
+        access, no per-row dict copy); call ``dict(row)`` where a mutable
+        mapping is needed.
+        """
+        return list(self.iter_buffer_items())
+
+    def iter_buffer_items(self) -> Iterator[sqlite3.Row]:
+        """Yield pending buffer items ordered by date, ``_FETCH_CHUNK`` rows at a time.
+
+        Rows stream in ``idx_buffer_items_date`` order, so SQLite never
+        sorts and callers that only iterate never hold the whole buffer.
+        """
+        cur = self._connect().execute(
+            "SELECT * FROM buffer_items ORDER BY date, id"
+        )
+        while rows := cur.fetchmany(_FETCH_CHUNK):
+            yield from rows
+
+    def count_buffer_items(self) -> int:
+        """Return the number of pending buffer items."""
+        row = self._connect().execute("SELECT COUNT(*) FROM buffer_items").fetchone()
+        return row[0]
 
     def get_buffer_chars(self) -> int:
         """Return total chars in the buffer."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT buffer_chars_total FROM server_state WHERE id = 1"
-            ).fetchone()
-            return row["buffer_chars_total"] if row else 0
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT buffer_chars_total FROM server_state WHERE id = 1"
+        ).fetchone()
+        return row["buffer_chars_total"] if row else 0
 
     def clear_buffer(self) -> int:
         """Remove all buffer items. Returns count of items removed."""
-        conn = self._connect()
-        try:
-            conn.execute("BEGIN IMMEDIATE")
+        with self._transaction() as conn:
             cur = conn.execute("DELETE FROM buffer_items")
             count = cur.rowcount
             conn.execute(
                 "UPDATE server_state SET buffer_chars_total = 0 WHERE id = 1"
             )
-            conn.commit()
             return count
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
-    def consume_buffer(self, item_ids: list[int]) -> list[dict[str, Any]]:
+    def consume_buffer(self, item_ids: list[int]) -> list[sqlite3.Row]:
         """Remove specific buffer items by id. Returns the consumed items.
 
         Atomically removes items and adjusts buffer_chars_total.
         """
         if not item_ids:
             return []
-        conn = self._connect()
-        try:
-            conn.execute("BEGIN IMMEDIATE")
-            placeholders = ",".join("?" for _ in item_ids)
-            rows = conn.execute(
-                f"SELECT * FROM buffer_items WHERE id IN ({placeholders})",
-                item_ids,
-            ).fetchall()
-            items = [dict(r) for r in rows]
+        rows: list[sqlite3.Row] = []
+        with self._transaction() as conn:
+            for start in range(0, len(item_ids), _IN_CHUNK):
+                chunk = list(item_ids[start:start + _IN_CHUNK])
+                # Pad each chunk to a power of two (repeating an id is harmless
+                # in an IN list) so only a handful of distinct statements get
+                # cached; chunking keeps the padded list under SQLite's limit.
+                chunk += chunk[-1:] * (_ladder_size(len(chunk)) - len(chunk))
+                placeholders = ",".join("?" * len(chunk))
+                if _HAS_RETURNING:
+                    rows += conn.execute(
+                        f"DELETE FROM buffer_items WHERE id IN ({placeholders}) RETURNING *",
+                        chunk,
+                    ).fetchall()
+                else:
+                    rows += conn.execute(
+                        f"SELECT * FROM buffer_items WHERE id IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    conn.execute(
+                        f"DELETE FROM buffer_items WHERE id IN ({placeholders})",
+                        chunk,
+                    )
+            items = sorted(rows, key=lambda item: item["id"])
             chars_removed = sum(item["chars"] for item in items)
-            conn.execute(
-                f"DELETE FROM buffer_items WHERE id IN ({placeholders})",
-                item_ids,
-            )
             conn.execute(
                 "UPDATE server_state SET buffer_chars_total = MAX(0, buffer_chars_total - ?) WHERE id = 1",
                 (chars_removed,),
             )
-            conn.commit()
             return items
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
     def has_buffer_item(self, path: str) -> bool:
-        """Check if a path is already in the buffer."""
+        """Check if a path is already in the buffer.
+
+        A single seek on ``idx_buffer_items_path``; the index covers the
+        query, so the table itself is never read.
+        """
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT 1 FROM buffer_items WHERE path = ? LIMIT 1",
-                (path,),
-            ).fetchone()
-            return row is not None
-        finally:
-            conn.close()
+        row = conn.execute(_HAS_BUFFER_ITEM, (path,)).fetchone()
+        return row is not None
+
+    def buffered_paths(self, paths: list[str]) -> set[str]:
+        """Return the subset of ``paths`` already in the buffer.
+
+        Batch form of :meth:`has_buffer_item`: one covering-index query
+        per ``_IN_CHUNK`` paths instead of one query per path.
+        """
+        conn = self._connect()
+        found: set[str] = set()
+        for start in range(0, len(paths), _IN_CHUNK):
+            chunk = paths[start:start + _IN_CHUNK]
+            # Same power-of-two padding as consume_buffer
+            chunk += chunk[-1:] * (_ladder_size(len(chunk)) - len(chunk))
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT path FROM buffer_items WHERE path IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
 
     # ------------------------------------------------------------------
     # Dispatches
@@ -304,17 +497,13 @@ class ServerDB:
         """Create a new dispatch record in 'building' state. Returns row id."""
         now = _now_iso()
         conn = self._connect()
-        try:
-            cur = conn.execute(
-                """INSERT INTO dispatches
-                   (chunk_id, state, created_at, updated_at, input_path, prompt_path)
-                   VALUES (?, 'building', ?, ?, ?, ?)""",
-                (chunk_id, now, now, input_path, prompt_path),
-            )
-            conn.commit()
-            return cur.lastrowid  # type: ignore[return-value]
-        finally:
-            conn.close()
+        cur = conn.execute(
+            """INSERT INTO dispatches
+               (chunk_id, state, created_at, updated_at, input_path, prompt_path)
+               VALUES (?, 'building', ?, ?, ?, ?)""",
+            (chunk_id, now, now, input_path, prompt_path),
+        )
+        return cur.lastrowid  # type: ignore[return-value]
 
     def update_dispatch_state(
         self,
@@ -322,88 +511,64 @@ class ServerDB:
         state: str,
         error: str | None = None,
     ) -> None:
-        """Transition a dispatch to a new state."""
-        if state not in DISPATCH_STATES:
+        """Transition a dispatch to a new state.
+
+        The single UPDATE commits on its own under autocommit, so each
+        transition (terminal or not) costs exactly one commit.
+        """
+        if state not in _VALID_DISPATCH_STATES:
             raise ValueError(f"Invalid dispatch state '{state}'. Must be one of {DISPATCH_STATES}")
         now = _now_iso()
         conn = self._connect()
-        try:
-            conn.execute(
-                """UPDATE dispatches
-                   SET state = ?, updated_at = ?, error = ?
-                   WHERE id = ?""",
-                (state, now, error, dispatch_id),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(_UPDATE_DISPATCH_STATE, (state, now, error, dispatch_id))
 
     def increment_retry(self, dispatch_id: int) -> int:
         """Increment retry count for a dispatch. Returns new count."""
-        conn = self._connect()
-        try:
-            conn.execute("BEGIN IMMEDIATE")
-            conn.execute(
-                "UPDATE dispatches SET retry_count = retry_count + 1, updated_at = ? WHERE id = ?",
-                (_now_iso(), dispatch_id),
-            )
+        params = (_now_iso(), dispatch_id)
+        if _HAS_RETURNING:
+            # One cached statement, committed on its own under autocommit.
+            # fetchall() steps it to completion so the write lock is freed.
+            rows = self._connect().execute(
+                _INCREMENT_RETRY + " RETURNING retry_count", params,
+            ).fetchall()
+            return rows[0]["retry_count"] if rows else 0
+        with self._transaction() as conn:
+            conn.execute(_INCREMENT_RETRY, params)
             row = conn.execute(
                 "SELECT retry_count FROM dispatches WHERE id = ?",
                 (dispatch_id,),
             ).fetchone()
-            conn.commit()
             return row["retry_count"] if row else 0
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
     def get_dispatch(self, dispatch_id: int) -> dict[str, Any] | None:
         """Get a single dispatch record."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT * FROM dispatches WHERE id = ?", (dispatch_id,)
-            ).fetchone()
-            return dict(row) if row else None
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT * FROM dispatches WHERE id = ?", (dispatch_id,)
+        ).fetchone()
+        return dict(row) if row else None
 
-    def get_non_terminal_dispatches(self) -> list[dict[str, Any]]:
+    def get_non_terminal_dispatches(self) -> list[sqlite3.Row]:
         """Get all dispatches in non-terminal states (for crash recovery)."""
         conn = self._connect()
-        try:
-            placeholders = ",".join("?" for _ in TERMINAL_STATES)
-            rows = conn.execute(
-                f"SELECT * FROM dispatches WHERE state NOT IN ({placeholders}) ORDER BY id",
-                TERMINAL_STATES,
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        return conn.execute(
+            f"SELECT * FROM dispatches WHERE state IN ({_ACTIVE_STATES_SQL}) ORDER BY id"
+        ).fetchall()
 
-    def get_recent_dispatches(self, limit: int = 10) -> list[dict[str, Any]]:
+    def get_recent_dispatches(self, limit: int = 10) -> list[sqlite3.Row]:
         """Get the most recent dispatches for status display."""
         conn = self._connect()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM dispatches ORDER BY id DESC LIMIT ?", (limit,)
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        return conn.execute(
+            "SELECT * FROM dispatches ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
 
     def get_last_dispatch(self) -> dict[str, Any] | None:
         """Get the most recent dispatch."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT * FROM dispatches ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-            return dict(row) if row else None
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT * FROM dispatches ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        return dict(row) if row else None
 
     # ------------------------------------------------------------------
     # Server state
@@ -412,47 +577,33 @@ class ServerDB:
     def get_server_state(self) -> dict[str, Any]:
         """Return the singleton server_state row."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT * FROM server_state WHERE id = 1"
-            ).fetchone()
-            return dict(row) if row else {"buffer_chars_total": 0}
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT * FROM server_state WHERE id = 1"
+        ).fetchone()
+        return dict(row) if row else {"buffer_chars_total": 0}
 
     def set_fold_from(self, fold_date: str) -> None:
         """Set the fold_from marker (ISO date string)."""
         conn = self._connect()
-        try:
-            conn.execute(
-                "UPDATE server_state SET fold_from = ? WHERE id = 1",
-                (fold_date,),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(
+            "UPDATE server_state SET fold_from = ? WHERE id = 1",
+            (fold_date,),
+        )
 
     def get_fold_from(self) -> str | None:
         """Return the fold_from marker, or None if not set."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT fold_from FROM server_state WHERE id = 1"
-            ).fetchone()
-            return row["fold_from"] if row else None
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT fold_from FROM server_state WHERE id = 1"
+        ).fetchone()
+        return row["fold_from"] if row else None
 
     def clear_fold_from(self) -> None:
         """Clear the fold_from marker (set to NULL)."""
         conn = self._connect()
-        try:
-            conn.execute(
-                "UPDATE server_state SET fold_from = NULL WHERE id = 1"
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(
+            "UPDATE server_state SET fold_from = NULL WHERE id = 1"
+        )
 
     # ------------------------------------------------------------------
     # L0 stale flag
@@ -461,71 +612,44 @@ class ServerDB:
     def mark_l0_stale(self) -> None:
         """Set l0_stale = 1 to indicate briefing needs regeneration."""
         conn = self._connect()
-        try:
-            conn.execute(
-                "UPDATE server_state SET l0_stale = 1 WHERE id = 1"
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(
+            "UPDATE server_state SET l0_stale = 1 WHERE id = 1"
+        )
 
     def clear_l0_stale(self) -> None:
         """Set l0_stale = 0 after successful briefing regeneration."""
         conn = self._connect()
-        try:
-            conn.execute(
-                "UPDATE server_state SET l0_stale = 0 WHERE id = 1"
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(
+            "UPDATE server_state SET l0_stale = 0 WHERE id = 1"
+        )
 
     def is_l0_stale(self) -> bool:
         """Return True if L0 briefing needs regeneration."""
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT l0_stale FROM server_state WHERE id = 1"
-            ).fetchone()
-            return bool(row["l0_stale"]) if row else False
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT l0_stale FROM server_state WHERE id = 1"
+        ).fetchone()
+        return bool(row["l0_stale"]) if row else False
 
     def update_server_state(self, **kwargs: Any) -> None:
         """Update fields on the server_state singleton.
 
         Valid keys: last_poll_commit, last_poll_time, last_dispatch_time,
-        buffer_chars_total, last_session_mtime.
+        buffer_chars_total, last_session_mtime, last_session_mtime_ns,
+        last_session_offset, last_session_tree_mtime.
         """
-        valid_keys = {
-            "last_poll_commit", "last_poll_time", "last_dispatch_time",
-            "buffer_chars_total", "last_session_mtime",
-            "last_session_offset", "last_session_tree_mtime",
-        }
-        invalid = set(kwargs) - valid_keys
+        invalid = kwargs.keys() - _VALID_SERVER_STATE_KEYS
         if invalid:
-            raise ValueError(f"Invalid server_state keys: {invalid}")
+            raise ValueError(f"Invalid server_state keys: {sorted(invalid)}")
 
-        if not kwargs:
-            return
-
-        set_clause = ", ".join(f"{k} = ?" for k in kwargs)
-        values = list(kwargs.values())
         conn = self._connect()
-        try:
-            conn.execute(
-                f"UPDATE server_state SET {set_clause} WHERE id = 1",
-                values,
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn.execute(_update_server_state_sql(tuple(kwargs)), list(kwargs.values()))
 
     # ------------------------------------------------------------------
     # Crash recovery
     # ------------------------------------------------------------------
 
-    def recover_on_startup(self) -> list[dict[str, Any]]:
+    def recover_on_startup(self) -> list[sqlite3.Row]:
         """Check for non-terminal dispatches and return them for recovery.
 
         Recovery strategy per state:
@@ -535,28 +659,28 @@ class ServerDB:
 
         Returns list of dispatch records needing attention.
         """
-        non_terminal = self.get_non_terminal_dispatches()
-        if not non_terminal:
-            return []
+        # One exclusive transaction: nothing can slip a new 'building'
+        # row in between the discard and the read.
+        with self._transaction("EXCLUSIVE") as conn:
+            # Discard incomplete builds
+            conn.execute("DELETE FROM dispatches WHERE state = 'building'")
+            # What is still active is dispatched + validated, for the
+            # server to handle; the partial index serves this read.
+            return conn.execute(
+                f"SELECT * FROM dispatches WHERE state IN ({_ACTIVE_STATES_SQL}) ORDER BY id"
+            ).fetchall()
+
+
+@lru_cache(maxsize=64)
+def _update_server_state_sql(keys: tuple[str, ...]) -> str:
+    """Build (once per key tuple) the UPDATE for ``update_server_state``."""
+    set_clause = ", ".join(f"{k} = ?" for k in keys)
+    return f"UPDATE server_state SET {set_clause} WHERE id = 1"
 
-        conn = self._connect()
-        try:
-            conn.execute("BEGIN IMMEDIATE")
-            for d in non_terminal:
-                if d["state"] == "building":
-                    # Discard incomplete builds
-                    conn.execute(
-                        "DELETE FROM dispatches WHERE id = ?", (d["id"],)
-                    )
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
-        # Return dispatched + validated records for the server to handle
-        return [d for d in non_terminal if d["state"] in ("dispatched", "validated")]
+def _ladder_size(n: int) -> int:
+    """Round ``n`` up to the next power of two (minimum 1)."""
+    return 1 << max(0, n - 1).bit_length()
 
 
 def _now_iso() -> str:
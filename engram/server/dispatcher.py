@@ -14,13 +14,17 @@ from __future__ import annotations
 import json
 import logging
 import re
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from engram import _json
 from engram.config import resolve_doc_paths
 from engram.dispatch import invoke_agent, read_docs
+from engram.fold._parse_cache import decode_jsonl_lines
 from engram.fold.chunker import ChunkResult, cleanup_chunk_context_worktree, next_chunk
+from engram.fold.sources import load_issue_snapshot
 from engram.linter import LintResult, lint_post_dispatch
 
 log = logging.getLogger(__name__)
@@ -178,14 +182,18 @@ class Dispatcher:
 
         return False
 
-    def recover_dispatch(self, dispatch: dict[str, Any]) -> bool:
+    def recover_dispatch(self, dispatch: sqlite3.Row | dict[str, Any]) -> bool:
         """Recover a dispatch found in non-terminal state on startup.
 
         Recovery strategy per state:
         - ``validated``: mark L0 stale and committed (L0 regen deferred to drain).
         - ``dispatched``: Agent may have completed. Re-lint; if valid, proceed
           to mark L0 stale + committed. If lint fails and retries remain, re-dispatch.
+
+        ``dispatch`` may be a ``sqlite3.Row`` or a plain dict; optional
+        columns missing from a dict are treated as unset.
         """
+        dispatch = dict(dispatch)
         doc_paths = resolve_doc_paths(self._config, self._project_root)
         dispatch_id = dispatch["id"]
 
@@ -279,15 +287,8 @@ class Dispatcher:
 
         queue: list[dict[str, Any]] = []
         if queue_file.exists():
-            with open(queue_file) as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        queue.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+            # Decode raw bytes line by line (orjson when available)
+            queue.extend(decode_jsonl_lines(iter(queue_file.read_bytes().split(b"\n"))))
 
         existing_paths = {
             entry.get("path")
@@ -319,18 +320,18 @@ class Dispatcher:
 
     def _buffer_item_to_queue_entry(
         self,
-        item: dict[str, Any],
+        item: sqlite3.Row,
     ) -> dict[str, Any] | None:
         """Convert a buffered watcher item into queue.jsonl entry schema."""
-        path = item.get("path")
-        item_type = item.get("item_type")
+        path = item["path"]
+        item_type = item["item_type"]
         if not isinstance(path, str) or not isinstance(item_type, str):
             return None
 
-        entry_date = item.get("date") or item.get("added_at")
+        entry_date = item["date"] or item["added_at"]
         if not isinstance(entry_date, str) or not entry_date:
             entry_date = datetime.now(timezone.utc).isoformat()
-        chars = int(item.get("chars") or 0)
+        chars = int(item["chars"] or 0)
 
         if item_type == "doc":
             return {
@@ -355,12 +356,12 @@ class Dispatcher:
 
         if item_type == "prompts":
             prompt_count = 1
-            metadata = item.get("metadata")
+            metadata = item["metadata"]
             if isinstance(metadata, str) and metadata:
                 try:
-                    parsed = json.loads(metadata)
+                    parsed = _json.loads(metadata)
                     prompt_count = int(parsed.get("prompt_count", 1))
-                except (json.JSONDecodeError, TypeError, ValueError):
+                except (_json.JSONDecodeError, AttributeError, TypeError, ValueError):
                     prompt_count = 1
 
             return {
@@ -383,7 +384,7 @@ class Dispatcher:
 
         if issue_path.exists():
             try:
-                issue = json.loads(issue_path.read_text())
+                issue = load_issue_snapshot(issue_path)
                 raw_number = issue.get("number", 0)
                 issue_number = int(raw_number)
                 raw_title = issue.get("title", "")
@@ -14,7 +14,9 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable
@@ -22,8 +24,21 @@ from typing import Any, Callable
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from engram._io import write_all
+
 log = logging.getLogger(__name__)
 
+# Session mtime bookmarks below this are legacy float seconds, not ns
+_MTIME_NS_THRESHOLD = 1e12
+
+# Project-relative prefix for rendered session markdown
+_SESSIONS_REL_PREFIX = ".engram/sessions/"
+
+# File-event drain: flush at most this many items per batch, waiting up to
+# this long for a burst to accumulate
+_DRAIN_MAX_ITEMS = 256
+_DRAIN_TIMEOUT = 0.05
+
 
 # ------------------------------------------------------------------
 # Types
@@ -32,6 +47,11 @@ log = logging.getLogger(__name__)
 # Callback signature: (path, item_type, chars, date, metadata)
 BufferCallback = Callable[[str, str, int, str | None, str | None], None]
 
+# Batch callback: receives every item from one poll as a list of
+# (path, item_type, chars, date, metadata) tuples
+BufferItem = tuple[str, str, int, str | None, str | None]
+BatchCallback = Callable[[list[BufferItem]], None]
+
 
 # ------------------------------------------------------------------
 # Filesystem watcher (watchdog)
@@ -39,18 +59,37 @@ BufferCallback = Callable[[str, str, int, str | None, str | None], None]
 
 
 class _DocEventHandler(FileSystemEventHandler):
-    """Watchdog handler that calls back on file create/modify events."""
+    """Watchdog handler that calls back on file create/modify events.
+
+    With a ``batch_callback``, events are only queued on watchdog's
+    observer thread; a drain thread (see :meth:`start_drain`) hands them
+    over in batches so a burst of file events costs one buffer write.
+    ``on_drain_exit`` runs on the drain thread just before it exits, to
+    release per-thread resources such as its database connection.
+    """
 
     def __init__(
         self,
         callback: BufferCallback,
         project_root: Path,
         extensions: tuple[str, ...] = (".md", ".txt", ".json", ".yaml", ".yml"),
+        *,
+        batch_callback: BatchCallback | None = None,
+        on_drain_exit: Callable[[], None] | None = None,
     ) -> None:
         super().__init__()
         self._callback = callback
+        self._batch_callback = batch_callback
+        self._on_drain_exit = on_drain_exit
+        self._queue: queue.SimpleQueue[BufferItem | None] = queue.SimpleQueue()
+        self._drain_thread: threading.Thread | None = None
         self._project_root = project_root
-        self._extensions = extensions
+        self._extensions = tuple(ext.lower() for ext in extensions)
+        # Filters run on plain strings: one endswith(tuple) for the
+        # extension, a prefix slice for the relative path, and a substring
+        # probe for hidden components — no Path objects per event.
+        self._root_prefix = os.path.join(str(project_root), "")
+        self._hidden_marker = os.sep + "."
 
     def on_created(self, event: FileSystemEvent) -> None:
         if not event.is_directory:
@@ -61,23 +100,58 @@ class _DocEventHandler(FileSystemEventHandler):
             self._handle(event.src_path)
 
     def _handle(self, abs_path: str) -> None:
-        path = Path(abs_path)
-        if path.suffix.lower() not in self._extensions:
+        if not abs_path.lower().endswith(self._extensions):
             return
+        if not abs_path.startswith(self._root_prefix):
+            return
+        rel_str = abs_path[len(self._root_prefix):]
         # Skip hidden files and .engram directory
-        rel = path.relative_to(self._project_root)
-        parts = rel.parts
-        if any(p.startswith(".") for p in parts):
+        if rel_str.startswith(".") or self._hidden_marker in rel_str:
             return
 
         try:
-            chars = path.stat().st_size
+            chars = os.stat(abs_path).st_size
         except OSError:
             chars = 0
 
-        rel_str = str(rel)
-        item_type = "issue" if path.suffix == ".json" else "doc"
-        self._callback(rel_str, item_type, chars, None, None)
+        item_type = "issue" if abs_path.endswith(".json") else "doc"
+        if self._batch_callback is not None:
+            self._queue.put((rel_str, item_type, chars, None, None))
+        else:
+            self._callback(rel_str, item_type, chars, None, None)
+
+    def start_drain(self) -> None:
+        """Start the thread that flushes queued events to ``batch_callback``."""
+        if self._batch_callback is None or self._drain_thread is not None:
+            return
+        self._drain_thread = threading.Thread(
+            target=self._drain_loop, name="engram-file-events", daemon=True,
+        )
+        self._drain_thread.start()
+
+    def stop_drain(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the drain thread."""
+        if self._drain_thread is None:
+            return
+        self._queue.put(None)
+        self._drain_thread.join(timeout=timeout)
+        self._drain_thread = None
+
+    def _drain_loop(self) -> None:
+        assert self._batch_callback is not None
+        try:
+            while True:
+                batch, stopped = _drain(self._queue, _DRAIN_MAX_ITEMS, _DRAIN_TIMEOUT)
+                if batch:
+                    try:
+                        self._batch_callback(batch)
+                    except Exception:
+                        log.exception("Failed to buffer %d file events", len(batch))
+                if stopped:
+                    return
+        finally:
+            if self._on_drain_exit is not None:
+                self._on_drain_exit()
 
 
 class FileWatcher:
@@ -91,6 +165,11 @@ class FileWatcher:
         Project root directory.
     callback:
         Called when a relevant file event occurs.
+    batch_callback:
+        Optional; when given, events are queued and handed over in batches
+        from a dedicated drain thread instead of one ``callback`` per event.
+    on_drain_exit:
+        Optional; called on the drain thread as it exits.
     """
 
     def __init__(
@@ -98,11 +177,17 @@ class FileWatcher:
         config: dict[str, Any],
         project_root: Path,
         callback: BufferCallback,
+        *,
+        batch_callback: BatchCallback | None = None,
+        on_drain_exit: Callable[[], None] | None = None,
     ) -> None:
         self._config = config
         self._project_root = project_root
         self._callback = callback
+        self._batch_callback = batch_callback
+        self._on_drain_exit = on_drain_exit
         self._observer: Observer | None = None
+        self._handler: _DocEventHandler | None = None
 
     def start(self) -> None:
         """Start the filesystem observer."""
@@ -124,7 +209,12 @@ class FileWatcher:
             log.warning("No source directories found to watch")
             return
 
-        handler = _DocEventHandler(self._callback, self._project_root)
+        handler = _DocEventHandler(
+            self._callback, self._project_root,
+            batch_callback=self._batch_callback, on_drain_exit=self._on_drain_exit,
+        )
+        handler.start_drain()
+        self._handler = handler
         self._observer = Observer()
         for d in watch_dirs:
             self._observer.schedule(handler, str(d), recursive=True)
@@ -139,6 +229,9 @@ class FileWatcher:
             self._observer.stop()
             self._observer.join(timeout=5)
             self._observer = None
+        if self._handler:
+            self._handler.stop_drain()
+            self._handler = None
 
 
 # ------------------------------------------------------------------
@@ -157,6 +250,9 @@ class GitPoller:
         Called for each new commit detected.
     source_dirs:
         Directories to filter git changes to.
+    batch_callback:
+        Optional; when given, all files changed in one poll are handed
+        over in a single call instead of one ``callback`` per file.
     """
 
     def __init__(
@@ -164,11 +260,17 @@ class GitPoller:
         project_root: Path,
         callback: BufferCallback,
         source_dirs: list[str] | None = None,
+        *,
+        batch_callback: BatchCallback | None = None,
     ) -> None:
         self._project_root = project_root
         self._callback = callback
+        self._batch_callback = batch_callback
         self._source_dirs = source_dirs or []
         self._last_commit: str | None = None
+        # Long-lived `git cat-file --batch-check`, for repos whose HEAD
+        # cannot be read straight from .git (worktrees, submodules)
+        self._head_reader: subprocess.Popen[bytes] | None = None
 
     def set_last_commit(self, commit_hash: str | None) -> None:
         """Set the bookmark for the last known commit."""
@@ -177,23 +279,44 @@ class GitPoller:
     def get_last_commit(self) -> str | None:
         return self._last_commit
 
+    def close(self) -> None:
+        """Stop the background ``git cat-file`` process, if running."""
+        proc = self._head_reader
+        self._head_reader = None
+        if proc is None:
+            return
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                stream.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
     def poll(self) -> list[str]:
         """Check for new commits since last poll.
 
         Returns list of new commit hashes found.
         """
         try:
-            # Get current HEAD
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=str(self._project_root),
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return []
-            current_head = result.stdout.strip()
+            # Resolve HEAD in-process when possible; an idle poll then
+            # costs a couple of small file reads instead of a fork+exec.
+            # Otherwise ask the long-lived cat-file process.
+            current_head = _read_head(self._project_root)
+            if current_head is None and (self._project_root / ".git").exists():
+                current_head = self._batch_head()
+            if current_head is None:
+                result = subprocess.run(
+                    ["git", "rev-parse", "HEAD"],
+                    capture_output=True,
+                    text=True,
+                    cwd=str(self._project_root),
+                    timeout=10,
+                )
+                if result.returncode != 0:
+                    return []
+                current_head = result.stdout.strip()
 
             if self._last_commit == current_head:
                 return []
@@ -242,6 +365,7 @@ class GitPoller:
                     timeout=30,
                 )
                 if diff_result.returncode == 0:
+                    batch: list[BufferItem] = []
                     for changed_file in diff_result.stdout.strip().split("\n"):
                         changed_file = changed_file.strip()
                         if not changed_file:
@@ -257,7 +381,8 @@ class GitPoller:
                                 chars = file_path.stat().st_size
                             except OSError:
                                 pass
-                        self._callback(changed_file, "doc", chars, None, None)
+                        batch.append((changed_file, "doc", chars, None, None))
+                    _emit(batch, self._callback, self._batch_callback)
 
             return new_commits
 
@@ -265,6 +390,85 @@ class GitPoller:
             log.warning("Git polling failed")
             return []
 
+    def _batch_head(self) -> str | None:
+        """Resolve HEAD through the persistent ``git cat-file`` process.
+
+        The process is spawned on first use and respawned if it exits, so
+        the fork+exec is paid once rather than on every poll. Returns None
+        if git is unavailable or HEAD does not resolve.
+        """
+        proc = self._head_reader
+        if proc is None or proc.poll() is not None:
+            try:
+                proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname)"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=str(self._project_root),
+                )
+            except OSError:
+                return None
+            self._head_reader = proc
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(b"HEAD\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+        except OSError:
+            self.close()
+            return None
+        head = line.strip().decode("ascii", "replace")
+        return head if _is_object_id(head) else None
+
+
+def _read_head(project_root: Path) -> str | None:
+    """Resolve HEAD to a commit hash by reading ``.git`` directly.
+
+    Handles detached heads, loose refs and ``packed-refs``. Returns None
+    for anything else (worktrees, submodules, symref chains) so the
+    caller can fall back to ``git rev-parse``.
+    """
+    git_dir = project_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head if _is_object_id(head) else None
+
+    ref = head[5:].strip()
+    try:
+        target = (git_dir / ref).read_text().strip()
+    except OSError:
+        target = _packed_ref(git_dir, ref)
+    return target if target and _is_object_id(target) else None
+
+
+def _packed_ref(git_dir: Path, ref: str) -> str | None:
+    """Look up ``ref`` in ``packed-refs``."""
+    suffix = " " + ref
+    try:
+        with open(git_dir / "packed-refs") as fh:
+            for line in fh:
+                line = line.rstrip("\n")
+                if line.endswith(suffix) and not line.startswith(("#", "^")):
+                    return line[: -len(suffix)]
+    except OSError:
+        return None
+    return None
+
+
+def _is_object_id(value: str) -> bool:
+    """True for a full SHA-1 or SHA-256 hex object id."""
+    if len(value) not in (40, 64):
+        return False
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+    return True
+
 
 # ------------------------------------------------------------------
 # Session history poller
@@ -283,6 +487,9 @@ class SessionPoller:
         Engram config dict (needs ``sources.sessions``).
     callback:
         Called for each new session detected.
+    batch_callback:
+        Optional; when given, all sessions found in one poll are handed
+        over in a single call instead of one ``callback`` per session.
     """
 
     def __init__(
@@ -290,11 +497,19 @@ class SessionPoller:
         config: dict[str, Any],
         callback: BufferCallback,
         project_root: Path | None = None,
+        *,
+        batch_callback: BatchCallback | None = None,
     ) -> None:
         self._config = config
         self._callback = callback
+        self._batch_callback = batch_callback
         self._project_root = project_root
-        self._last_mtime: float | None = None
+        # Resolved once; per-entry paths are plain string joins
+        self._sessions_dir: str | None = (
+            str(project_root / ".engram" / "sessions") if project_root else None
+        )
+        # History mtime in integer nanoseconds (st_mtime_ns)
+        self._last_mtime: int | None = None
         self._last_offset: int = 0
         self._last_tree_mtime: float | None = None
         self._known_prompt_counts: dict[str, int] = {}
@@ -309,10 +524,20 @@ class SessionPoller:
             self._session_tree = self._path.parent / "sessions"
 
     def set_last_mtime(self, mtime: float | None) -> None:
-        """Set the bookmark for last known mtime."""
-        self._last_mtime = mtime
+        """Set the bookmark for last known mtime.
+
+        Accepts nanoseconds, or float seconds as persisted by older
+        versions; both are normalised to integer nanoseconds.
+        """
+        if mtime is None:
+            self._last_mtime = None
+        elif mtime < _MTIME_NS_THRESHOLD:
+            self._last_mtime = int(mtime * 1_000_000_000)
+        else:
+            self._last_mtime = int(mtime)
 
-    def get_last_mtime(self) -> float | None:
+    def get_last_mtime(self) -> int | None:
+        """Return the last seen history mtime in nanoseconds."""
         return self._last_mtime
 
     def set_last_offset(self, offset: int) -> None:
@@ -334,14 +559,12 @@ class SessionPoller:
 
         Returns count of new session entries added to buffer.
         """
-        if not self._path.exists():
-            return 0
-
         try:
-            current_mtime = self._path.stat().st_mtime
-            current_size = self._path.stat().st_size
+            st = os.stat(self._path)
         except OSError:
             return 0
+        current_mtime = st.st_mtime_ns
+        current_size = st.st_size
 
         tree_mtime = _latest_tree_mtime(self._session_tree)
 
@@ -387,7 +610,10 @@ class SessionPoller:
             start_offset=start_offset,
         )
 
-        count = 0
+        if entries and self._sessions_dir is not None:
+            os.makedirs(self._sessions_dir, exist_ok=True)
+
+        batch: list[BufferItem] = []
         for entry in entries:
             known_prompts = self._known_prompt_counts.get(entry.session_id, 0)
             emitted_prompt_count = entry.prompt_count
@@ -396,33 +622,32 @@ class SessionPoller:
                     continue
                 emitted_prompt_count = entry.prompt_count - known_prompts
 
-            rel_path = f".engram/sessions/{entry.session_id}.md"
-            chars = entry.chars
-            if self._project_root:
-                rel_path, chars = self._write_session_file(
-                    session_id=entry.session_id,
-                    rendered=entry.rendered,
-                    reset=start_offset == 0,
-                )
-            self._callback(
+            rel_path, chars = self._write_session_file(
+                session_id=entry.session_id,
+                rendered=entry.rendered,
+                reset=start_offset == 0,
+                chars=entry.chars,
+            )
+            batch.append((
                 rel_path,
                 "prompts",
                 chars,
                 entry.date,
                 json.dumps({"prompt_count": emitted_prompt_count}),
-            )
+            ))
             if start_offset == 0:
                 self._known_prompt_counts[entry.session_id] = entry.prompt_count
             else:
                 self._known_prompt_counts[entry.session_id] = (
                     known_prompts + entry.prompt_count
                 )
-            count += 1
+
+        _emit(batch, self._callback, self._batch_callback)
 
         self._last_mtime = current_mtime
         self._last_offset = new_offset
         self._last_tree_mtime = tree_mtime
-        return count
+        return len(batch)
 
     def _write_session_file(
         self,
@@ -430,30 +655,76 @@ class SessionPoller:
         rendered: str,
         *,
         reset: bool,
+        chars: int,
     ) -> tuple[str, int]:
-        """Write incremental session markdown under ``.engram/sessions``."""
-        if not self._project_root:
-            rel_path = f".engram/sessions/{session_id}.md"
-            return rel_path, len(rendered)
-
-        sessions_dir = self._project_root / ".engram" / "sessions"
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        session_file = sessions_dir / f"{session_id}.md"
-
-        if reset or not session_file.exists():
-            session_file.write_text(rendered)
-        else:
-            with open(session_file, "a") as fh:
-                if session_file.stat().st_size > 0:
-                    fh.write("\n")
-                fh.write(rendered)
+        """Write incremental session markdown under ``.engram/sessions``.
 
-        rel_path = str(session_file.relative_to(self._project_root))
+        The directory must already exist (``poll`` creates it once per
+        batch). Without a project root nothing is written and ``chars``
+        is passed through.
+        """
+        rel_path = _SESSIONS_REL_PREFIX + session_id + ".md"
+        if self._sessions_dir is None:
+            return rel_path, chars
+
+        session_file = os.path.join(self._sessions_dir, session_id + ".md")
+        payload = rendered.encode("utf-8")
+        # Raw fd write of pre-encoded bytes, no text layer. No fsync: the
+        # session offset is persisted only after the poll returns, so a
+        # crash here just re-reads these entries on restart.
+        flags = os.O_WRONLY | os.O_CREAT
+        flags |= os.O_TRUNC if reset else os.O_APPEND
+        fd = os.open(session_file, flags, 0o644)
         try:
-            chars = session_file.stat().st_size
-        except OSError:
-            chars = len(rendered)
-        return rel_path, chars
+            size = 0 if reset else os.fstat(fd).st_size
+            if size > 0:
+                payload = b"\n" + payload
+            write_all(fd, payload)
+        finally:
+            os.close(fd)
+        return rel_path, size + len(payload)
+
+
+def _emit(
+    batch: list[BufferItem],
+    callback: BufferCallback,
+    batch_callback: BatchCallback | None,
+) -> None:
+    """Deliver a poll's items in one batch call, or item-by-item."""
+    if not batch:
+        return
+    if batch_callback is not None:
+        batch_callback(batch)
+        return
+    for item in batch:
+        callback(*item)
+
+
+def _drain(
+    q: queue.SimpleQueue[BufferItem | None],
+    max_items: int,
+    timeout: float,
+) -> tuple[list[BufferItem], bool]:
+    """Collect up to ``max_items`` queued items.
+
+    Blocks for the first item, then waits at most ``timeout`` for the rest
+    of a burst. Returns the batch and whether the stop sentinel was seen.
+    """
+    first = q.get()
+    if first is None:
+        return [], True
+    batch = [first]
+    deadline = time.monotonic() + timeout
+    while len(batch) < max_items:
+        remaining = deadline - time.monotonic()
+        try:
+            item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+        except queue.Empty:
+            break
+        if item is None:
+            return batch, True
+        batch.append(item)
+    return batch, False
 
 
 def _latest_tree_mtime(path: Path | None) -> float | None:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -12,6 +15,7 @@ from engram.config import (
     ConfigError,
     _deep_merge,
     _validate,
+    clear_config_cache,
     load_config,
     resolve_doc_paths,
 )
@@ -150,6 +154,45 @@ class TestLoadConfig:
             load_config(tmp_path)
 
 
+class TestConfigCache:
+    def test_edited_config_reloaded(self, project_dir: Path) -> None:
+        load_config(project_dir)
+        config_path = project_dir / ".engram" / "config.yaml"
+        raw = yaml.safe_load(config_path.read_text())
+        raw["model"] = "opus"
+        config_path.write_text(yaml.dump(raw))
+
+        assert load_config(project_dir)["model"] == "opus"
+
+    def test_merged_config_memoized_as_copies(self, project_dir: Path) -> None:
+        first = load_config(project_dir)
+        first["living_docs"]["timeline"] = "mutated.md"
+
+        with patch("engram.config.yaml.load") as mock_yaml:
+            second = load_config(project_dir)
+        mock_yaml.assert_not_called()
+        assert second["living_docs"]["timeline"] == "docs/timeline.md"
+
+        clear_config_cache()
+        with patch("engram.config.yaml.load", wraps=yaml.load) as mock_yaml:
+            load_config(project_dir)
+        mock_yaml.assert_called_once()
+
+    def test_single_deepcopy_per_load(self, project_dir: Path) -> None:
+        load_config(project_dir)
+        with patch("engram.config.copy.deepcopy", wraps=copy.deepcopy) as mock_copy:
+            load_config(project_dir)
+        mock_copy.assert_called_once()
+
+    def test_yaml_only_types_preserved(self, project_dir: Path) -> None:
+        config_path = project_dir / ".engram" / "config.yaml"
+        config_path.write_text(config_path.read_text() + "project_start: 2026-01-01\n")
+
+        loaded = load_config(project_dir)
+        assert loaded["project_start"] == date(2026, 1, 1)
+        assert sorted(p.name for p in config_path.parent.iterdir()) == ["config.yaml"]
+
+
 class TestResolveDocPaths:
     def test_resolves_all_paths(self, project_dir: Path) -> None:
         config = load_config(project_dir)
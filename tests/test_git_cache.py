@@ -0,0 +1,64 @@
+"""Tests for engram.fold.git_cache."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from engram.fold.git_cache import ensure_commit_graph
+
+
+def _init_repo(root: Path) -> None:
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@test.com",
+         "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=root, check=True,
+    )
+
+
+class TestEnsureCommitGraph:
+    def test_skips_non_git_dir(self, tmp_path: Path) -> None:
+        assert ensure_commit_graph(tmp_path) is False
+
+    def test_writes_graph_when_missing(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        assert ensure_commit_graph(tmp_path) is True
+        assert (tmp_path / ".git" / "objects" / "info" / "commit-graph").exists()
+
+    def test_fresh_graph_not_rewritten(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        assert ensure_commit_graph(tmp_path) is True
+        assert ensure_commit_graph(tmp_path) is False
+        assert ensure_commit_graph(tmp_path, max_age=0) is True
+
+    def test_fresh_graph_without_bloom_filters_rewritten(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        # What gc/maintenance leave behind: a fresh graph with no Bloom data
+        subprocess.run(["git", "commit-graph", "write", "--reachable"], cwd=tmp_path, check=True)
+        graph = tmp_path / ".git" / "objects" / "info" / "commit-graph"
+        assert b"BDAT" not in graph.read_bytes()
+
+        assert ensure_commit_graph(tmp_path) is True
+        assert b"BDAT" in graph.read_bytes()
+        assert ensure_commit_graph(tmp_path) is False
+
+    def test_split_graph_with_bloom_filters_is_fresh(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        subprocess.run(
+            ["git", "commit-graph", "write", "--reachable", "--split", "--changed-paths"],
+            cwd=tmp_path, check=True,
+        )
+        assert ensure_commit_graph(tmp_path) is False
+
+    def test_timeout_skips_and_logs(self, tmp_path: Path, caplog) -> None:
+        _init_repo(tmp_path)
+        timeout = subprocess.TimeoutExpired(["git", "commit-graph"], 1)
+        with (
+            patch("engram.fold.git_cache.subprocess.run", side_effect=timeout),
+            caplog.at_level(logging.INFO, logger="engram.fold.git_cache"),
+        ):
+            assert ensure_commit_graph(tmp_path, timeout=1) is False
+        assert "timed out" in caplog.text
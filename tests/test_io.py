@@ -0,0 +1,36 @@
+"""Tests for engram._io."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from engram import _io
+
+
+class TestWriteBytes:
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.json"
+        path.write_bytes(b"old contents that are longer")
+        _io.write_bytes(path, b"new")
+        assert path.read_bytes() == b"new"
+
+    def test_retries_short_writes(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.bin"
+        real_write = os.write
+
+        def short_write(fd: int, data) -> int:
+            return real_write(fd, data[:3])
+
+        with patch("engram._io.os.write", side_effect=short_write) as mock:
+            _io.write_bytes(path, b"0123456789")
+        assert path.read_bytes() == b"0123456789"
+        assert mock.call_count == 4
+
+    def test_large_payload_written_in_slices(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.bin"
+        data = b"x" * 10
+        with patch.object(_io, "WRITE_CHUNK_BYTES", 4):
+            _io.write_bytes(path, data)
+        assert path.read_bytes() == data
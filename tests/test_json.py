@@ -0,0 +1,40 @@
+"""Tests for engram._json."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from engram import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    if request.param == "orjson" and _json.orjson is None:
+        pytest.skip("orjson not installed")
+    if request.param == "stdlib":
+        with patch.object(_json, "orjson", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestJsonHelpers:
+    def test_dumps_returns_bytes(self, backend: str) -> None:
+        out = _json.dumps({"a": 1, "b": "é"})
+        assert isinstance(out, bytes)
+        assert json.loads(out) == {"a": 1, "b": "é"}
+
+    def test_dumps_indent(self, backend: str) -> None:
+        out = _json.dumps({"a": 1}, indent=True)
+        assert out.splitlines()[1] == b'  "a": 1'
+
+    def test_loads_bytes_and_str(self, backend: str) -> None:
+        assert _json.loads(b'{"x": [1, 2]}') == {"x": [1, 2]}
+        assert _json.loads('{"x": null}') == {"x": None}
+
+    def test_loads_raises_stdlib_decode_error(self, backend: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"{not json")
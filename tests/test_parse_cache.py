@@ -0,0 +1,26 @@
+"""Tests for engram.fold._parse_cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from engram.fold._parse_cache import decode_jsonl_lines, iter_jsonl_lines
+
+
+class TestJsonlLines:
+    def test_skips_malformed_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.jsonl"
+        path.write_text('{"a": 1}\nnot json\n\n{"b": 2}\n')
+
+        with open(path, "rb") as fh:
+            records = list(decode_jsonl_lines(iter_jsonl_lines(fh, 0, os.path.getsize(path))))
+        assert records == [{"a": 1}, {"b": 2}]
+
+    def test_reads_only_requested_range(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.jsonl"
+        path.write_text('{"a": 1}\n{"b": 2}\n{"c": 3}')
+
+        with open(path, "rb") as fh:
+            lines = list(iter_jsonl_lines(fh, 9, 18))
+        assert lines == [b'{"b": 2}']
@@ -7,6 +7,7 @@ import os
 import subprocess
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -14,6 +15,7 @@ import yaml
 
 from engram.config import DEFAULTS, _deep_merge
 from engram.fold.queue import REVISIT_THRESHOLD_DAYS, build_queue, refresh_issue_snapshots
+from engram.fold.sources import get_doc_git_dates_batch
 
 
 @pytest.fixture
@@ -68,9 +70,21 @@ def _make_config(project: Path, overrides: dict | None = None) -> dict:
     return _deep_merge(DEFAULTS, base)
 
 
+def _git(project: Path, *args: str, date: str | None = None) -> None:
+    """Run git in ``project`` with a fixed identity and optional commit date."""
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "t@example.com",
+        "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "t@example.com",
+    }
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    subprocess.run(["git", *args], cwd=project, check=True, capture_output=True, env=env)
+
+
 def _mock_git_run(cmd, **kwargs):
     """Mock subprocess.run for git commands — returns empty/no-op."""
-    return type("Result", (), {"stdout": "\n", "returncode": 0})()
+    return SimpleNamespace(stdout=b"\n", returncode=0)
 
 
 class TestBuildQueueDocs:
@@ -109,16 +123,14 @@ class TestBuildQueueDocs:
         # Mock git: created Jan 1, modified Feb 15 (>7 days apart)
         def mock_run(cmd, **kwargs):
             if "--diff-filter=A" in cmd:
-                return type("R", (), {
-                    "stdout": "2026-01-01T00:00:00-06:00\nfile.md\n",
-                    "returncode": 0,
-                })()
+                return SimpleNamespace(
+                    stdout=b"2026-01-01T00:00:00-06:00\nfile.md\n", returncode=0,
+                )
             elif "-1" in cmd:
-                return type("R", (), {
-                    "stdout": "2026-02-15T00:00:00-06:00\n",
-                    "returncode": 0,
-                })()
-            return type("R", (), {"stdout": "\n", "returncode": 0})()
+                return SimpleNamespace(
+                    stdout=b"2026-02-15T00:00:00-06:00\n", returncode=0,
+                )
+            return SimpleNamespace(stdout=b"\n", returncode=0)
 
         config = _make_config(project)
 
@@ -298,6 +310,30 @@ class TestBuildQueueSorting:
         assert dates == sorted(dates)
 
 
+class TestBuildQueueSequentialFallback:
+    def test_sequential_matches_parallel(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        issue = {
+            "number": 1, "title": "Early", "body": "First",
+            "createdAt": "2026-01-01T00:00:00Z",
+            "state": "OPEN", "labels": [], "comments": [],
+        }
+        (project / "issues" / "1.json").write_text(json.dumps(issue))
+        doc = project / "docs" / "working" / "later.md"
+        doc.write_text("**Date:** 2026-02-01\n\nLater content.")
+
+        config = _make_config(project)
+
+        with patch("engram.fold.sources.subprocess.run", side_effect=_mock_git_run):
+            parallel = build_queue(config, project)
+            monkeypatch.setenv("ENGRAM_SEQUENTIAL", "1")
+            sequential = build_queue(config, project)
+
+        assert sequential == parallel
+        assert [e["type"] for e in parallel] == ["issue", "doc"]
+
+
 class TestBuildQueueOutput:
     def test_writes_jsonl(self, project: Path) -> None:
         issue = {
@@ -455,15 +491,34 @@ class TestBuildQueueStartDate:
             }
             (project / "issues" / f"{num}.json").write_text(json.dumps(issue))
 
-        config = _make_config(project)
+        # One pre-cutoff session: sized, but never queued or written
+        history = project.parent / "history.jsonl"
+        history.write_text(json.dumps({
+            "sessionId": "old-session",
+            "project": "/path/to/project",
+            "display": "Old session content that predates the cutoff",
+            "timestamp": 1704067200000,  # 2024-01-01T00:00:00Z (ms)
+        }) + "\n")
+
+        config = _make_config(project, {
+            "sources": {
+                "sessions": {
+                    "path": str(history),
+                    "project_match": ["project"],
+                },
+            },
+        })
 
         with patch("engram.fold.sources.subprocess.run", side_effect=_mock_git_run):
-            build_queue(config, project, start_date="2026-01-01")
+            entries = build_queue(config, project, start_date="2026-01-01")
 
         sizes_file = project / ".engram" / "item_sizes.json"
         sizes = json.loads(sizes_file.read_text())
-        # Both issues should appear in sizes even though one is filtered
-        assert len(sizes) == 2
+        # Both issues and the old session appear in sizes even though filtered
+        assert len(sizes) == 3
+        assert ".engram/sessions/old-session.md" in sizes
+        assert all(e["type"] != "prompts" for e in entries)
+        assert not (project / ".engram" / "sessions" / "old-session.md").exists()
 
     def test_session_files_only_for_surviving_entries(self, project: Path) -> None:
         """Session .md files are only written for entries that survive the filter."""
@@ -572,3 +627,119 @@ class TestGitTrackedDocDiscovery:
 
         doc_paths = [e["path"] for e in entries if e["type"] == "doc"]
         assert doc_paths == ["docs/working/tracked.md"]
+
+
+class TestCommitGraphOptIn:
+    def test_not_written_by_default(self, project: Path) -> None:
+        config = _make_config(project)
+
+        with (
+            patch("engram.fold.queue.ensure_commit_graph") as ensure,
+            patch("engram.fold.sources.subprocess.run", side_effect=_mock_git_run),
+        ):
+            build_queue(config, project)
+        ensure.assert_not_called()
+
+    def test_written_when_enabled(self, project: Path) -> None:
+        config = _make_config(project, {"sources": {"git_commit_graph": True}})
+
+        with (
+            patch("engram.fold.queue.ensure_commit_graph") as ensure,
+            patch("engram.fold.sources.subprocess.run", side_effect=_mock_git_run),
+        ):
+            build_queue(config, project)
+        ensure.assert_called_once_with(project)
+
+
+class TestDocDatesCache:
+    def test_cache_reused_until_doc_commits(self, project: Path) -> None:
+        stable = project / "docs" / "working" / "stable.md"
+        edited = project / "docs" / "working" / "edited.md"
+        stable.write_text("Stable content.")
+        edited.write_text("First draft.")
+        config = _make_config(project)
+
+        _git(project, "init", "-q")
+        _git(project, "add", "docs")
+        _git(project, "commit", "-qm", "docs", date="2024-01-01T00:00:00+00:00")
+        first = build_queue(config, project)
+
+        with patch(
+            "engram.fold.queue.get_doc_git_dates_batch", wraps=get_doc_git_dates_batch,
+        ) as batch:
+            assert build_queue(config, project) == first  # Same HEAD
+            batch.assert_not_called()
+
+            # An unrelated commit keeps every cached doc
+            (project / "README.md").write_text("readme")
+            _git(project, "add", "README.md")
+            _git(project, "commit", "-qm", "readme", date="2024-02-01T00:00:00+00:00")
+            build_queue(config, project)
+            batch.assert_not_called()
+
+            # Only the doc touched since the cached HEAD is re-resolved
+            edited.write_text("Second draft.")
+            _git(project, "commit", "-qam", "edit", date="2025-01-01T00:00:00+00:00")
+            build_queue(config, project)
+            assert [list(call.args[0]) for call in batch.call_args_list] == [[edited]]
+
+        cache = json.loads((project / ".engram" / "doc_dates.cache.json").read_text())
+        assert cache["docs"]["docs/working/edited.md"]["modified"] == "2025-01-01T00:00:00+00:00"
+        assert cache["docs"]["docs/working/stable.md"]["modified"] == "2024-01-01T00:00:00+00:00"
+
+    def test_rewritten_history_drops_cache(self, project: Path) -> None:
+        doc = project / "docs" / "working" / "doc.md"
+        doc.write_text("First draft.")
+        config = _make_config(project)
+
+        _git(project, "init", "-q")
+        _git(project, "add", "docs")
+        _git(project, "commit", "-qm", "draft", date="2024-01-01T00:00:00+00:00")
+        doc.write_text("Second draft.")
+        _git(project, "commit", "-qam", "revise", date="2025-01-01T00:00:00+00:00")
+        build_queue(config, project)
+
+        _git(project, "reset", "-q", "--hard", "HEAD~1")
+        entries = build_queue(config, project)
+
+        assert not [e for e in entries if e["type"] == "doc" and e["pass"] == "revisit"]
+
+    def test_staged_edit_does_not_pin_stale_dates(self, project: Path) -> None:
+        doc = project / "docs" / "working" / "evolving.md"
+        doc.write_text("First draft.")
+        config = _make_config(project)
+
+        _git(project, "init", "-q")
+        _git(project, "add", "docs/working/evolving.md")
+        _git(project, "commit", "-qm", "draft", date="2024-01-01T00:00:00+00:00")
+
+        # Stage an edit and build before committing it
+        doc.write_text("Second draft.")
+        _git(project, "add", "docs/working/evolving.md")
+        build_queue(config, project)
+
+        _git(project, "commit", "-qm", "revise", date="2025-06-01T00:00:00+00:00")
+        entries = build_queue(config, project)
+
+        revisits = [e for e in entries if e["type"] == "doc" and e["pass"] == "revisit"]
+        assert [e["date"] for e in revisits] == ["2025-06-01T00:00:00+00:00"]
+
+    def test_reverted_blob_picks_up_new_modified_date(self, project: Path) -> None:
+        doc = project / "docs" / "working" / "reverted.md"
+        doc.write_text("Version A.")
+        config = _make_config(project)
+
+        _git(project, "init", "-q")
+        _git(project, "add", "docs/working/reverted.md")
+        _git(project, "commit", "-qm", "A", date="2024-01-01T00:00:00+00:00")
+        build_queue(config, project)
+
+        # A -> B -> A with no build in between: same HEAD blob as cached
+        doc.write_text("Version B.")
+        _git(project, "commit", "-qam", "B", date="2024-06-01T00:00:00+00:00")
+        doc.write_text("Version A.")
+        _git(project, "commit", "-qam", "back to A", date="2025-01-01T00:00:00+00:00")
+        entries = build_queue(config, project)
+
+        revisits = [e for e in entries if e["type"] == "doc" and e["pass"] == "revisit"]
+        assert [e["date"] for e in revisits] == ["2025-01-01T00:00:00+00:00"]
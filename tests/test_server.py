@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import subprocess
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from click.testing import CliRunner
 
 from engram.server.db import DISPATCH_STATES, TERMINAL_STATES, ServerDB
+from engram.server.dispatcher import Dispatcher
 
 
 # ------------------------------------------------------------------
@@ -31,6 +36,17 @@ def db(db_path: Path) -> ServerDB:
 @pytest.fixture()
 def project(tmp_path: Path) -> Path:
     """Set up a minimal engram project."""
+    return _make_project(tmp_path)
+
+
+@pytest.fixture()
+def project_str(project: Path) -> str:
+    """``project`` as the string passed to CLI ``--project-root``."""
+    return str(project)
+
+
+def _make_project(tmp_path: Path) -> Path:
+    """Lay out a minimal engram project (config + living docs) under ``tmp_path``."""
     engram_dir = tmp_path / ".engram"
     engram_dir.mkdir()
 
@@ -71,12 +87,32 @@ budget:
     return tmp_path
 
 
+@pytest.fixture(scope="class")
+def project_with_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project with an initialised ServerDB, shared by one test class."""
+    project = _make_project(tmp_path_factory.mktemp("project"))
+    ServerDB(project / ".engram" / "engram.db").close()
+    return project
+
+
+@pytest.fixture(scope="class")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
 @pytest.fixture()
 def config(project: Path) -> dict:
     from engram.config import load_config
     return load_config(project)
 
 
+@pytest.fixture()
+def dispatcher_and_db(project: Path, config: dict) -> tuple[Dispatcher, ServerDB]:
+    """A Dispatcher wired to the project's ServerDB."""
+    db = ServerDB(project / ".engram" / "engram.db")
+    return Dispatcher(config, project, db), db
+
+
 # ==================================================================
 # ServerDB Tests
 # ==================================================================
@@ -122,6 +158,118 @@ class TestServerDBInit:
         conn.close()
         assert "id_counters" not in tables
 
+    def test_connection_pragmas(self, db: ServerDB) -> None:
+        conn = db._connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1, MEMORY == 2
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+    def test_connection_reused_per_thread(self, db: ServerDB) -> None:
+        import threading
+
+        conn = db._connect()
+        assert db._connect() is conn
+        assert conn.isolation_level is None
+
+        other: list[sqlite3.Connection] = []
+        t = threading.Thread(target=lambda: other.append(db._connect()))
+        t.start()
+        t.join()
+        assert other[0] is not conn
+
+        db.close()
+        assert db._connect() is not conn
+        assert db.get_buffer_items() == []
+
+    def test_close_closes_every_thread_connection(self, db: ServerDB) -> None:
+        import threading
+
+        conn = db._connect()
+        opened, closed, done = threading.Event(), threading.Event(), threading.Event()
+        conns: list[sqlite3.Connection] = []
+
+        def worker() -> None:
+            conns.append(db._connect())
+            opened.set()
+            closed.wait(5)
+            # Closed under this live thread: the next call reopens
+            conns.append(db._connect())
+            db.close_thread()
+            done.set()
+
+        t = threading.Thread(target=worker)
+        t.start()
+        opened.wait(5)
+        db.close()
+        for stale in (conn, conns[0]):
+            with pytest.raises(sqlite3.ProgrammingError):
+                stale.execute("SELECT 1")
+        closed.set()
+        t.join()
+
+        assert done.is_set()
+        assert conns[1] is not conns[0]
+        with pytest.raises(sqlite3.ProgrammingError):
+            conns[1].execute("SELECT 1")
+        assert db._conns == []
+
+    def test_close_thread_keeps_other_connections(self, db: ServerDB) -> None:
+        import threading
+
+        conn = db._connect()
+        t = threading.Thread(target=lambda: (db.get_buffer_chars(), db.close_thread()))
+        t.start()
+        t.join()
+
+        assert db._conns == [conn]
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_hot_queries_use_indexes(self, db: ServerDB) -> None:
+        conn = db._connect()
+
+        def plan(sql: str, params: tuple = ()) -> str:
+            return " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        assert "COVERING INDEX idx_buffer_items_path" in plan(
+            "SELECT 1 FROM buffer_items WHERE path = ? LIMIT 1", ("a.md",),
+        )
+        assert "COVERING INDEX idx_buffer_items_path" in plan(
+            "SELECT path FROM buffer_items WHERE path IN (?, ?)", ("a.md", "b.md"),
+        )
+        assert "idx_buffer_items_date" in plan("SELECT * FROM buffer_items ORDER BY date, id")
+        assert "idx_dispatches_active" in plan(
+            "SELECT * FROM dispatches"
+            " WHERE state IN ('building', 'dispatched', 'validated') ORDER BY id"
+        )
+
+    def test_wal_persists_for_plain_connections(self, db: ServerDB, db_path: Path) -> None:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_failed_commit_rolls_back(self, db: ServerDB) -> None:
+        conn = db._connect()
+        # A deferred FK violation makes COMMIT itself fail
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            "CREATE TABLE child (parent_id INTEGER"
+            " REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with db._transaction() as tx:
+                tx.execute("INSERT INTO child VALUES (1)")
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM child").fetchone()[0] == 0
+        db.add_buffer_item("a.md", "doc", 10)
+        assert db.count_buffer_items() == 1
+
 
 class TestBufferItems:
     def test_add_and_get(self, db: ServerDB) -> None:
@@ -161,14 +309,69 @@ class TestBufferItems:
         assert len(remaining) == 1
         assert remaining[0]["path"] == "b.md"
 
+    def test_consume_buffer_without_returning(self, db: ServerDB) -> None:
+        ids = [db.add_buffer_item(f"{n}.md", "doc", 10) for n in range(3)]
+        with patch("engram.server.db._HAS_RETURNING", False):
+            consumed = db.consume_buffer(ids[:2])
+        assert [c["path"] for c in consumed] == ["0.md", "1.md"]
+        assert [i["path"] for i in db.get_buffer_items()] == ["2.md"]
+        assert db.get_buffer_chars() == 10
+
+    def test_consume_buffer_chunks_large_id_lists(self, db: ServerDB) -> None:
+        ids = [db.add_buffer_item(f"{n}.md", "doc", 10) for n in range(6)]
+        with patch("engram.server.db._IN_CHUNK", 2):
+            consumed = db.consume_buffer(ids[:5])
+        assert [c["id"] for c in consumed] == ids[:5]
+        assert [i["path"] for i in db.get_buffer_items()] == ["5.md"]
+        assert db.get_buffer_chars() == 10
+
     def test_consume_empty_list(self, db: ServerDB) -> None:
         assert db.consume_buffer([]) == []
 
+    def test_buffer_rows_are_sqlite_rows(self, db: ServerDB) -> None:
+        item_id = db.add_buffer_item("a.md", "doc", 100)
+        (item,) = db.get_buffer_items()
+        assert isinstance(item, sqlite3.Row)
+        assert item["path"] == "a.md"
+        assert dict(item)["chars"] == 100
+        (consumed,) = db.consume_buffer([item_id])
+        assert isinstance(consumed, sqlite3.Row)
+        assert consumed["id"] == item_id
+
     def test_has_buffer_item(self, db: ServerDB) -> None:
         assert not db.has_buffer_item("test.md")
         db.add_buffer_item("test.md", "doc", 50)
         assert db.has_buffer_item("test.md")
 
+    def test_buffered_paths(self, db: ServerDB) -> None:
+        assert db.buffered_paths([]) == set()
+        db.add_buffer_item("a.md", "doc", 1)
+        db.add_buffer_item("c.md", "doc", 1)
+        with patch("engram.server.db._IN_CHUNK", 2):
+            found = db.buffered_paths(["a.md", "b.md", "c.md", "a.md", "d.md"])
+        assert found == {"a.md", "c.md"}
+
+    def test_add_buffer_items_batch(self, db: ServerDB) -> None:
+        count = db.add_buffer_items([
+            ("a.md", "doc", 100, "2025-01-01", None),
+            ("s.md", "prompts", 50, None, '{"prompt_count": 2}'),
+        ])
+        assert count == 2
+        assert db.get_buffer_chars() == 150
+        items = db.get_buffer_items()
+        assert {i["path"] for i in items} == {"a.md", "s.md"}
+        assert db.add_buffer_items([]) == 0
+
+    def test_iter_and_count_buffer_items(self, db: ServerDB) -> None:
+        with patch("engram.server.db._FETCH_CHUNK", 2):
+            db.add_buffer_items([
+                (f"{n}.md", "doc", 1, f"2025-01-0{5 - n}", None) for n in range(5)
+            ])
+            assert [i["path"] for i in db.iter_buffer_items()] == [
+                "4.md", "3.md", "2.md", "1.md", "0.md",
+            ]
+        assert db.count_buffer_items() == 5
+
     def test_items_ordered_by_date(self, db: ServerDB) -> None:
         db.add_buffer_item("c.md", "doc", 100, "2025-03-01")
         db.add_buffer_item("a.md", "doc", 100, "2025-01-01")
@@ -204,6 +407,23 @@ class TestDispatches:
         d = db.get_dispatch(did)
         assert d["retry_count"] == 2
 
+    def test_increment_retry_releases_write_lock(self, db: ServerDB, db_path: Path) -> None:
+        did = db.create_dispatch(chunk_id=1)
+        db.increment_retry(did)
+        other = sqlite3.connect(str(db_path), timeout=0)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+        finally:
+            other.close()
+
+    def test_increment_retry_without_returning(self, db: ServerDB) -> None:
+        did = db.create_dispatch(chunk_id=1)
+        with patch("engram.server.db._HAS_RETURNING", False):
+            assert db.increment_retry(did) == 1
+        assert db.increment_retry(did) == 2
+        assert db.increment_retry(999) == 0
+
     def test_dispatch_with_error(self, db: ServerDB) -> None:
         did = db.create_dispatch(chunk_id=1)
         db.update_dispatch_state(did, "dispatched", error="Lint failed")
@@ -260,12 +480,33 @@ class TestServerState:
         with pytest.raises(ValueError, match="Invalid server_state keys"):
             db.update_server_state(bogus="value")
 
+    def test_invalid_keys_reported_sorted(self, db: ServerDB) -> None:
+        with pytest.raises(ValueError, match=r"\['alpha', 'zeta'\]"):
+            db.update_server_state(zeta=1, last_poll_time="x", alpha=2)
+        assert db.get_server_state().get("last_poll_time") is None
+
     def test_update_buffer_chars(self, db: ServerDB) -> None:
         db.update_server_state(buffer_chars_total=42)
         state = db.get_server_state()
         assert state["buffer_chars_total"] == 42
 
-    def test_session_mtime(self, db: ServerDB) -> None:
+    def test_session_mtime_ns_round_trip(self, db_path: Path, tmp_path: Path) -> None:
+        history = tmp_path / "history.jsonl"
+        history.write_text("{}\n")
+        # Odd ns component: not exactly representable as a float
+        os.utime(history, ns=(1_760_000_000_123_456_789, 1_760_000_000_123_456_789))
+        mtime_ns = history.stat().st_mtime_ns
+        assert int(float(mtime_ns)) != mtime_ns
+
+        with ServerDB(db_path) as db:
+            db.update_server_state(last_session_mtime_ns=mtime_ns)
+        with ServerDB(db_path) as db:
+            restored = db.get_server_state()["last_session_mtime_ns"]
+
+        assert isinstance(restored, int)
+        assert restored == history.stat().st_mtime_ns
+
+    def test_legacy_session_mtime_seconds(self, db: ServerDB) -> None:
         db.update_server_state(last_session_mtime=1234567890.5)
         state = db.get_server_state()
         assert state["last_session_mtime"] == 1234567890.5
@@ -279,6 +520,20 @@ class TestServerState:
         assert state["last_session_offset"] == 2048
         assert state["last_session_tree_mtime"] == 1234567891.25
 
+    def test_rewrite_after_other_instance_write(self, db_path: Path) -> None:
+        first = ServerDB(db_path)
+        second = ServerDB(db_path)
+        first.update_server_state(last_session_offset=10)
+        second.update_server_state(last_session_offset=20)
+        first.update_server_state(last_session_offset=10)
+        assert second.get_server_state()["last_session_offset"] == 10
+
+    def test_buffer_chars_always_written(self, db: ServerDB) -> None:
+        db.update_server_state(buffer_chars_total=0)
+        db.add_buffer_item("a.md", "doc", 100)
+        db.update_server_state(buffer_chars_total=0)
+        assert db.get_buffer_chars() == 0
+
 
 class TestCrashRecovery:
     def test_building_dispatches_discarded(self, db: ServerDB) -> None:
@@ -294,6 +549,19 @@ class TestCrashRecovery:
         # building record should be gone
         assert db.get_dispatch(d1) is None
 
+    def test_recovery_discards_builds_in_one_transaction(self, db: ServerDB) -> None:
+        for chunk_id in range(3):
+            db.create_dispatch(chunk_id=chunk_id)
+        d = db.create_dispatch(chunk_id=9)
+        db.update_dispatch_state(d, "validated")
+
+        conn = db._connect()
+        before = conn.total_changes
+        stale = db.recover_on_startup()
+        assert [r["id"] for r in stale] == [d]
+        assert conn.total_changes == before + 3
+        assert conn.in_transaction is False
+
     def test_no_stale_dispatches(self, db: ServerDB) -> None:
         d1 = db.create_dispatch(chunk_id=1)
         db.update_dispatch_state(d1, "committed")
@@ -396,6 +664,61 @@ class TestFileWatcher:
         assert len(received) == 1
         assert received[0][1] == "issue"
 
+    def test_handler_ignores_paths_outside_project(self, project: Path) -> None:
+        from engram.server.watcher import _DocEventHandler
+
+        received: list[tuple] = []
+        handler = _DocEventHandler(lambda *args: received.append(args), project)
+
+        from watchdog.events import FileCreatedEvent
+        handler.on_created(FileCreatedEvent(str(project.parent / "elsewhere.md")))
+        handler.on_created(FileCreatedEvent(str(project / "docs" / ".hidden" / "a.md")))
+        handler.on_created(FileCreatedEvent(str(project / "docs" / "NOTES.MD")))
+        assert [r[:2] for r in received] == [("docs/NOTES.MD", "doc")]
+
+    def test_handler_batches_events_through_drain_thread(self, project: Path) -> None:
+        from engram.server.watcher import _DocEventHandler
+
+        batches: list[list[tuple]] = []
+        handler = _DocEventHandler(
+            lambda *args: pytest.fail("per-event callback used"),
+            project,
+            batch_callback=batches.append,
+        )
+
+        from watchdog.events import FileCreatedEvent
+        docs = project / "docs" / "working"
+        for i in range(5):
+            handler.on_created(FileCreatedEvent(str(docs / f"note{i}.md")))
+        # Nothing is delivered on the observer thread itself
+        assert batches == []
+
+        handler.start_drain()
+        handler.stop_drain()
+        assert [item[0] for batch in batches for item in batch] == [
+            f"docs/working/note{i}.md" for i in range(5)
+        ]
+        assert len(batches) == 1
+
+    def test_drain_thread_releases_db_connection(self, project: Path, db: ServerDB) -> None:
+        from watchdog.events import FileCreatedEvent
+
+        from engram.server.watcher import _DocEventHandler
+
+        handler = _DocEventHandler(
+            lambda *args: None,
+            project,
+            batch_callback=db.add_buffer_items,
+            on_drain_exit=db.close_thread,
+        )
+        main_conn = db._connect()
+        handler.start_drain()
+        handler.on_created(FileCreatedEvent(str(project / "docs" / "working" / "a.md")))
+        handler.stop_drain()
+
+        assert db.count_buffer_items() == 1
+        assert db._conns == [main_conn]
+
 
 class TestSessionPoller:
     def test_poll_detects_new_sessions(self, tmp_path: Path) -> None:
@@ -431,6 +754,34 @@ class TestSessionPoller:
         assert len(received) == 1
         assert received[0][1] == "prompts"
 
+    def test_poll_uses_batch_callback(self, tmp_path: Path) -> None:
+        from engram.server.watcher import SessionPoller
+
+        history = tmp_path / "history.jsonl"
+        now_ms = int(time.time() * 1000)
+        history.write_text("".join(
+            json.dumps({
+                "sessionId": sid,
+                "project": "/path/to/my-project",
+                "display": "This is a long enough prompt for testing purposes",
+                "timestamp": now_ms,
+            }) + "\n"
+            for sid in ("sess1", "sess2")
+        ))
+        config = {"sources": {"sessions": {"format": "claude-code", "path": str(history)}}}
+
+        batches: list[list[tuple]] = []
+
+        def cb(*args):
+            raise AssertionError("per-item callback should not be used")
+
+        poller = SessionPoller(config, cb, batch_callback=batches.append)
+        assert poller.poll() == 2
+        assert len(batches) == 1
+        assert sorted(item[0] for item in batches[0]) == [
+            ".engram/sessions/sess1.md", ".engram/sessions/sess2.md",
+        ]
+
     def test_poll_no_change(self, tmp_path: Path) -> None:
         from engram.server.watcher import SessionPoller
 
@@ -453,6 +804,20 @@ class TestSessionPoller:
         poller = SessionPoller(config, cb)
         poller.poll()  # first poll establishes mtime
         assert poller.poll() == 0  # no change
+        assert poller.get_last_mtime() == history.stat().st_mtime_ns
+
+    def test_set_last_mtime_accepts_legacy_seconds(self, tmp_path: Path) -> None:
+        from engram.server.watcher import SessionPoller
+
+        config = {"sources": {"sessions": {"path": str(tmp_path / "h.jsonl")}}}
+        poller = SessionPoller(config, lambda *args: None)
+
+        poller.set_last_mtime(1234567890.5)
+        assert poller.get_last_mtime() == 1_234_567_890_500_000_000
+        poller.set_last_mtime(1_234_567_890_500_000_000.0)  # ns read back from REAL
+        assert poller.get_last_mtime() == 1_234_567_890_500_000_000
+        poller.set_last_mtime(None)
+        assert poller.get_last_mtime() is None
 
     def test_poll_missing_file(self, tmp_path: Path) -> None:
         from engram.server.watcher import SessionPoller
@@ -553,6 +918,22 @@ class TestSessionPoller:
         assert received[0][0] == ".engram/sessions/sess1.md"
         assert received[0][2] == session_file.stat().st_size
 
+    def test_session_file_appends_utf8_and_reports_size(self, tmp_path: Path) -> None:
+        from engram.server.watcher import SessionPoller
+
+        project_root = tmp_path / "proj"
+        project_root.mkdir()
+        poller = SessionPoller({}, lambda *args: None, project_root=project_root)
+        (project_root / ".engram" / "sessions").mkdir(parents=True)
+
+        _, first = poller._write_session_file("s", "héllo", reset=True, chars=0)
+        rel_path, total = poller._write_session_file("s", "wörld", reset=False, chars=0)
+
+        session_file = project_root / rel_path
+        assert session_file.read_text(encoding="utf-8") == "héllo\nwörld"
+        assert first == len("héllo".encode())
+        assert total == session_file.stat().st_size
+
     def test_codex_tree_change_can_unlock_project_match(self, tmp_path: Path) -> None:
         from engram.server.watcher import SessionPoller
 
@@ -671,6 +1052,72 @@ class TestGitPoller:
             assert commits == ["new_def"]
             assert poller.get_last_commit() == "new_def"
 
+    def test_head_resolved_without_subprocess(self, tmp_path: Path) -> None:
+        from engram.server.watcher import GitPoller
+
+        head = "a" * 40
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text(head + "\n")
+
+        poller = GitPoller(tmp_path, lambda *args: None)
+        poller.set_last_commit(head)
+        with patch("engram.server.watcher.subprocess.run") as mock_run:
+            assert poller.poll() == []
+        mock_run.assert_not_called()
+
+    def test_head_resolved_from_packed_refs(self, tmp_path: Path) -> None:
+        from engram.server.watcher import _read_head
+
+        head = "b" * 40
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{'c' * 40} refs/heads/other\n"
+            f"{head} refs/heads/main\n"
+        )
+        assert _read_head(tmp_path) == head
+
+        # Worktree-style .git files fall back to git rev-parse
+        (tmp_path / "wt").mkdir()
+        (tmp_path / "wt" / ".git").write_text("gitdir: ../.git/worktrees/wt\n")
+        assert _read_head(tmp_path / "wt") is None
+
+    def test_worktree_head_uses_one_cat_file_process(self, tmp_path: Path) -> None:
+        from engram.server.watcher import GitPoller
+
+        main = tmp_path / "main"
+        main.mkdir()
+
+        def git(*args: str, cwd: Path = main) -> str:
+            return subprocess.run(
+                ["git", *args], cwd=cwd, check=True, capture_output=True, text=True,
+            ).stdout.strip()
+
+        git("init")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        git("commit", "--allow-empty", "-m", "first")
+        worktree = tmp_path / "wt"
+        git("worktree", "add", str(worktree))
+
+        poller = GitPoller(worktree, lambda *args: None)
+        try:
+            assert poller.poll() == []
+            proc = poller._head_reader
+            assert proc is not None
+            assert poller.get_last_commit() == git("rev-parse", "HEAD", cwd=worktree)
+
+            git("commit", "--allow-empty", "-m", "second", cwd=worktree)
+            assert poller.poll() == [git("rev-parse", "HEAD", cwd=worktree)]
+            assert poller._head_reader is proc
+        finally:
+            poller.close()
+        assert proc.returncode is not None
+
 
 # ==================================================================
 # ContextBuffer Tests
@@ -698,6 +1145,22 @@ class TestContextBuffer:
         assert buffer.add_item("docs/spec.md", "doc", 100) is False
         assert len(buffer.get_items()) == 1
 
+    def test_add_items_skips_duplicates(self, project: Path, config: dict) -> None:
+        from engram.server.buffer import ContextBuffer
+
+        db = ServerDB(project / ".engram" / "engram.db")
+        buffer = ContextBuffer(config, project, db)
+        buffer.add_item("docs/a.md", "doc", 100)
+
+        added = buffer.add_items([
+            ("docs/a.md", "doc", 100, None, None),
+            ("docs/b.md", "doc", 200, None, None),
+            ("docs/b.md", "doc", 200, None, None),
+        ])
+        assert added == 1
+        assert sorted(i["path"] for i in buffer.get_items()) == ["docs/a.md", "docs/b.md"]
+        assert db.get_buffer_chars() == 300
+
     def test_should_dispatch_empty_buffer(self, project: Path, config: dict) -> None:
         from engram.server.buffer import ContextBuffer
 
@@ -788,10 +1251,11 @@ class TestDispatcherHelpers:
     def test_build_correction_text(self) -> None:
         from engram.server.dispatcher import _build_correction_text
 
-        # Minimal ChunkResult-like object
-        chunk = MagicMock()
-        chunk.chunk_id = 42
-        chunk.input_path.resolve.return_value = "/tmp/chunk.md"
+        # Minimal ChunkResult-like object: only chunk_id and input_path are read
+        chunk = SimpleNamespace(
+            chunk_id=42,
+            input_path=SimpleNamespace(resolve=lambda: "/tmp/chunk.md"),
+        )
 
         from engram.linter.schema import Violation
         from engram.linter import LintResult
@@ -806,6 +1270,7 @@ class TestDispatcherHelpers:
         assert "chunk 42" in text
         assert "Missing Code: field" in text
         assert "[concepts/C001]" in text
+        assert "/tmp/chunk.md" in text
 
     def test_build_correction_text_from_lint(self) -> None:
         from engram.server.dispatcher import _build_correction_text_from_lint
@@ -825,17 +1290,17 @@ class TestDispatcherHelpers:
     def test_flush_buffer_to_queue_consumes_and_writes_entries(
         self,
         project: Path,
-        config: dict,
+        dispatcher_and_db: tuple[Dispatcher, ServerDB],
     ) -> None:
-        from engram.server.dispatcher import Dispatcher
+        dispatcher, db = dispatcher_and_db
 
-        db = ServerDB(project / ".engram" / "engram.db")
-        dispatcher = Dispatcher(config, project, db)
+        issue_dir = project / "local_data" / "issues"
+        session_dir = project / ".engram" / "sessions"
+        for leaf in (issue_dir, session_dir):
+            leaf.mkdir(parents=True, exist_ok=True)
 
         db.add_buffer_item("docs/working/live.md", "doc", 120, "2026-02-21T10:00:00Z")
 
-        issue_dir = project / "local_data" / "issues"
-        issue_dir.mkdir(parents=True, exist_ok=True)
         (issue_dir / "77.json").write_text(json.dumps({
             "number": 77,
             "title": "Live issue title",
@@ -843,8 +1308,6 @@ class TestDispatcherHelpers:
         }))
         db.add_buffer_item("local_data/issues/77.json", "issue", 40, "2026-02-21T10:01:00Z")
 
-        session_dir = project / ".engram" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
         (session_dir / "sess-1.md").write_text("prompt text")
         db.add_buffer_item(
             ".engram/sessions/sess-1.md",
@@ -859,7 +1322,8 @@ class TestDispatcherHelpers:
         assert db.get_buffer_items() == []
 
         queue_file = project / ".engram" / "queue.jsonl"
-        rows = [json.loads(line) for line in queue_file.read_text().splitlines() if line.strip()]
+        lines = [line for line in queue_file.read_text().splitlines() if line.strip()]
+        rows = json.loads("[" + ",".join(lines) + "]")
         by_type = {row["type"]: row for row in rows}
         assert by_type["doc"]["path"] == "docs/working/live.md"
         assert by_type["doc"]["pass"] == "revisit"
@@ -870,13 +1334,9 @@ class TestDispatcherHelpers:
 
     def test_dispatch_calls_buffer_flush_before_chunk_build(
         self,
-        project: Path,
-        config: dict,
+        dispatcher_and_db: tuple[Dispatcher, ServerDB],
     ) -> None:
-        from engram.server.dispatcher import Dispatcher
-
-        db = ServerDB(project / ".engram" / "engram.db")
-        dispatcher = Dispatcher(config, project, db)
+        dispatcher, db = dispatcher_and_db
 
         with patch.object(dispatcher, "_flush_buffer_to_queue", return_value=0) as mock_flush:
             with patch("engram.server.dispatcher.next_chunk", side_effect=ValueError("Queue is empty")):
@@ -886,12 +1346,11 @@ class TestDispatcherHelpers:
 
 
 class TestDispatcherRecovery:
-    def test_recover_validated_marks_stale(self, project: Path, config: dict) -> None:
+    def test_recover_validated_marks_stale(
+        self, dispatcher_and_db: tuple[Dispatcher, ServerDB],
+    ) -> None:
         """Validated dispatch should mark L0 stale and transition to committed."""
-        from engram.server.dispatcher import Dispatcher
-
-        db = ServerDB(project / ".engram" / "engram.db")
-        dispatcher = Dispatcher(config, project, db)
+        dispatcher, db = dispatcher_and_db
 
         # Create a validated dispatch
         did = db.create_dispatch(chunk_id=1)
@@ -906,12 +1365,11 @@ class TestDispatcherRecovery:
         final = db.get_dispatch(did)
         assert final["state"] == "committed"
 
-    def test_recover_dispatched_lint_passes(self, project: Path, config: dict) -> None:
+    def test_recover_dispatched_lint_passes(
+        self, project: Path, dispatcher_and_db: tuple[Dispatcher, ServerDB],
+    ) -> None:
         """Dispatched dispatch with passing lint should mark stale and commit."""
-        from engram.server.dispatcher import Dispatcher
-
-        db = ServerDB(project / ".engram" / "engram.db")
-        dispatcher = Dispatcher(config, project, db)
+        dispatcher, db = dispatcher_and_db
 
         # Create a dispatch with input file
         chunks_dir = project / ".engram" / "chunks"
@@ -930,6 +1388,37 @@ class TestDispatcherRecovery:
         final = db.get_dispatch(did)
         assert final["state"] == "committed"
 
+    def test_recover_dispatch_tolerates_missing_prompt_path(
+        self, project: Path, dispatcher_and_db: tuple[Dispatcher, ServerDB],
+    ) -> None:
+        """A dict without prompt_path recovers like one with prompt_path unset."""
+        dispatcher, db = dispatcher_and_db
+
+        chunks_dir = project / ".engram" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        input_path = chunks_dir / "chunk_001_input.md"
+        input_path.write_text("test input")
+
+        did = db.create_dispatch(chunk_id=1, input_path=str(input_path))
+        db.update_dispatch_state(did, "dispatched")
+
+        dispatch = db.get_dispatch(did)
+        del dispatch["prompt_path"]
+        assert dispatcher.recover_dispatch(dispatch) is True
+        assert db.get_dispatch(did)["state"] == "committed"
+
+    def test_recover_dispatch_accepts_rows(
+        self, dispatcher_and_db: tuple[Dispatcher, ServerDB],
+    ) -> None:
+        dispatcher, db = dispatcher_and_db
+
+        did = db.create_dispatch(chunk_id=1)
+        db.update_dispatch_state(did, "validated")
+
+        (row,) = db.recover_on_startup()
+        assert dispatcher.recover_dispatch(row) is True
+        assert db.get_dispatch(did)["state"] == "committed"
+
 
 # ==================================================================
 # Server Status Tests
@@ -967,24 +1456,17 @@ class TestGetStatus:
 
 
 class TestCLIStatus:
-    def test_status_no_db(self, project: Path) -> None:
-        from click.testing import CliRunner
+    def test_status_no_db(self, project_str: str, runner: CliRunner) -> None:
         from engram.cli import cli
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status", "--project-root", str(project)])
+        result = runner.invoke(cli, ["status", "--project-root", project_str])
         # Should show error about no database
         assert result.exit_code == 1 or "Error" in result.output or "No database" in result.output
 
-    def test_status_with_db(self, project: Path) -> None:
-        from click.testing import CliRunner
+    def test_status_with_db(self, project_with_db: Path, runner: CliRunner) -> None:
         from engram.cli import cli
 
-        # Create DB
-        ServerDB(project / ".engram" / "engram.db")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status", "--project-root", str(project)])
+        result = runner.invoke(cli, ["status", "--project-root", str(project_with_db)])
         assert result.exit_code == 0
         assert "Buffer:" in result.output
         assert "Pending items:" in result.output
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-import time
+import shutil
 from pathlib import Path
 
 import pytest
@@ -17,10 +17,15 @@ from engram.fold.sessions import (
 )
 
 
-@pytest.fixture
-def history_file(tmp_path: Path) -> Path:
-    """Create a sample history.jsonl."""
-    now_ms = int(time.time() * 1000)
+@pytest.fixture(scope="session")
+def now_ms() -> int:
+    """Fixed epoch-ms base so generated timestamps are reproducible."""
+    return 1_800_000_000_000
+
+
+@pytest.fixture(scope="session")
+def history_file(tmp_path_factory: pytest.TempPathFactory, now_ms: int) -> Path:
+    """Create a sample history.jsonl, shared read-only across the session."""
     entries = [
         {
             "sessionId": "sess-001",
@@ -53,17 +58,24 @@ def history_file(tmp_path: Path) -> Path:
             "timestamp": now_ms - 600_000,
         },
     ]
-    path = tmp_path / "history.jsonl"
-    with open(path, "w") as f:
-        for entry in entries:
-            f.write(json.dumps(entry) + "\n")
+    path = tmp_path_factory.mktemp("sessions") / "history.jsonl"
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
     return path
 
 
 @pytest.fixture
-def codex_history_file(tmp_path: Path) -> Path:
-    """Create a codex home with history and per-session metadata logs."""
-    codex_home = tmp_path / ".codex"
+def mutable_history_file(history_file: Path, tmp_path: Path) -> Path:
+    """Private copy of ``history_file`` for tests that append to it."""
+    return Path(shutil.copy(history_file, tmp_path / "history.jsonl"))
+
+
+@pytest.fixture(scope="session")
+def codex_history_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a codex home with history and per-session metadata logs.
+
+    Shared read-only across the session.
+    """
+    codex_home = tmp_path_factory.mktemp("codex") / ".codex"
     sessions_dir = codex_home / "sessions" / "2026" / "02" / "21"
     sessions_dir.mkdir(parents=True, exist_ok=True)
 
@@ -85,9 +97,7 @@ def codex_history_file(tmp_path: Path) -> Path:
             "text": "Investigate unrelated repository prompt history entry",
         },
     ]
-    with open(history, "w") as fh:
-        for row in history_entries:
-            fh.write(json.dumps(row) + "\n")
+    history.write_text("".join(json.dumps(row) + "\n" for row in history_entries))
 
     session_1 = sessions_dir / (
         "rollout-2026-02-21T10-00-00-11111111-1111-1111-1111-111111111111.jsonl"
@@ -113,7 +123,23 @@ def codex_history_file(tmp_path: Path) -> Path:
     return history
 
 
+@pytest.fixture
+def mutable_codex_history_file(codex_history_file: Path, tmp_path: Path) -> Path:
+    """Private copy of the codex home for tests that append to its history."""
+    codex_home = shutil.copytree(codex_history_file.parent, tmp_path / ".codex")
+    return Path(codex_home) / codex_history_file.name
+
+
 class TestClaudeCodeAdapter:
+    def test_start_ms_is_first_prompt_timestamp(
+        self, history_file: Path, now_ms: int,
+    ) -> None:
+        adapter = ClaudeCodeAdapter()
+        entries = {e.session_id: e for e in adapter.parse(history_file, project_match=[])}
+        # sess-001 starts an hour ago, sess-002 thirty minutes ago
+        assert entries["sess-001"].start_ms == now_ms - 3600_000
+        assert entries["sess-002"].start_ms == now_ms - 1800_000
+
     def test_groups_by_session(self, history_file: Path) -> None:
         adapter = ClaudeCodeAdapter()
         entries = adapter.parse(history_file, project_match=["my-project"])
@@ -125,65 +151,50 @@ class TestClaudeCodeAdapter:
         assert entry.prompt_count == 2
         assert "OAuth" in entry.rendered
 
-    def test_filters_by_project_match(self, history_file: Path) -> None:
-        adapter = ClaudeCodeAdapter()
-        entries = adapter.parse(history_file, project_match=["other-project"])
-
-        assert len(entries) == 1
-        assert entries[0].session_id == "sess-002"
-        assert entries[0].prompt_count == 1
-
-    def test_empty_project_match_returns_all(self, history_file: Path) -> None:
-        adapter = ClaudeCodeAdapter()
-        entries = adapter.parse(history_file, project_match=[])
-
-        # All sessions with valid prompts: sess-001 (2), sess-002 (1)
-        session_ids = {e.session_id for e in entries}
-        assert "sess-001" in session_ids
-        assert "sess-002" in session_ids
-
-    def test_filters_slash_commands(self, history_file: Path) -> None:
-        adapter = ClaudeCodeAdapter()
-        entries = adapter.parse(history_file, project_match=["my-project"])
-
-        # sess-003 only has "/help" → filtered out
-        session_ids = {e.session_id for e in entries}
-        assert "sess-003" not in session_ids
+    @pytest.mark.parametrize(
+        ("project_match", "expected"),
+        [
+            # sess-003 is only "/help" and sess-004 only "hi": both dropped
+            pytest.param(["my-project"], {"sess-001": 2}, id="slash-and-short-filtered"),
+            pytest.param(["other-project"], {"sess-002": 1}, id="by-project"),
+            pytest.param(["My-Project"], {"sess-001": 2}, id="case-insensitive"),
+            pytest.param(
+                ["no-such-repo", "MY-PROJECT"], {"sess-001": 2}, id="any-pattern",
+            ),
+            pytest.param([], {"sess-001": 2, "sess-002": 1}, id="empty-matches-all"),
+        ],
+    )
+    def test_project_filter(
+        self, history_file: Path, project_match: list[str], expected: dict[str, int],
+    ) -> None:
+        entries = ClaudeCodeAdapter().parse(history_file, project_match=project_match)
+        assert {e.session_id: e.prompt_count for e in entries} == expected
 
-    def test_filters_short_prompts(self, history_file: Path) -> None:
-        adapter = ClaudeCodeAdapter()
-        entries = adapter.parse(history_file, project_match=["my-project"])
+    def test_project_matcher_compiled_once_per_pattern_list(self) -> None:
+        from engram.fold.sessions import _project_matcher
 
-        session_ids = {e.session_id for e in entries}
-        assert "sess-004" not in session_ids
+        first = _project_matcher(["alpha", "beta"])
+        assert _project_matcher(["alpha", "beta"]) is first
+        assert first("/src/beta-repo") and not first("/src/gamma")
 
     def test_nonexistent_file(self, tmp_path: Path) -> None:
         adapter = ClaudeCodeAdapter()
         entries = adapter.parse(tmp_path / "nope.jsonl", project_match=[])
         assert entries == []
 
-    def test_malformed_json_lines_skipped(self, tmp_path: Path) -> None:
+    def test_malformed_json_lines_skipped(self, tmp_path: Path, now_ms: int) -> None:
         path = tmp_path / "history.jsonl"
-        now_ms = int(time.time() * 1000)
-        with open(path, "w") as f:
-            f.write("not valid json\n")
-            f.write(json.dumps({
-                "sessionId": "s1",
-                "project": "/dev/proj",
-                "display": "A valid prompt that is long enough to pass",
-                "timestamp": now_ms,
-            }) + "\n")
+        path.write_text("not valid json\n" + json.dumps({
+            "sessionId": "s1",
+            "project": "/dev/proj",
+            "display": "A valid prompt that is long enough to pass",
+            "timestamp": now_ms,
+        }) + "\n")
 
         adapter = ClaudeCodeAdapter()
         entries = adapter.parse(path, project_match=[])
         assert len(entries) == 1
 
-    def test_case_insensitive_project_match(self, history_file: Path) -> None:
-        adapter = ClaudeCodeAdapter()
-        entries = adapter.parse(history_file, project_match=["My-Project"])
-        assert len(entries) == 1
-        assert entries[0].session_id == "sess-001"
-
     def test_session_date_from_first_prompt(self, history_file: Path) -> None:
         adapter = ClaudeCodeAdapter()
         entries = adapter.parse(history_file, project_match=["my-project"])
@@ -191,7 +202,10 @@ class TestClaudeCodeAdapter:
         # Date should be parseable and represent the first prompt's timestamp
         assert entries[0].date  # non-empty
 
-    def test_incremental_only_parses_appended_lines(self, history_file: Path) -> None:
+    def test_incremental_only_parses_appended_lines(
+        self, mutable_history_file: Path, now_ms: int,
+    ) -> None:
+        history_file = mutable_history_file
         adapter = ClaudeCodeAdapter()
         first_entries, offset = adapter.parse_incremental(
             history_file, project_match=["my-project"], start_offset=0,
@@ -204,7 +218,7 @@ class TestClaudeCodeAdapter:
                 "sessionId": "sess-002",
                 "project": "/Users/dev/other-project",
                 "display": "A newly appended prompt that should be emitted once",
-                "timestamp": int(time.time() * 1000),
+                "timestamp": now_ms + 10_000,
             }) + "\n")
 
         second_entries, second_offset = adapter.parse_incremental(
@@ -214,28 +228,83 @@ class TestClaudeCodeAdapter:
         assert second_entries[0].session_id == "sess-002"
         assert second_offset > offset
 
-    def test_filters_sm_telemetry_and_dedupes_consecutive_prompts(self, tmp_path: Path) -> None:
-        now_ms = int(time.time() * 1000)
+    def test_large_history_parsed_in_one_buffer(self, tmp_path: Path, now_ms: int) -> None:
         path = tmp_path / "history.jsonl"
-        with open(path, "w") as fh:
-            fh.write(json.dumps({
+        with open(path, "w") as f:
+            for i in range(1000):
+                f.write(json.dumps({
+                    "sessionId": f"s{i % 10}",
+                    "project": "/dev/proj",
+                    "display": f"Prompt number {i} that is long enough to keep",
+                    "timestamp": now_ms + i,
+                }) + "\n")
+        assert path.stat().st_size >= 64 * 1024
+
+        adapter = ClaudeCodeAdapter()
+        entries, offset = adapter.parse_incremental(path, project_match=[])
+        assert len(entries) == 10
+        assert sum(e.prompt_count for e in entries) == 1000
+        assert offset == path.stat().st_size
+
+        with open(path, "a") as f:
+            f.write(json.dumps({
+                "sessionId": "s-new",
+                "project": "/dev/proj",
+                "display": "Appended after a large history was parsed",
+                "timestamp": now_ms,
+            }))  # no trailing newline
+
+        entries, _ = adapter.parse_incremental(path, project_match=[], start_offset=offset)
+        assert [e.session_id for e in entries] == ["s-new"]
+
+    def test_torn_final_line_is_read_on_next_poll(self, tmp_path: Path, now_ms: int) -> None:
+        path = tmp_path / "history.jsonl"
+        first = json.dumps({
+            "sessionId": "s1", "project": "/dev/proj",
+            "display": "A complete prompt that is long enough", "timestamp": now_ms,
+        }) + "\n"
+        second = json.dumps({
+            "sessionId": "s2", "project": "/dev/proj",
+            "display": "A prompt caught halfway through its write", "timestamp": now_ms,
+        }) + "\n"
+        path.write_text(first + second[:20])
+
+        adapter = ClaudeCodeAdapter()
+        entries, offset = adapter.parse_incremental(path, project_match=[])
+        assert [e.session_id for e in entries] == ["s1"]
+        assert offset == len(first)
+
+        with open(path, "a") as f:
+            f.write(second[20:])
+        entries, offset = adapter.parse_incremental(path, project_match=[], start_offset=offset)
+        assert [e.session_id for e in entries] == ["s2"]
+        assert offset == path.stat().st_size
+
+    def test_filters_sm_telemetry_and_dedupes_consecutive_prompts(
+        self, tmp_path: Path, now_ms: int,
+    ) -> None:
+        path = tmp_path / "history.jsonl"
+        rows = [
+            {
                 "sessionId": "s1",
                 "project": "/Users/dev/my-project",
                 "display": "[sm wait] worker idle for 500s and still waiting",
                 "timestamp": now_ms,
-            }) + "\n")
-            fh.write(json.dumps({
+            },
+            {
                 "sessionId": "s1",
                 "project": "/Users/dev/my-project",
                 "display": "Real decision text that should be preserved",
                 "timestamp": now_ms + 1,
-            }) + "\n")
-            fh.write(json.dumps({
+            },
+            {
                 "sessionId": "s1",
                 "project": "/Users/dev/my-project",
                 "display": "Real decision text that should be preserved",
                 "timestamp": now_ms + 2,
-            }) + "\n")
+            },
+        ]
+        path.write_text("".join(json.dumps(row) + "\n" for row in rows))
 
         adapter = ClaudeCodeAdapter()
         entries = adapter.parse(path, project_match=["my-project"])
@@ -245,8 +314,7 @@ class TestClaudeCodeAdapter:
         assert rendered.count("Real decision text that should be preserved") == 1
         assert entries[0].prompt_count == 1
 
-    def test_trims_long_relay_prompts(self, tmp_path: Path) -> None:
-        now_ms = int(time.time() * 1000)
+    def test_trims_long_relay_prompts(self, tmp_path: Path, now_ms: int) -> None:
         path = tmp_path / "history.jsonl"
         relay = "[Input from: architect] " + ("x" * 600)
         with open(path, "w") as fh:
@@ -287,7 +355,10 @@ class TestCodexAdapter:
         assert len(entries) == 1
         assert entries[0].session_id == "11111111-1111-1111-1111-111111111111"
 
-    def test_incremental_reads_only_new_codex_lines(self, codex_history_file: Path) -> None:
+    def test_incremental_reads_only_new_codex_lines(
+        self, mutable_codex_history_file: Path,
+    ) -> None:
+        codex_history_file = mutable_codex_history_file
         adapter = CodexAdapter()
         first, offset = adapter.parse_incremental(
             codex_history_file, project_match=["my-project"], start_offset=0,
@@ -325,8 +396,7 @@ class TestGetAdapter:
 
 
 class TestRenderSessionMarkdown:
-    def test_renders_prompts(self) -> None:
-        now_ms = int(time.time() * 1000)
+    def test_renders_prompts(self, now_ms: int) -> None:
         prompts = [
             {"display": "First prompt text here", "timestamp": now_ms},
             {"display": "Second prompt text here", "timestamp": now_ms + 60_000},
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
@@ -10,16 +11,30 @@ from unittest.mock import patch
 import pytest
 
 from engram.fold.sources import (
+    FRONTMATTER_SCAN_CHARS,
     extract_issue_number,
+    frontmatter_date_from_text,
     git_diff_summary,
     get_doc_git_dates,
+    get_doc_git_dates_batch,
+    list_tracked_markdown_docs,
+    load_issue_snapshot,
     parse_date,
     parse_frontmatter_date,
     pull_issues,
     render_issue_markdown,
+    scan_dir_files,
 )
 
 
+def _cp(stdout: bytes) -> subprocess.CompletedProcess:
+    """Successful mocked ``subprocess.run`` result with the given stdout."""
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout)
+
+
+_EMPTY_CP = _cp(b"")
+
+
 class TestRenderIssueMarkdown:
     def test_basic_issue(self) -> None:
         issue = {
@@ -106,6 +121,11 @@ class TestParseFrontmatterDate:
         doc = tmp_path / "nonexistent.md"
         assert parse_frontmatter_date(doc) is None
 
+    def test_ignores_date_past_scan_window(self, tmp_path: Path) -> None:
+        doc = tmp_path / "test.md"
+        doc.write_text("x" * FRONTMATTER_SCAN_CHARS + "\n**Date:** 2026-02-08\n")
+        assert parse_frontmatter_date(doc) is None
+
 
 class TestExtractIssueNumber:
     def test_valid_filename(self, tmp_path: Path) -> None:
@@ -136,15 +156,23 @@ class TestParseDate:
         assert dt.day == 8
 
 
+class TestFrontmatterDateFromText:
+    def test_matches_parse_frontmatter_date(self) -> None:
+        text = "# Title\n\n**Date:** 2026-02-08\n"
+        assert frontmatter_date_from_text(text) == "2026-02-08T00:00:00+00:00"
+
+    def test_ignores_dates_past_scan_window(self) -> None:
+        text = "x" * 2000 + "**Date:** 2026-02-08\n"
+        assert frontmatter_date_from_text(text) is None
+
+
 class TestPullIssues:
     def test_writes_issue_files(self, tmp_path: Path) -> None:
         mock_issues = [
             {"number": 1, "title": "Bug", "body": "Fix it", "createdAt": "2026-01-01"},
             {"number": 2, "title": "Feature", "body": "Add it", "createdAt": "2026-01-02"},
         ]
-        mock_result = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json.dumps(mock_issues)
-        )
+        mock_result = _cp(json.dumps(mock_issues).encode())
         with patch("engram.fold.sources.subprocess.run", return_value=mock_result):
             issues_dir = tmp_path / "issues"
             result = pull_issues("owner/repo", issues_dir)
@@ -156,22 +184,49 @@ class TestPullIssues:
         loaded = json.loads((issues_dir / "1.json").read_text())
         assert loaded["title"] == "Bug"
 
+    def test_fetches_only_updated_since_newest_snapshot(self, tmp_path: Path) -> None:
+        issues_dir = tmp_path / "issues"
+        issues_dir.mkdir()
+        (issues_dir / "1.json").write_text(json.dumps(
+            {"number": 1, "title": "Old", "updatedAt": "2026-01-05T00:00:00Z"}
+        ))
+        (issues_dir / "2.json").write_text(json.dumps(
+            {"number": 2, "title": "Keep", "updatedAt": "2026-01-09T00:00:00Z"}
+        ))
+        updated = [{"number": 1, "title": "New", "updatedAt": "2026-01-10T00:00:00Z"}]
+        mock_result = _cp(json.dumps(updated).encode())
+        with patch("engram.fold.sources.subprocess.run", return_value=mock_result) as mock:
+            result = pull_issues("owner/repo", issues_dir)
+
+        cmd = mock.call_args[0][0]
+        assert cmd[cmd.index("--search") + 1] == "updated:>=2026-01-09T00:00:00Z"
+        assert result == updated
+        assert json.loads((issues_dir / "1.json").read_text())["title"] == "New"
+        assert json.loads((issues_dir / "2.json").read_text())["title"] == "Keep"
+
+
+class TestLoadIssueSnapshot:
+    def test_parses_utf8_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "7.json"
+        path.write_bytes(json.dumps({"number": 7, "title": "Caf\u00e9"}, ensure_ascii=False).encode())
+        assert load_issue_snapshot(path) == {"number": 7, "title": "Caf\u00e9"}
+
+    def test_invalid_json_raises_decode_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "bad.json"
+        path.write_bytes(b"{not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_issue_snapshot(path)
+
 
 class TestGetDocGitDates:
     def test_returns_dates(self, tmp_path: Path) -> None:
         # Mock git commands returning dates
         def mock_run(cmd, **kwargs):
             if "--diff-filter=A" in cmd:
-                return subprocess.CompletedProcess(
-                    args=cmd, returncode=0,
-                    stdout="2026-01-01T00:00:00-06:00\nsome_file.md\n",
-                )
+                return _cp(b"2026-01-01T00:00:00-06:00\nsome_file.md\n")
             elif "-1" in cmd:
-                return subprocess.CompletedProcess(
-                    args=cmd, returncode=0,
-                    stdout="2026-02-01T00:00:00-06:00\n",
-                )
-            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="")
+                return _cp(b"2026-02-01T00:00:00-06:00\n")
+            return _EMPTY_CP
 
         doc = tmp_path / "docs" / "test.md"
         doc.parent.mkdir(parents=True)
@@ -189,14 +244,8 @@ class TestGetDocGitDates:
         def mock_run(cmd, **kwargs):
             seen_cmds.append(cmd)
             if "--diff-filter=A" in cmd:
-                return subprocess.CompletedProcess(
-                    args=cmd, returncode=0,
-                    stdout="2026-01-01T00:00:00-06:00\n",
-                )
-            return subprocess.CompletedProcess(
-                args=cmd, returncode=0,
-                stdout="2026-02-01T00:00:00-06:00\n",
-            )
+                return _cp(b"2026-01-01T00:00:00-06:00\n")
+            return _cp(b"2026-02-01T00:00:00-06:00\n")
 
         doc = tmp_path / "docs" / "nested" / "test.md"
         doc.parent.mkdir(parents=True)
@@ -212,7 +261,7 @@ class TestGetDocGitDates:
 
     def test_no_git_history(self, tmp_path: Path) -> None:
         def mock_run(cmd, **kwargs):
-            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="\n")
+            return _cp(b"\n")
 
         doc = tmp_path / "test.md"
         doc.write_text("content")
@@ -224,12 +273,79 @@ class TestGetDocGitDates:
         assert modified is None
 
 
+class TestGetDocGitDatesBatch:
+    def test_matches_per_doc_dates(self, tmp_path: Path) -> None:
+        project = tmp_path / "repo" / "sub"
+        docs = project / "docs"
+        docs.mkdir(parents=True)
+
+        def git(*args: str, date: str | None = None) -> None:
+            env = None
+            if date:
+                env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+            subprocess.run(["git", *args], cwd=project, check=True, capture_output=True, env=env)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        (docs / "a.md").write_text("a")
+        (docs / "b.md").write_text("b")
+        git("add", ".")
+        git("commit", "-qm", "add", date="2026-01-01T00:00:00+00:00")
+        git("mv", "docs/a.md", "docs/renamed.md")
+        git("commit", "-qm", "rename", date="2026-01-10T00:00:00+00:00")
+        (docs / "b.md").write_text("b, edited")
+        git("commit", "-qam", "edit", date="2026-01-20T00:00:00+00:00")
+
+        doc_paths = [docs / "b.md", docs / "renamed.md"]
+        batch = get_doc_git_dates_batch(doc_paths, project)
+        assert batch == {doc: get_doc_git_dates(doc, project) for doc in doc_paths}
+        assert batch[docs / "b.md"] == (
+            "2026-01-01T00:00:00+00:00", "2026-01-20T00:00:00+00:00",
+        )
+
+    def test_doc_moved_across_directories(self, tmp_path: Path) -> None:
+        project = tmp_path / "repo"
+        working = project / "docs" / "working"
+        archive = project / "docs" / "archive"
+        working.mkdir(parents=True)
+        archive.mkdir(parents=True)
+
+        def git(*args: str, date: str | None = None) -> None:
+            env = None
+            if date:
+                env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+            subprocess.run(["git", *args], cwd=project, check=True, capture_output=True, env=env)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        (working / "x.md").write_text("x")
+        (working / "z.md").write_text("z")
+        git("add", ".")
+        git("commit", "-qm", "add", date="2024-01-01T00:00:00+00:00")
+        git("mv", "docs/working/x.md", "docs/archive/x.md")
+        git("commit", "-qm", "archive", date="2025-01-01T00:00:00+00:00")
+
+        moved = archive / "x.md"
+        expected = get_doc_git_dates(moved, project)
+        # The answer must not depend on which other docs share the batch
+        assert get_doc_git_dates_batch([moved], project)[moved] == expected
+        batch = get_doc_git_dates_batch([moved, working / "z.md"], project)
+        assert batch[moved] == expected
+        assert batch[working / "z.md"] == get_doc_git_dates(working / "z.md", project)
+
+    def test_empty_and_non_git(self, tmp_path: Path) -> None:
+        doc = tmp_path / "a.md"
+        doc.write_text("a")
+        assert get_doc_git_dates_batch([], tmp_path) == {}
+        assert get_doc_git_dates_batch([doc], tmp_path) == {doc: (None, None)}
+
+
 class TestGitDiffSummary:
     def test_with_changes(self, tmp_path: Path) -> None:
-        mock_output = "A\tsrc/new_file.py\nD\tsrc/old_file.py\nR100\tsrc/a.py\tsrc/b.py\n"
-        mock_result = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=mock_output
-        )
+        mock_output = b"A\tsrc/new_file.py\nD\tsrc/old_file.py\nR100\tsrc/a.py\tsrc/b.py\n"
+        mock_result = _cp(mock_output)
         with patch("engram.fold.sources.subprocess.run", return_value=mock_result):
             result = git_diff_summary("2026-01-01", "2026-02-01", tmp_path)
 
@@ -238,21 +354,16 @@ class TestGitDiffSummary:
         assert "Files deleted (1)" in result
         assert "`src/old_file.py`" in result
         assert "Files renamed (1)" in result
+        assert "`src/a.py → src/b.py`" in result
 
     def test_no_changes(self, tmp_path: Path) -> None:
-        mock_result = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=""
-        )
-        with patch("engram.fold.sources.subprocess.run", return_value=mock_result):
+        with patch("engram.fold.sources.subprocess.run", return_value=_EMPTY_CP):
             result = git_diff_summary("2026-01-01", "2026-02-01", tmp_path)
 
         assert result == ""
 
     def test_custom_source_dirs(self, tmp_path: Path) -> None:
-        mock_result = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=""
-        )
-        with patch("engram.fold.sources.subprocess.run", return_value=mock_result) as mock:
+        with patch("engram.fold.sources.subprocess.run", return_value=_EMPTY_CP) as mock:
             git_diff_summary(
                 "2026-01-01", "2026-02-01", tmp_path,
                 source_dirs=["lib/", "app/"],
@@ -262,3 +373,37 @@ class TestGitDiffSummary:
         call_args = mock.call_args[0][0]
         assert "lib/" in call_args
         assert "app/" in call_args
+
+
+class TestScanDirFiles:
+    def test_lists_matching_files_sorted(self, tmp_path: Path) -> None:
+        (tmp_path / "b.md").write_text("b")
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "c.txt").write_text("c")
+        (tmp_path / "dir.md").mkdir()
+
+        names = [e.name for e in scan_dir_files(tmp_path, ".md")]
+        assert names == ["a.md", "b.md"]
+
+    def test_missing_dir_returns_empty(self, tmp_path: Path) -> None:
+        assert scan_dir_files(tmp_path / "missing", ".json") == []
+
+
+class TestListTrackedMarkdownDocs:
+    def test_reuses_ls_files_until_index_changes(self, tmp_path: Path) -> None:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("a")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "docs/a.md"], cwd=tmp_path, check=True)
+
+        real_run = subprocess.run
+        with patch("engram.fold.sources.subprocess.run", side_effect=real_run) as mock:
+            first = list_tracked_markdown_docs(tmp_path, [docs])
+            second = list_tracked_markdown_docs(tmp_path, [docs])
+        assert first == second == [docs / "a.md"]
+        assert mock.call_count == 1
+
+        (docs / "b.md").write_text("b")
+        subprocess.run(["git", "add", "docs/b.md"], cwd=tmp_path, check=True)
+        assert list_tracked_markdown_docs(tmp_path, [docs]) == [docs / "a.md", docs / "b.md"]
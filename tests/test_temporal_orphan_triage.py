@@ -7,7 +7,11 @@ zero-work fold_from clearing.
 
 from __future__ import annotations
 
+import os
+import shlex
+import shutil
 import sqlite3
+import subprocess
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -32,6 +36,54 @@ def db(db_path: Path) -> ServerDB:
     return ServerDB(db_path)
 
 
+@pytest.fixture(scope="session")
+def git_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Empty ``.git`` skeleton, built once and copied by ``_init_git_repo``."""
+    root = tmp_path_factory.mktemp("git-skeleton")
+    subprocess.run(
+        ["git", "init", "-q", str(root)],
+        env=_GIT_ENV, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    # Identity in the repo config so tests that commit again after init
+    # (outside _GIT_ENV) still have an author
+    with open(root / ".git" / "config", "a") as fh:
+        fh.write("[user]\n\temail = test@test.com\n\tname = Test\n")
+    return root / ".git"
+
+
+@pytest.fixture(scope="session")
+def project_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """``_setup_project`` tree, built once and copied per test."""
+    root = tmp_path_factory.mktemp("project-skeleton")
+    engram_dir = root / ".engram"
+    engram_dir.mkdir()
+    (engram_dir / "config.yaml").write_bytes(_CONFIG_YAML)
+
+    docs_dir = root / "docs" / "decisions"
+    docs_dir.mkdir(parents=True)
+    for _, name, header in _DOC_STUBS:
+        (docs_dir / name).write_bytes(header)
+    return root
+
+
+@pytest.fixture(scope="session")
+def git_template_repo(
+    tmp_path_factory: pytest.TempPathFactory, git_skeleton: Path,
+) -> tuple[Path, str]:
+    """Default single-commit repo, built once and copied by ``git_repo``."""
+    root = tmp_path_factory.mktemp("git-template")
+    return root, _init_git_repo(root, git_skeleton)
+
+
+@pytest.fixture()
+def git_repo(tmp_path: Path, git_template_repo: tuple[Path, str]) -> str:
+    """Copy the default repo into ``tmp_path`` and return its commit hash."""
+    template, commit = git_template_repo
+    shutil.copytree(template, tmp_path, symlinks=True, dirs_exist_ok=True)
+    return commit
+
+
 # ==================================================================
 # 1. ServerDB: fold_from accessors
 # ==================================================================
@@ -125,6 +177,21 @@ class TestLegacySchemaDetection:
         state = db.get_server_state()
         assert state["buffer_chars_total"] == 0
 
+    def test_failed_migration_keeps_legacy_table(self, db_path: Path) -> None:
+        """Schema setup is one transaction: a failure rolls back the DROP."""
+        self._create_legacy_table(db_path, "2026-01-15")
+        with patch("engram.server.db._CREATE_INDEXES", ("NOT VALID SQL",)):
+            with pytest.raises(sqlite3.OperationalError):
+                ServerDB(db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        row = conn.execute(
+            "SELECT value FROM server_state WHERE key = 'fold_from'"
+        ).fetchone()
+        conn.close()
+        assert row == ("2026-01-15",)
+        assert ServerDB(db_path).get_fold_from() == "2026-01-15"
+
     def test_singleton_schema_unaffected(self, db_path: Path) -> None:
         """An existing singleton schema is not touched by migration logic."""
         db1 = ServerDB(db_path)
@@ -172,23 +239,19 @@ class TestSetFoldMarker:
 
 
 class TestGitHelpers:
-    def test_resolve_ref_commit_returns_hash(self, tmp_path: Path) -> None:
+    def test_resolve_ref_commit_returns_hash(self, tmp_path: Path, git_repo: str) -> None:
         """In a real git repo, _resolve_ref_commit returns a commit hash."""
         from engram.fold.chunker import _resolve_ref_commit
 
-        # Create a minimal git repo with a commit
-        _init_git_repo(tmp_path)
-
         commit = _resolve_ref_commit(tmp_path, "2099-12-31")
         assert commit is not None
         assert len(commit) == 40  # Full SHA
 
     def test_resolve_ref_commit_returns_none_for_ancient_date(
-        self, tmp_path: Path,
+        self, tmp_path: Path, git_repo: str,
     ) -> None:
         from engram.fold.chunker import _resolve_ref_commit
 
-        _init_git_repo(tmp_path)
         # Date before the repo existed
         assert _resolve_ref_commit(tmp_path, "1900-01-01") is None
 
@@ -199,21 +262,36 @@ class TestGitHelpers:
 
         assert _resolve_ref_commit(tmp_path, "2026-01-01") is None
 
-    def test_file_exists_at_commit(self, tmp_path: Path) -> None:
-        from engram.fold.chunker import _file_exists_at_commit
+    def test_resolve_ref_commit_sees_new_commits(self, tmp_path: Path, git_repo: str) -> None:
+        """A long-lived process resolves the same date against the current history."""
+        from engram.fold.chunker import _resolve_ref_commit
+
+        import subprocess
+
+        first = git_repo
+        assert _resolve_ref_commit(tmp_path, "2099-12-31") == first
+
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "second"],
+            cwd=str(tmp_path), check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        assert _resolve_ref_commit(tmp_path, "2099-12-31") != first
 
-        commit = _init_git_repo(tmp_path)
+    def test_file_exists_at_commit(self, tmp_path: Path, git_repo: str) -> None:
+        from engram.fold.chunker import _file_exists_at_commit
 
+        commit = git_repo
         assert _file_exists_at_commit(tmp_path, commit, "hello.txt")
         assert not _file_exists_at_commit(tmp_path, commit, "missing.txt")
 
-    def test_file_exists_at_commit_tracks_rename(self, tmp_path: Path) -> None:
+    def test_file_exists_at_commit_tracks_rename(self, tmp_path: Path, git_repo: str) -> None:
         """After renaming, old name exists at old commit, new name at new."""
         from engram.fold.chunker import _file_exists_at_commit
 
         import subprocess
 
-        commit1 = _init_git_repo(tmp_path)
+        commit1 = git_repo
 
         # Rename the file
         old = tmp_path / "hello.txt"
@@ -221,11 +299,13 @@ class TestGitHelpers:
         old.rename(new)
         subprocess.run(
             ["git", "add", "-A"],
-            cwd=str(tmp_path), capture_output=True, check=True,
+            cwd=str(tmp_path), check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "rename"],
-            cwd=str(tmp_path), capture_output=True, check=True,
+            cwd=str(tmp_path), check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -264,7 +344,9 @@ class TestTemporalOrphanDetection:
         assert len(orphans) == 1
         assert orphans[0]["id"] == "C001"
 
-    def test_no_orphan_when_file_exists_at_ref_commit(self, tmp_path: Path) -> None:
+    def test_no_orphan_when_file_exists_at_ref_commit(
+        self, tmp_path: Path, git_skeleton: Path,
+    ) -> None:
         """With ref_commit, file present at that commit is NOT an orphan."""
         from engram.fold.chunker import _find_orphaned_concepts
 
@@ -273,7 +355,7 @@ class TestTemporalOrphanDetection:
         # Set up git repo with src/widget.py
         (tmp_path / "src").mkdir()
         (tmp_path / "src" / "widget.py").write_text("# widget")
-        commit = _init_git_repo(tmp_path, files=["src/widget.py"])
+        commit = _init_git_repo(tmp_path, git_skeleton, files=["src/widget.py"])
 
         # Now delete the file from the filesystem (simulating a rename after fold_from)
         (tmp_path / "src" / "widget.py").unlink()
@@ -293,12 +375,11 @@ class TestTemporalOrphanDetection:
         orphans = _find_orphaned_concepts(concepts, tmp_path, ref_commit=commit)
         assert len(orphans) == 0
 
-    def test_orphan_when_file_missing_at_ref_commit(self, tmp_path: Path) -> None:
+    def test_orphan_when_file_missing_at_ref_commit(self, tmp_path: Path, git_repo: str) -> None:
         """With ref_commit, file missing at that commit IS an orphan."""
         from engram.fold.chunker import _find_orphaned_concepts
 
-        commit = _init_git_repo(tmp_path)
-
+        commit = git_repo
         concepts = tmp_path / "concepts.md"
         concepts.write_text(
             "# Concept Registry\n\n"
@@ -310,7 +391,9 @@ class TestTemporalOrphanDetection:
         assert len(orphans) == 1
         assert orphans[0]["id"] == "C001"
 
-    def test_skips_concepts_introduced_after_ref_commit(self, tmp_path: Path) -> None:
+    def test_skips_concepts_introduced_after_ref_commit(
+        self, tmp_path: Path, git_skeleton: Path,
+    ) -> None:
         """Temporal orphan scan ignores ACTIVE concepts absent at fold reference."""
         from engram.fold.chunker import _find_orphaned_concepts
 
@@ -325,7 +408,7 @@ class TestTemporalOrphanDetection:
         (tmp_path / "src").mkdir()
         (tmp_path / "src" / "legacy.py").write_text("# legacy")
         commit = _init_git_repo(
-            tmp_path,
+            tmp_path, git_skeleton,
             files=["docs/decisions/concept_registry.md", "src/legacy.py"],
         )
 
@@ -341,7 +424,9 @@ class TestTemporalOrphanDetection:
         orphans = _find_orphaned_concepts(registry, tmp_path, ref_commit=commit)
         assert all(o["id"] != "C002" for o in orphans)
 
-    def test_ref_commit_lookup_is_case_insensitive(self, tmp_path: Path) -> None:
+    def test_ref_commit_lookup_is_case_insensitive(
+        self, tmp_path: Path, git_skeleton: Path,
+    ) -> None:
         """Temporal checks resolve paths despite docs/Docs casing drift."""
         from engram.fold.chunker import _find_orphaned_concepts
 
@@ -357,14 +442,16 @@ class TestTemporalOrphanDetection:
             "- **Code:** `docs/archive/DAG_spec.md`\n",
         )
         commit = _init_git_repo(
-            tmp_path,
+            tmp_path, git_skeleton,
             files=["Docs/Archive/DAG_spec.md", "docs/decisions/concept_registry.md"],
         )
 
         orphans = _find_orphaned_concepts(registry, tmp_path, ref_commit=commit)
         assert orphans == []
 
-    def test_ref_commit_directory_paths_are_detected(self, tmp_path: Path) -> None:
+    def test_ref_commit_directory_paths_are_detected(
+        self, tmp_path: Path, git_skeleton: Path,
+    ) -> None:
         """Directory code paths should count as existing at ref commit."""
         from engram.fold.chunker import _find_orphaned_concepts
 
@@ -376,7 +463,9 @@ class TestTemporalOrphanDetection:
             "## C001: Live sim module (ACTIVE)\n"
             "- **Code:** `src/live_sim`\n",
         )
-        commit = _init_git_repo(tmp_path, files=["concepts.md", "src/live_sim/server.py"])
+        commit = _init_git_repo(
+            tmp_path, git_skeleton, files=["concepts.md", "src/live_sim/server.py"],
+        )
 
         orphans = _find_orphaned_concepts(registry, tmp_path, ref_commit=commit)
         assert orphans == []
@@ -388,25 +477,18 @@ class TestTemporalOrphanDetection:
 
 
 class TestScanDriftFoldFrom:
-    def test_scan_drift_passes_fold_from(self, tmp_path: Path) -> None:
+    def test_scan_drift_passes_fold_from(
+        self, tmp_path: Path, git_skeleton: Path, project_skeleton: Path,
+    ) -> None:
         """scan_drift with fold_from uses git-based detection."""
         from engram.fold.chunker import scan_drift
 
         import subprocess
 
-        # Set up a project with config
-        _setup_project(tmp_path)
-
-        # Create a git repo with the source file
+        # Create a committed project with the source file
         (tmp_path / "src").mkdir()
         (tmp_path / "src" / "widget.py").write_text("# widget")
-        _init_git_repo(tmp_path, files=["src/widget.py", ".engram/config.yaml",
-                                         "docs/decisions/concept_registry.md",
-                                         "docs/decisions/timeline.md",
-                                         "docs/decisions/epistemic_state.md",
-                                         "docs/decisions/workflow_registry.md",
-                                         "docs/decisions/concept_graveyard.md",
-                                         "docs/decisions/epistemic_graveyard.md"])
+        _make_engram_repo(tmp_path, git_skeleton, project_skeleton, ["src/widget.py"])
 
         # Delete the file from filesystem
         (tmp_path / "src" / "widget.py").unlink()
@@ -597,19 +679,10 @@ class TestTriagePromptTemporalContext:
 
 class TestFoldFromLifecycle:
     def test_forward_fold_clears_fold_from_on_empty_queue(
-        self, tmp_path: Path,
+        self, tmp_path: Path, git_skeleton: Path, project_skeleton: Path,
     ) -> None:
         """Early return (empty queue after date filter) clears fold_from."""
-        _setup_project(tmp_path)
-        _init_git_repo(tmp_path, files=[
-            ".engram/config.yaml",
-            "docs/decisions/timeline.md",
-            "docs/decisions/concept_registry.md",
-            "docs/decisions/epistemic_state.md",
-            "docs/decisions/workflow_registry.md",
-            "docs/decisions/concept_graveyard.md",
-            "docs/decisions/epistemic_graveyard.md",
-        ])
+        _make_engram_repo(tmp_path, git_skeleton, project_skeleton)
 
         db_path = tmp_path / ".engram" / "engram.db"
         db = ServerDB(db_path)
@@ -630,21 +703,12 @@ class TestFoldFromLifecycle:
         assert db.get_fold_from() is None
 
     def test_forward_fold_clears_fold_from_on_success(
-        self, tmp_path: Path,
+        self, tmp_path: Path, git_skeleton: Path, project_skeleton: Path,
     ) -> None:
         """Normal completion clears fold_from."""
         import json
 
-        _setup_project(tmp_path)
-        _init_git_repo(tmp_path, files=[
-            ".engram/config.yaml",
-            "docs/decisions/timeline.md",
-            "docs/decisions/concept_registry.md",
-            "docs/decisions/epistemic_state.md",
-            "docs/decisions/workflow_registry.md",
-            "docs/decisions/concept_graveyard.md",
-            "docs/decisions/epistemic_graveyard.md",
-        ])
+        _make_engram_repo(tmp_path, git_skeleton, project_skeleton)
 
         db_path = tmp_path / ".engram" / "engram.db"
         db = ServerDB(db_path)
@@ -684,56 +748,68 @@ class TestFoldFromLifecycle:
 # ==================================================================
 
 
+# Hermetic git environment for fixture repos: fixed identity, no
+# global/system config (signing, default branch name, ...), and the
+# startup extras fixtures never need (hooks, auto-gc, gpg, prompts)
+# switched off through GIT_CONFIG_COUNT rather than per-command -c flags
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_CONFIG_COUNT": "3",
+    "GIT_CONFIG_KEY_0": "core.hooksPath",
+    "GIT_CONFIG_VALUE_0": os.devnull,
+    "GIT_CONFIG_KEY_1": "gc.auto",
+    "GIT_CONFIG_VALUE_1": "0",
+    "GIT_CONFIG_KEY_2": "commit.gpgsign",
+    "GIT_CONFIG_VALUE_2": "false",
+}
+
+
 def _init_git_repo(
     root: Path,
+    git_skeleton: Path,
     files: list[str] | None = None,
 ) -> str:
-    """Initialize a git repo, add files, make initial commit. Returns commit hash."""
-    import subprocess
-
-    subprocess.run(
-        ["git", "init"],
-        cwd=str(root), capture_output=True, check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=str(root), capture_output=True, check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=str(root), capture_output=True, check=True,
-    )
+    """Initialize a git repo, add files, make initial commit. Returns commit hash.
 
+    *git_skeleton* is the ``.git`` directory from the ``git_skeleton``
+    fixture; it is copied instead of running ``git init``.
+    """
     if files is None:
         # Create a default file
         (root / "hello.txt").write_text("hello")
         files = ["hello.txt"]
 
-    for f in files:
-        p = root / f
-        if p.exists():
-            subprocess.run(
-                ["git", "add", f],
-                cwd=str(root), capture_output=True, check=True,
-            )
-    subprocess.run(
-        ["git", "commit", "-m", "initial", "--allow-empty"],
-        cwd=str(root), capture_output=True, check=True,
-    )
+    git_dir = root / ".git"
+    shutil.copytree(git_skeleton, git_dir)
 
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=str(root), capture_output=True, text=True, check=True,
+    # One shell runs the add/commit chain
+    steps = []
+    existing = [f for f in files if (root / f).exists()]
+    if existing:
+        steps.append("git add -- " + " ".join(shlex.quote(f) for f in existing))
+    steps.append("git commit -q -m initial --allow-empty")
+    subprocess.run(
+        " && ".join(steps),
+        shell=True, cwd=str(root), env=_GIT_ENV, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
-    return result.stdout.strip()
 
+    # A fresh repo's first commit is a loose ref, so read it directly
+    # instead of spawning `git rev-parse HEAD`
+    head = (git_dir / "HEAD").read_text().strip()
+    return (git_dir / head.removeprefix("ref: ")).read_text().strip()
 
-def _setup_project(root: Path) -> None:
-    """Create a minimal engram project structure."""
-    engram_dir = root / ".engram"
-    engram_dir.mkdir(parents=True, exist_ok=True)
 
-    config_yaml = """\
+# Project config written by _setup_project, pre-encoded once
+_CONFIG_YAML = b"""\
 living_docs:
   timeline: docs/decisions/timeline.md
   concepts: docs/decisions/concept_registry.md
@@ -752,27 +828,52 @@ budget:
   instructions_overhead: 10000
   max_chunk_chars: 200000
 """
-    (engram_dir / "config.yaml").write_text(config_yaml)
 
-    docs_dir = root / "docs" / "decisions"
-    docs_dir.mkdir(parents=True, exist_ok=True)
-    (docs_dir / "timeline.md").write_text("# Timeline\n")
-    (docs_dir / "concept_registry.md").write_text("# Concept Registry\n")
-    (docs_dir / "epistemic_state.md").write_text("# Epistemic State\n")
-    (docs_dir / "workflow_registry.md").write_text("# Workflow Registry\n")
-    (docs_dir / "concept_graveyard.md").write_text("# Concept Graveyard\n")
-    (docs_dir / "epistemic_graveyard.md").write_text("# Epistemic Graveyard\n")
+# Living-doc stubs written by _setup_project, pre-encoded once, as
+# (doc_paths key, file name under docs/decisions, header)
+_DOC_STUBS = (
+    ("timeline", "timeline.md", b"# Timeline\n"),
+    ("concepts", "concept_registry.md", b"# Concept Registry\n"),
+    ("epistemic", "epistemic_state.md", b"# Epistemic State\n"),
+    ("workflows", "workflow_registry.md", b"# Workflow Registry\n"),
+    ("concept_graveyard", "concept_graveyard.md", b"# Concept Graveyard\n"),
+    ("epistemic_graveyard", "epistemic_graveyard.md", b"# Epistemic Graveyard\n"),
+)
+
+# Every file _setup_project creates, relative to the project root
+_PROJECT_FILES = (
+    ".engram/config.yaml",
+    *(f"docs/decisions/{name}" for _, name, _ in _DOC_STUBS),
+)
+
+
+def _setup_project(root: Path, project_skeleton: Path) -> None:
+    """Create a minimal engram project structure from *project_skeleton*."""
+    # Copies, not hardlinks: tests rewrite the stubs in place, which would
+    # write through a shared inode into the session skeleton
+    shutil.copytree(
+        project_skeleton, root, dirs_exist_ok=True, copy_function=shutil.copyfile,
+    )
+
+
+def _make_engram_repo(
+    root: Path,
+    git_skeleton: Path,
+    project_skeleton: Path,
+    extra_files: list[str] | None = None,
+) -> str:
+    """Lay down the project skeleton and commit it (plus *extra_files*).
+
+    Returns the commit hash.
+    """
+    _setup_project(root, project_skeleton)
+    return _init_git_repo(
+        root, git_skeleton, files=[*_PROJECT_FILES, *(extra_files or [])],
+    )
 
 
 def _fake_doc_paths(root: Path) -> dict[str, Path]:
     """Return a doc_paths dict pointing to tmp_path-based paths."""
     docs = root / "docs" / "decisions"
     docs.mkdir(parents=True, exist_ok=True)
-    return {
-        "timeline": docs / "timeline.md",
-        "concepts": docs / "concept_registry.md",
-        "epistemic": docs / "epistemic_state.md",
-        "workflows": docs / "workflow_registry.md",
-        "concept_graveyard": docs / "concept_graveyard.md",
-        "epistemic_graveyard": docs / "epistemic_graveyard.md",
-    }
+    return {key: docs / name for key, name, _ in _DOC_STUBS}